@@ -8,10 +8,64 @@ class Settings(BaseSettings):
     PORT: int = 8000
 
     DATABASE_URL: str
+    # Optional read replica for repository methods marked @read_only
+    DATABASE_REPLICA_URL: Optional[str] = None
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = False
+    DB_STATEMENT_CACHE_SIZE: int = 100
+    # Disable prepared statement caching for PgBouncer (transaction pooling)
+    DB_PGBOUNCER_MODE: bool = False
+    # Warn when one statement repeats more than this many times in a request
+    DB_QUERY_REPEAT_THRESHOLD: int = 10
+
     SECRET_KEY: str
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
+    # Embed business_id/role/level in access tokens so read-only routes
+    # can authorize without a database lookup
+    ACCESS_TOKEN_RICH_CLAIMS: bool = False
+
+    # Auth principal cache (0 disables it)
+    PRINCIPAL_CACHE_TTL_SECONDS: int = 60
+    PRINCIPAL_CACHE_MAX_SIZE: int = 10000
+
+    # Per-business transaction category cache (0 disables it); other workers
+    # are told about changes through LISTEN/NOTIFY
+    CATEGORY_CACHE_TTL_SECONDS: int = 600
+    CATEGORY_CACHE_MAX_SIZE: int = 10000
+
+    # Partition transactions by month of transaction_date (see
+    # app/db/partitions.py; existing tables must be converted first)
+    TRANSACTIONS_PARTITIONED: bool = False
+    TRANSACTIONS_PARTITIONS_AHEAD: int = 3
+
+    # Finance summary cache: entries live until the business's finance
+    # version changes or this many seconds pass (0 disables cache and ETags)
+    SUMMARY_CACHE_TTL_SECONDS: int = 60
+    SUMMARY_CACHE_MAX_SIZE: int = 10000
+
+    # Cash-flow forecasts: minutes between batch refreshes (0 disables the
+    # background refresh; forecasts are then computed on first request)
+    FORECAST_REFRESH_INTERVAL_MINUTES: int = 60
+
+    # Recurring transactions: minutes between runs that materialize due
+    # occurrences (0 disables; run `python -m app.db.materialize_recurring`)
+    RECURRING_RUN_INTERVAL_MINUTES: int = 60
+
+    # Outbox dispatcher: events are delivered right after the NOTIFY sent on
+    # commit, or at the latest every poll interval
+    OUTBOX_POLL_INTERVAL_SECONDS: float = 5
+    OUTBOX_BATCH_SIZE: int = 100
+    OUTBOX_MAX_ATTEMPTS: int = 10
+    OUTBOX_RETENTION_DAYS: int = 7
+
+    # Password hashing pool (bcrypt runs off the event loop)
+    PASSWORD_HASH_WORKERS: int = 2
+    PASSWORD_HASH_MAX_QUEUE: int = 32
 
     # AI Providers
     LLM_API_KEY: Optional[str] = None
@@ -20,6 +74,8 @@ class Settings(BaseSettings):
 
     # Logging
     LOG_LEVEL: str = "INFO"
+    # Calendar used for daily finance rollups and time buckets
+    TIMEZONE: str = "Asia/Jakarta"
     ENV: str = "development"
 
     # CORS
@@ -1,5 +1,7 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from typing import Any, Callable, Optional, TypeVar
 from jose import jwt
 from passlib.context import CryptContext
 from app.core.config import settings
@@ -15,6 +17,70 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
+T = TypeVar("T")
+
+
+class PasswordHasherBusyError(RuntimeError):
+    """Raised when the hashing pool and its queue are both full."""
+
+
+class PasswordHasher:
+    """
+    Runs bcrypt off the event loop on a dedicated, size-capped thread pool.
+
+    bcrypt releases the GIL while hashing, so threads give real parallelism
+    here. At most `workers + max_queue` jobs may be in flight; beyond that
+    callers get `PasswordHasherBusyError` immediately instead of piling up.
+    """
+
+    def __init__(self, workers: int, max_queue: int):
+        self.workers = workers
+        self.max_queue = max_queue
+        self.in_flight = 0
+        self.completed = 0
+        self.rejected = 0
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="password-hash"
+        )
+
+    async def _run(self, fn: Callable[..., T], *args: Any) -> T:
+        if self.in_flight >= self.workers + self.max_queue:
+            self.rejected += 1
+            raise PasswordHasherBusyError("Password hashing capacity exhausted")
+
+        self.in_flight += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, fn, *args)
+        finally:
+            self.in_flight -= 1
+            self.completed += 1
+
+    async def hash(self, password: str) -> str:
+        return await self._run(get_password_hash, password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return await self._run(verify_password, plain_password, hashed_password)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "workers": self.workers,
+            "max_queue": self.max_queue,
+            "in_flight": self.in_flight,
+            "completed": self.completed,
+            "rejected": self.rejected,
+        }
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+password_hasher = PasswordHasher(
+    workers=settings.PASSWORD_HASH_WORKERS,
+    max_queue=settings.PASSWORD_HASH_MAX_QUEUE,
+)
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     to_encode = data.copy()
     if expires_delta:
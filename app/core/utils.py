@@ -1,3 +1,5 @@
+import base64
+import binascii
 import json
 from typing import Any
 
@@ -20,3 +22,27 @@ def format_sse(event_type: str, message: str | None = None, data: dict | Any | N
         payload["data"] = data
         
     return f"data: {json.dumps(payload)}\n\n"
+
+
+def encode_cursor(*values: Any) -> str:
+    """
+    Encodes the sort key of the last returned row into an opaque,
+    URL-safe pagination cursor.
+    """
+    raw = json.dumps([str(v) for v in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> list[str]:
+    """
+    Decodes a cursor produced by `encode_cursor`. Raises ValueError if it is
+    malformed.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (binascii.Error, UnicodeDecodeError, json.JSONDecodeError) as e:
+        raise ValueError("Invalid cursor") from e
+    if not isinstance(values, list) or not all(isinstance(v, str) for v in values):
+        raise ValueError("Invalid cursor")
+    return values
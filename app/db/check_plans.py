@@ -0,0 +1,370 @@
+"""
+Query plan regression check.
+
+Seeds a scratch schema with realistic volumes, runs the hot repository
+queries against it and asserts that EXPLAIN uses index scans (and the
+composite/partial index meant for each query) instead of sequential scans.
+Exits non-zero on any regression, so it can run in CI against a throwaway
+Postgres.
+
+Usage (DATABASE_URL must point at a database you may create schemas in):
+    python -m app.db.check_plans
+    python -m app.db.check_plans --businesses 20000 --keep
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Awaitable, Callable
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+from sqlalchemy.pool import NullPool
+from sqlmodel import SQLModel
+import app.main  # noqa: F401  (registers every model on the metadata)
+from app.core.config import settings
+from app.core.logging import logger
+from app.db.partitions import (
+    DEFAULT_PARTITION,
+    PARENT,
+    PARTITION_NAME,
+    ensure_partitions,
+)
+from app.modules.business.repository import BusinessRepository
+from app.modules.chat.repository import ChatRepository
+from app.modules.finance.repository import FinanceRepository
+from app.modules.milestone.repository import MilestoneRepository
+
+SCHEMA = "plan_check"
+HISTORY_DAYS = 730
+
+SEED_SQL = [
+    """
+    INSERT INTO users (id, email, name, role, hashed_password, created_at, updated_at)
+    SELECT gen_random_uuid(), 'plan-' || g || '@example.com', 'User ' || g,
+           'user', 'x', now(), now()
+    FROM generate_series(1, {businesses}) g
+    """,
+    """
+    INSERT INTO business_profiles (
+        id, user_id, business_name, business_category, business_description,
+        total_points, created_at, updated_at, deleted_at
+    )
+    SELECT gen_random_uuid(), u.id, 'Business ' || u.email, 'Kuliner', 'Seeded',
+           (random() * 5000)::int, now(), now(),
+           CASE WHEN random() < 0.05 THEN now() END
+    FROM users u
+    """,
+    """
+    INSERT INTO transaction_categories (id, business_id, name, type, created_at)
+    VALUES (gen_random_uuid(), NULL, 'Penjualan', 'INCOME', now())
+    """,
+    """
+    INSERT INTO transactions (
+        id, business_id, category_id, category_name, type, amount,
+        payment_method, transaction_date, created_at
+    )
+    SELECT gen_random_uuid(), b.id, c.id, 'Penjualan',
+           CASE WHEN random() < 0.6 THEN 'INCOME' ELSE 'EXPENSE' END,
+           (random() * 1000000)::numeric(12, 2),
+           (ARRAY['CASH', 'TRANSFER', 'QRIS'])[1 + g % 3],
+           now() - random() * interval '{history_days} days', now()
+    FROM business_profiles b
+    CROSS JOIN generate_series(1, {transactions}) g
+    CROSS JOIN (SELECT id FROM transaction_categories LIMIT 1) c
+    """,
+    """
+    INSERT INTO milestones (
+        id, business_id, title, description, status, "order", is_generated,
+        level, reward_points, created_at, updated_at, deleted_at
+    )
+    SELECT gen_random_uuid(), b.id, 'Milestone ' || g, 'Seeded',
+           (ARRAY['pending', 'in_progress', 'completed'])[1 + g % 3], g, true,
+           1, 10, now(), now(),
+           CASE WHEN random() < 0.1 THEN now() END
+    FROM business_profiles b
+    CROSS JOIN generate_series(1, {milestones}) g
+    """,
+    """
+    INSERT INTO chat_sessions (id, business_id, title, created_at, deleted_at)
+    SELECT gen_random_uuid(), b.id, 'Chat ' || g,
+           now() - random() * interval '365 days',
+           CASE WHEN random() < 0.1 THEN now() END
+    FROM business_profiles b
+    CROSS JOIN generate_series(1, {sessions}) g
+    """,
+    """
+    INSERT INTO chat_messages (id, session_id, role, content, created_at)
+    SELECT gen_random_uuid(), s.id,
+           CASE WHEN g % 2 = 0 THEN 'assistant' ELSE 'user' END,
+           'Message ' || g, s.created_at + g * interval '1 minute'
+    FROM chat_sessions s
+    CROSS JOIN generate_series(1, {messages}) g
+    """,
+]
+
+
+@dataclass
+class Check:
+    label: str
+    table: str
+    indexes: tuple[str, ...]
+    run: Callable[[AsyncSession, dict[str, Any]], Awaitable[Any]]
+
+
+@dataclass
+class PlanSummary:
+    seq_scans: set[str] = field(default_factory=set)
+    index_scans: set[str] = field(default_factory=set)
+    index_names: set[str] = field(default_factory=set)
+
+
+CHECKS = [
+    Check(
+        "FinanceRepository.get_by_business_id",
+        "transactions",
+        ("ix_transactions_business_id_transaction_date",),
+        lambda s, p: FinanceRepository(s).get_by_business_id(
+            p["business_id"], skip=0, limit=20
+        ),
+    ),
+    Check(
+        "FinanceRepository.get_page_after",
+        "transactions",
+        ("ix_transactions_business_id_transaction_date",),
+        lambda s, p: FinanceRepository(s).get_page_after(
+            p["business_id"], after=(p["month_ago"], p["session_id"]), limit=21
+        ),
+    ),
+    Check(
+        "FinanceRepository.get_summary_stats",
+        "transactions",
+        (
+            "ix_transactions_business_id_transaction_date",
+            "ix_transactions_business_id",
+        ),
+        lambda s, p: FinanceRepository(s).get_summary_stats(
+            p["business_id"], p["month_ago"], p["now"]
+        ),
+    ),
+    Check(
+        "MilestoneRepository.get_by_business_id",
+        "milestones",
+        ("ix_milestones_business_id_status_order_live",),
+        lambda s, p: MilestoneRepository(s).get_by_business_id(
+            p["business_id"], status=["pending", "in_progress"]
+        ),
+    ),
+    Check(
+        "ChatRepository.get_sessions_by_business",
+        "chat_sessions",
+        ("ix_chat_sessions_business_id_created_at_live",),
+        lambda s, p: ChatRepository(s).get_sessions_by_business(p["business_id"]),
+    ),
+    Check(
+        "ChatRepository.get_history",
+        "chat_messages",
+        ("ix_chat_messages_session_id_created_at",),
+        lambda s, p: ChatRepository(s).get_history(p["session_id"], limit=50),
+    ),
+    Check(
+        "BusinessRepository.get_top_businesses",
+        "business_profiles",
+        ("ix_business_profiles_total_points_live",),
+        lambda s, p: BusinessRepository(s).get_top_businesses(10),
+    ),
+    Check(
+        "BusinessRepository.calculate_rank",
+        "business_profiles",
+        ("ix_business_profiles_total_points_live",),
+        lambda s, p: BusinessRepository(s).calculate_rank(p["top_points"]),
+    ),
+]
+
+
+def base_table(name: str | None) -> str | None:
+    """Maps a transactions partition to its parent table."""
+    if name and (PARTITION_NAME.match(name) or name == DEFAULT_PARTITION):
+        return PARENT
+    return name
+
+
+def summarize(node: dict, table: str, summary: PlanSummary) -> None:
+    if "Index Name" in node:
+        summary.index_names.add(node["Index Name"])
+    relation = node.get("Relation Name")
+    if base_table(relation) == table:
+        kind = node["Node Type"]
+        if kind == "Seq Scan":
+            summary.seq_scans.add(relation)
+        elif "Index" in kind or kind == "Bitmap Heap Scan":
+            summary.index_scans.add(kind)
+    for child in node.get("Plans", []):
+        summarize(child, table, summary)
+
+
+async def seed(engine: AsyncEngine, args: argparse.Namespace) -> None:
+    async with engine.begin() as conn:
+        await conn.exec_driver_sql(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE")
+        await conn.exec_driver_sql(f"CREATE SCHEMA {SCHEMA}")
+        await conn.run_sync(SQLModel.metadata.create_all)
+        if settings.TRANSACTIONS_PARTITIONED:
+            # A partitioned parent rejects rows until partitions exist
+            since = datetime.now(timezone.utc) - timedelta(days=HISTORY_DAYS)
+            created = await ensure_partitions(conn, since=since.date())
+            logger.info("Partitions created", count=len(created))
+        for sql in SEED_SQL:
+            await conn.exec_driver_sql(
+                sql.format(history_days=HISTORY_DAYS, **vars(args))
+            )
+
+    async with engine.connect() as conn:
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        for table in SQLModel.metadata.sorted_tables:
+            await conn.exec_driver_sql(f'VACUUM ANALYZE "{table.name}"')
+
+
+async def probe_params(session: AsyncSession) -> dict[str, Any]:
+    business_id, session_id = (
+        await session.execute(
+            text(
+                "SELECT b.id, s.id FROM business_profiles b "
+                "JOIN chat_sessions s ON s.business_id = b.id "
+                "WHERE b.deleted_at IS NULL AND s.deleted_at IS NULL LIMIT 1"
+            )
+        )
+    ).one()
+    top_points = (
+        await session.execute(
+            text(
+                "SELECT total_points FROM business_profiles "
+                "WHERE deleted_at IS NULL ORDER BY total_points DESC OFFSET 10 LIMIT 1"
+            )
+        )
+    ).scalar_one()
+    now = datetime.now(timezone.utc)
+    return {
+        "business_id": business_id,
+        "session_id": session_id,
+        "top_points": top_points,
+        "now": now,
+        "month_ago": now - timedelta(days=30),
+    }
+
+
+async def explain(session: AsyncSession, check: Check, params: dict) -> PlanSummary:
+    captured: list[tuple[str, Any]] = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            captured.append((statement, parameters))
+
+    sync_engine = session.bind.sync_engine  # type: ignore[union-attr]
+    event.listen(sync_engine, "before_cursor_execute", capture)
+    try:
+        await check.run(session, params)
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", capture)
+
+    summary = PlanSummary()
+    conn = await session.connection()
+    for statement, parameters in captured:
+        result = await conn.exec_driver_sql(
+            f"EXPLAIN (FORMAT JSON) {statement}", tuple(parameters or ())
+        )
+        plan = result.scalar_one()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        summarize(plan[0]["Plan"], check.table, summary)
+    if summary.seq_scans:
+        summary.seq_scans = await non_empty(session, summary.seq_scans)
+    if summary.index_names:
+        summary.index_names = await parent_indexes(session, summary.index_names)
+    return summary
+
+
+async def non_empty(session: AsyncSession, tables: set[str]) -> set[str]:
+    """
+    Drops tables ANALYZE found empty (the default and future partitions),
+    where a sequential scan is the right plan.
+    """
+    result = await session.execute(
+        text(
+            "SELECT relname FROM pg_class "
+            "WHERE relnamespace = to_regnamespace(:schema) "
+            "AND relname = ANY(:names) AND reltuples > 0"
+        ),
+        {"schema": SCHEMA, "names": list(tables)},
+    )
+    return set(result.scalars().all())
+
+
+async def parent_indexes(session: AsyncSession, names: set[str]) -> set[str]:
+    """
+    Replaces indexes of partitions with the partitioned index they were
+    created from, so checks name indexes as declared on the models.
+    """
+    result = await session.execute(
+        text(
+            "SELECT coalesce(p.relname, c.relname) FROM pg_class c "
+            "LEFT JOIN pg_inherits i ON i.inhrelid = c.oid "
+            "LEFT JOIN pg_class p ON p.oid = i.inhparent "
+            "WHERE c.relnamespace = to_regnamespace(:schema) "
+            "AND c.relname = ANY(:names)"
+        ),
+        {"schema": SCHEMA, "names": list(names)},
+    )
+    return set(result.scalars().all())
+
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--businesses", type=int, default=5000)
+    parser.add_argument("--transactions", type=int, default=100, help="per business")
+    parser.add_argument("--milestones", type=int, default=10, help="per business")
+    parser.add_argument("--sessions", type=int, default=5, help="per business")
+    parser.add_argument("--messages", type=int, default=20, help="per session")
+    parser.add_argument("--keep", action="store_true", help="keep the seeded schema")
+    args = parser.parse_args()
+
+    engine = create_async_engine(
+        settings.DATABASE_URL,
+        poolclass=NullPool,
+        connect_args={"server_settings": {"search_path": SCHEMA}},
+    )
+
+    failures = 0
+    try:
+        logger.info("Seeding plan check schema", schema=SCHEMA)
+        await seed(engine, args)
+
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            params = await probe_params(session)
+            for check in CHECKS:
+                summary = await explain(session, check, params)
+                used = summary.index_names & set(check.indexes)
+                ok = bool(summary.index_scans) and not summary.seq_scans and used
+                failures += not ok
+                detail = ", ".join(sorted(summary.index_names)) or "no index"
+                log = logger.info if ok else logger.error
+                log(
+                    "Plan check passed" if ok else "Plan check failed",
+                    query=check.label,
+                    indexes=detail,
+                )
+    finally:
+        if not args.keep:
+            async with engine.begin() as conn:
+                await conn.exec_driver_sql(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE")
+        await engine.dispose()
+
+    logger.info(
+        "Plan check finished", passed=len(CHECKS) - failures, total=len(CHECKS)
+    )
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -1,8 +1,9 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
 from app.modules.auth.models import User
-from app.core.security import get_password_hash
+from app.core.security import password_hasher
 from app.core.logging import logger
+from app.modules.finance.repository import FinanceRepository
 
 
 async def init_admin_user(session: AsyncSession):
@@ -19,7 +20,7 @@ async def init_admin_user(session: AsyncSession):
             admin_user = User(
                 email="admin@telaten.com",
                 name="Super Admin",
-                hashed_password=get_password_hash("admin123"),
+                hashed_password=await password_hasher.hash("admin123"),
                 role="admin",
             )
             session.add(admin_user)
@@ -29,3 +30,12 @@ async def init_admin_user(session: AsyncSession):
             logger.info("Admin user already exists.")
     except Exception as e:
         logger.error(f"Error creating admin user: {e}")
+
+
+async def init_system_categories(session: AsyncSession):
+    """
+    Create the shared default transaction categories if they are missing.
+    """
+    added = await FinanceRepository(session).ensure_system_categories()
+    if added:
+        logger.info(f"Created {added} system transaction categories")
@@ -0,0 +1,135 @@
+import time
+from collections import Counter
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.core.logging import logger
+
+
+@dataclass
+class QueryStats:
+    count: int = 0
+    duration: float = 0.0
+    statements: Counter[str] = field(default_factory=Counter)
+
+
+@dataclass
+class RouteQueryTotals:
+    requests: int = 0
+    queries: int = 0
+    duration: float = 0.0
+    max_queries: int = 0
+
+
+_current: ContextVar[QueryStats | None] = ContextVar("db_query_stats", default=None)
+
+
+class RouteQueryStats:
+    """
+    Per-route query totals for this worker, reported by the admin metrics
+    endpoint.
+    """
+
+    def __init__(self):
+        self._routes: dict[str, RouteQueryTotals] = {}
+
+    def record(self, route: str, stats: QueryStats) -> None:
+        totals = self._routes.setdefault(route, RouteQueryTotals())
+        totals.requests += 1
+        totals.queries += stats.count
+        totals.duration += stats.duration
+        totals.max_queries = max(totals.max_queries, stats.count)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            route: {
+                "requests": t.requests,
+                "avg_queries": round(t.queries / t.requests, 2),
+                "max_queries": t.max_queries,
+                "avg_db_ms": round(t.duration / t.requests * 1000, 3),
+            }
+            for route, t in sorted(self._routes.items())
+        }
+
+
+route_query_stats = RouteQueryStats()
+
+
+def _before_execute(conn, cursor, statement, parameters, context, executemany):
+    if _current.get() is not None:
+        conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+
+def _after_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _current.get()
+    starts = conn.info.get("query_start")
+    if stats is None or not starts:
+        return
+    stats.count += 1
+    stats.duration += time.perf_counter() - starts.pop()
+    stats.statements[statement] += 1
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    """
+    Counts queries and database time into the current request's stats.
+    """
+    event.listen(engine.sync_engine, "before_cursor_execute", _before_execute)
+    event.listen(engine.sync_engine, "after_cursor_execute", _after_execute)
+
+
+class QueryStatsMiddleware:
+    """
+    Collects SQL statistics per request. Optionally reports them in
+    ``X-DB-Queries`` / ``Server-Timing`` headers and warns when one statement
+    shape runs more than ``repeat_threshold`` times (a likely N+1).
+    """
+
+    def __init__(self, app: ASGIApp, expose_headers: bool, repeat_threshold: int):
+        self.app = app
+        self.expose_headers = expose_headers
+        self.repeat_threshold = repeat_threshold
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = QueryStats()
+        token = _current.set(stats)
+
+        async def send_with_stats(message: Message) -> None:
+            if message["type"] == "http.response.start" and self.expose_headers:
+                headers = MutableHeaders(scope=message)
+                headers.append("X-DB-Queries", str(stats.count))
+                headers.append(
+                    "Server-Timing",
+                    f'db;dur={stats.duration * 1000:.1f};desc="{stats.count} queries"',
+                )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_stats)
+        finally:
+            _current.reset(token)
+            self._report(scope, stats)
+
+    def _report(self, scope: Scope, stats: QueryStats) -> None:
+        route = getattr(scope.get("route"), "path", None)
+        if route is None:
+            return
+        route = f"{scope['method']} {route}"
+        route_query_stats.record(route, stats)
+
+        for statement, count in stats.statements.items():
+            if count > self.repeat_threshold:
+                logger.warning(
+                    "Repeated query in one request (possible N+1)",
+                    route=route,
+                    count=count,
+                    statement=" ".join(statement.split())[:200],
+                )
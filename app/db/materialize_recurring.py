@@ -0,0 +1,19 @@
+"""
+Creates all due occurrences of recurring transactions now, instead of
+waiting for the background run:
+    python -m app.db.materialize_recurring
+"""
+
+import asyncio
+from app.modules.finance.recurring import materialize_due
+from app.core.logging import logger
+
+
+async def main():
+    logger.info("Materializing recurring transactions...")
+    created = await materialize_due()
+    logger.info("Recurring transactions materialized", transactions=created)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,90 @@
+import asyncio
+from typing import Callable, Optional
+import asyncpg
+from sqlalchemy import func, select
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.config import settings
+from app.core.logging import logger
+
+RECONNECT_DELAY_SECONDS = 5
+
+
+async def notify(session: AsyncSession, channel: str, payload: str = "") -> None:
+    """
+    Queues a NOTIFY on the session's transaction. PostgreSQL delivers it to
+    listeners only when the transaction commits, and drops it on rollback.
+    """
+    await session.execute(select(func.pg_notify(channel, payload)))
+
+
+class NotificationListener:
+    """
+    Keeps one dedicated connection (outside the pool) LISTENing on the
+    subscribed channels and calls their handlers with each payload.
+
+    Notifications sent while the connection is down are lost, so every
+    `on_reconnect` callback runs after each (re)connect, e.g. to drop a cache
+    that may have missed invalidations.
+    """
+
+    def __init__(self, dsn: str):
+        self.dsn = dsn
+        self._handlers: dict[str, Callable[[str], None]] = {}
+        self._on_reconnect: list[Callable[[], None]] = []
+        self._task: Optional[asyncio.Task] = None
+
+    def subscribe(
+        self,
+        channel: str,
+        handler: Callable[[str], None],
+        on_reconnect: Optional[Callable[[], None]] = None,
+    ) -> None:
+        self._handlers[channel] = handler
+        if on_reconnect:
+            self._on_reconnect.append(on_reconnect)
+
+    def start(self) -> None:
+        if self._handlers and self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            connection = None
+            try:
+                connection = await asyncpg.connect(self.dsn)
+                closed = asyncio.Event()
+                connection.add_termination_listener(lambda _: closed.set())
+                for channel, handler in self._handlers.items():
+                    await connection.add_listener(
+                        channel, lambda _c, _pid, _ch, payload, h=handler: h(payload)
+                    )
+                for callback in self._on_reconnect:
+                    callback()
+                logger.info(
+                    "Listening for notifications", channels=list(self._handlers)
+                )
+                await closed.wait()
+                logger.warning("Notification connection closed")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("Notification listener failed", error=str(e))
+            finally:
+                if connection is not None and not connection.is_closed():
+                    await connection.close()
+            await asyncio.sleep(RECONNECT_DELAY_SECONDS)
+
+
+def _listener_dsn() -> str:
+    url = make_url(settings.DATABASE_URL).set(drivername="postgresql")
+    return url.render_as_string(hide_password=False)
+
+
+notification_listener = NotificationListener(_listener_dsn())
@@ -0,0 +1,250 @@
+"""
+Transactional outbox.
+
+Services call `publish` inside their unit of work, so an event is stored if
+and only if the domain change commits. `OutboxDispatcher` then delivers
+pending events to their handlers in the background, in batches, retrying
+failures with exponential backoff.
+"""
+
+import asyncio
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from typing import Any, Awaitable, Callable, Optional, Sequence
+from sqlalchemy import JSON, BigInteger, Column, DateTime, Index, delete, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import Field, SQLModel, select
+from app.core.config import settings
+from app.core.logging import logger
+from app.db.notifications import notify
+from app.db.session import unit_of_work
+
+# NOTIFY channel that wakes dispatchers as soon as an event commits
+OUTBOX_CHANNEL = "outbox_events"
+MAX_BACKOFF_SECONDS = 600
+PURGE_INTERVAL_SECONDS = 3600
+
+# Receives the session of the dispatching transaction and the payloads of
+# one batch of events of a single type
+Handler = Callable[[AsyncSession, list[dict[str, Any]]], Awaitable[None]]
+
+
+class OutboxEvent(SQLModel, table=True):
+    __tablename__ = "outbox_events"  # type: ignore
+
+    id: Optional[int] = Field(
+        default=None, sa_column=Column(BigInteger, primary_key=True)
+    )
+    event_type: str
+    payload: dict = Field(default_factory=dict, sa_column=Column(JSON))
+    created_at: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc),
+        sa_column=Column(DateTime(timezone=True), nullable=False),
+    )
+    available_at: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc),
+        sa_column=Column(DateTime(timezone=True), nullable=False),
+    )
+    attempts: int = 0
+    last_error: Optional[str] = None
+    processed_at: Optional[datetime] = Field(
+        default=None, sa_column=Column(DateTime(timezone=True))
+    )
+    # Set once `OUTBOX_MAX_ATTEMPTS` deliveries failed; the event is kept
+    # for inspection and no longer retried
+    failed_at: Optional[datetime] = Field(
+        default=None, sa_column=Column(DateTime(timezone=True))
+    )
+
+
+# Pending events in delivery order
+Index(
+    "ix_outbox_events_pending",
+    OutboxEvent.available_at,
+    OutboxEvent.id,
+    postgresql_where=OutboxEvent.processed_at.is_(None)  # type: ignore
+    & OutboxEvent.failed_at.is_(None),  # type: ignore
+)
+
+
+async def publish(
+    session: AsyncSession, event_type: str, payload: dict[str, Any]
+) -> None:
+    """Records an event in the caller's transaction (JSON-safe payload)."""
+    await publish_many(session, event_type, [payload])
+
+
+async def publish_many(
+    session: AsyncSession, event_type: str, payloads: Sequence[dict[str, Any]]
+) -> None:
+    """Records one event per payload with a single NOTIFY."""
+    if not payloads:
+        return
+    session.add_all(
+        [OutboxEvent(event_type=event_type, payload=payload) for payload in payloads]
+    )
+    await notify(session, OUTBOX_CHANNEL)
+
+
+class OutboxDispatcher:
+    """
+    Delivers pending outbox events to the handlers subscribed to their type.
+
+    Each batch is claimed with `FOR UPDATE SKIP LOCKED`, so several workers
+    can dispatch concurrently without delivering an event twice. Handlers run
+    in the same transaction that marks the events processed, which makes
+    their database effects exactly-once. All events of one type in a batch
+    go to a handler together; if that fails, they are retried one by one so
+    a single bad event cannot hold back the others.
+    """
+
+    def __init__(
+        self,
+        batch_size: int = settings.OUTBOX_BATCH_SIZE,
+        poll_interval: float = settings.OUTBOX_POLL_INTERVAL_SECONDS,
+        max_attempts: int = settings.OUTBOX_MAX_ATTEMPTS,
+    ):
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.max_attempts = max_attempts
+        self._handlers: dict[str, list[Handler]] = defaultdict(list)
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._last_purge = 0.0
+
+    def subscribe(self, event_type: str, handler: Handler) -> None:
+        self._handlers[event_type].append(handler)
+
+    def wake(self, _payload: str = "") -> None:
+        """NOTIFY handler: dispatch now instead of at the next poll."""
+        self._wakeup.set()
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def dispatch_batch(self) -> int:
+        """Claims and delivers up to `batch_size` due events."""
+        async with unit_of_work() as session:
+            result = await session.execute(
+                select(OutboxEvent.id, OutboxEvent.event_type, OutboxEvent.payload)
+                .where(
+                    OutboxEvent.processed_at.is_(None),  # type: ignore
+                    OutboxEvent.failed_at.is_(None),  # type: ignore
+                    OutboxEvent.available_at <= datetime.now(timezone.utc),
+                )
+                .order_by(OutboxEvent.available_at, OutboxEvent.id)  # type: ignore
+                .limit(self.batch_size)
+                .with_for_update(skip_locked=True)
+            )
+            events = result.all()
+
+            by_type: dict[str, list[tuple[int, dict]]] = defaultdict(list)
+            for id_, event_type, payload in events:
+                by_type[event_type].append((id_, payload))
+
+            for event_type, group in by_type.items():
+                error = await self._deliver(session, event_type, group)
+                if error is None:
+                    continue
+                if len(group) == 1:
+                    await self._record_failure(session, group[0][0], error)
+                    continue
+                for event in group:
+                    error = await self._deliver(session, event_type, [event])
+                    if error is not None:
+                        await self._record_failure(session, event[0], error)
+        return len(events)
+
+    async def _deliver(
+        self,
+        session: AsyncSession,
+        event_type: str,
+        events: Sequence[tuple[int, dict]],
+    ) -> Optional[Exception]:
+        """
+        Runs the handlers in a savepoint and marks the events processed;
+        rolls back and returns the exception if a handler raised.
+        """
+        try:
+            async with session.begin_nested():
+                payloads = [payload for _, payload in events]
+                for handler in self._handlers.get(event_type, []):
+                    await handler(session, payloads)
+                await session.execute(
+                    update(OutboxEvent)
+                    .where(OutboxEvent.id.in_([id_ for id_, _ in events]))  # type: ignore
+                    .values(processed_at=datetime.now(timezone.utc))
+                )
+        except Exception as e:
+            return e
+        return None
+
+    async def _record_failure(
+        self, session: AsyncSession, event_id: int, error: Exception
+    ) -> None:
+        event = await session.get(OutboxEvent, event_id)
+        if event is None:
+            return
+        now = datetime.now(timezone.utc)
+        event.attempts += 1
+        event.last_error = f"{type(error).__name__}: {error}"[:1000]
+        if event.attempts >= self.max_attempts:
+            event.failed_at = now
+            logger.error(
+                "Outbox event abandoned",
+                event_id=event_id,
+                event_type=event.event_type,
+                error=event.last_error,
+            )
+        else:
+            delay = min(2**event.attempts, MAX_BACKOFF_SECONDS)
+            event.available_at = now + timedelta(seconds=delay)
+            logger.warning(
+                "Outbox event failed, will retry",
+                event_id=event_id,
+                event_type=event.event_type,
+                attempts=event.attempts,
+                error=event.last_error,
+            )
+        await session.flush()
+
+    async def purge_processed(self, older_than_days: int) -> int:
+        """Deletes events processed more than `older_than_days` ago."""
+        cutoff = datetime.now(timezone.utc) - timedelta(days=older_than_days)
+        async with unit_of_work() as session:
+            result = await session.execute(
+                delete(OutboxEvent).where(
+                    OutboxEvent.processed_at < cutoff  # type: ignore
+                )
+            )
+        return result.rowcount  # type: ignore
+
+    async def _run(self) -> None:
+        while True:
+            self._wakeup.clear()
+            try:
+                # Keep going while batches come back full
+                while await self.dispatch_batch() >= self.batch_size:
+                    pass
+                if time.monotonic() - self._last_purge > PURGE_INTERVAL_SECONDS:
+                    self._last_purge = time.monotonic()
+                    await self.purge_processed(settings.OUTBOX_RETENTION_DAYS)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error("Outbox dispatch failed", error=str(e))
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+
+
+outbox_dispatcher = OutboxDispatcher()
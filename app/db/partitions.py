@@ -0,0 +1,255 @@
+"""
+Monthly range partitions of `transactions` on `transaction_date`.
+
+Partitions cover local calendar months (`settings.TIMEZONE`) and are named
+`transactions_pYYYYMM`; rows outside every partition land in
+`transactions_default`. Enable with TRANSACTIONS_PARTITIONED=true, then:
+
+    python -m app.db.partitions convert                 # once, existing databases
+    python -m app.db.partitions ensure [--ahead 3]      # pre-create future months
+    python -m app.db.partitions brin [--older-than 3]   # BRIN on cold partitions
+    python -m app.db.partitions archive --older-than 24 [--drop]
+"""
+
+import argparse
+import asyncio
+import re
+from datetime import date, datetime, time
+from typing import Optional
+from zoneinfo import ZoneInfo
+from dateutil.relativedelta import relativedelta
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+from app.core.config import settings
+from app.core.logging import logger
+from app.modules.finance.models import Transaction
+
+PARENT = "transactions"
+DEFAULT_PARTITION = "transactions_default"
+ARCHIVE_SCHEMA = "archive"
+PARTITION_NAME = re.compile(r"^transactions_p(\d{4})(\d{2})$")
+
+
+def partition_name(month: date) -> str:
+    return f"{PARENT}_p{month:%Y%m}"
+
+
+def current_month() -> date:
+    return datetime.now(ZoneInfo(settings.TIMEZONE)).date().replace(day=1)
+
+
+def _bound(month: date) -> str:
+    """Local midnight of the 1st as a timestamptz literal."""
+    start = datetime.combine(month, time.min, tzinfo=ZoneInfo(settings.TIMEZONE))
+    return f"'{start.isoformat()}'"
+
+
+async def is_partitioned(conn: AsyncConnection) -> bool:
+    result = await conn.execute(
+        text(
+            "SELECT EXISTS (SELECT 1 FROM pg_partitioned_table "
+            "WHERE partrelid = to_regclass(:parent))"
+        ),
+        {"parent": PARENT},
+    )
+    return bool(result.scalar())
+
+
+async def list_partitions(conn: AsyncConnection) -> dict[date, str]:
+    """Attached monthly partitions by month."""
+    result = await conn.execute(
+        text(
+            "SELECT c.relname FROM pg_inherits i "
+            "JOIN pg_class c ON c.oid = i.inhrelid "
+            "WHERE i.inhparent = to_regclass(:parent)"
+        ),
+        {"parent": PARENT},
+    )
+    partitions = {}
+    for (name,) in result.all():
+        match = PARTITION_NAME.match(name)
+        if match:
+            partitions[date(int(match[1]), int(match[2]), 1)] = name
+    return partitions
+
+
+async def create_partition(conn: AsyncConnection, month: date) -> str:
+    """
+    Creates the partition of `month`, moving any of its rows out of the
+    default partition first (a partition cannot be attached while the
+    default one holds rows in its range).
+    """
+    name = partition_name(month)
+    lower, upper = _bound(month), _bound(month + relativedelta(months=1))
+    await conn.execute(text(f"CREATE TABLE {name} (LIKE {PARENT} INCLUDING DEFAULTS)"))
+    await conn.execute(
+        text(
+            f"WITH moved AS (DELETE FROM {DEFAULT_PARTITION} "
+            f"WHERE transaction_date >= {lower} AND transaction_date < {upper} "
+            f"RETURNING *) INSERT INTO {name} SELECT * FROM moved"
+        )
+    )
+    await conn.execute(
+        text(
+            f"ALTER TABLE {PARENT} ATTACH PARTITION {name} "
+            f"FOR VALUES FROM ({lower}) TO ({upper})"
+        )
+    )
+    return name
+
+
+async def ensure_partitions(
+    conn: AsyncConnection,
+    ahead: int = settings.TRANSACTIONS_PARTITIONS_AHEAD,
+    since: Optional[date] = None,
+) -> list[str]:
+    """
+    Creates the default partition and any missing monthly partition from
+    `since` (default: this month) through `ahead` months from now.
+    """
+    await conn.execute(
+        text(
+            f"CREATE TABLE IF NOT EXISTS {DEFAULT_PARTITION} "
+            f"PARTITION OF {PARENT} DEFAULT"
+        )
+    )
+    existing = await list_partitions(conn)
+    month = (since or current_month()).replace(day=1)
+    last = current_month() + relativedelta(months=ahead)
+
+    created = []
+    while month <= last:
+        if month not in existing:
+            created.append(await create_partition(conn, month))
+        month += relativedelta(months=1)
+    return created
+
+
+async def add_brin_indexes(conn: AsyncConnection, older_than: int = 3) -> list[str]:
+    """
+    Adds a BRIN index on transaction_date to partitions that ended at least
+    `older_than` months ago. Cold partitions are append-complete and stored
+    in date order, so BRIN serves range scans at a fraction of a B-tree's
+    size.
+    """
+    cutoff = current_month() - relativedelta(months=older_than)
+    created = []
+    for month, name in sorted((await list_partitions(conn)).items()):
+        if month + relativedelta(months=1) <= cutoff:
+            await conn.execute(
+                text(
+                    f"CREATE INDEX IF NOT EXISTS {name}_transaction_date_brin "
+                    f"ON {name} USING brin (transaction_date)"
+                )
+            )
+            created.append(name)
+    return created
+
+
+async def archive_partitions(
+    conn: AsyncConnection, older_than: int, drop: bool = False
+) -> list[str]:
+    """
+    Detaches partitions that ended at least `older_than` months ago and
+    moves them to the `archive` schema (or drops them). Daily rollups keep
+    their totals, so summaries still include archived months;
+    `rebuild_rollups` leaves rollups before the oldest attached partition
+    untouched for that reason.
+    """
+    cutoff = current_month() - relativedelta(months=older_than)
+    if not drop:
+        await conn.execute(text(f"CREATE SCHEMA IF NOT EXISTS {ARCHIVE_SCHEMA}"))
+
+    archived = []
+    for month, name in sorted((await list_partitions(conn)).items()):
+        if month + relativedelta(months=1) > cutoff:
+            continue
+        await conn.execute(text(f"ALTER TABLE {PARENT} DETACH PARTITION {name}"))
+        if drop:
+            await conn.execute(text(f"DROP TABLE {name}"))
+        else:
+            await conn.execute(text(f"ALTER TABLE {name} SET SCHEMA {ARCHIVE_SCHEMA}"))
+        archived.append(name)
+    return archived
+
+
+async def convert_to_partitioned(conn: AsyncConnection, keep_old: bool = False) -> int:
+    """
+    Rebuilds an existing plain `transactions` table as a partitioned one in
+    a single transaction. Requires TRANSACTIONS_PARTITIONED so the table is
+    created from the partitioned model. Returns the number of rows copied.
+    """
+    if not settings.TRANSACTIONS_PARTITIONED:
+        raise RuntimeError("Set TRANSACTIONS_PARTITIONED=true first")
+    if await is_partitioned(conn):
+        return 0
+
+    old = f"{PARENT}_unpartitioned"
+    await conn.execute(text(f"LOCK TABLE {PARENT} IN ACCESS EXCLUSIVE MODE"))
+    await conn.execute(text(f"ALTER TABLE {PARENT} RENAME TO {old}"))
+    # Index names are schema-wide; free them for the new table
+    indexes = await conn.execute(
+        text("SELECT indexname FROM pg_indexes WHERE tablename = :old"),
+        {"old": old},
+    )
+    for (index,) in indexes.all():
+        await conn.execute(text(f"ALTER INDEX {index} RENAME TO {index}_old"))
+
+    await conn.run_sync(lambda sync: Transaction.__table__.create(sync))  # type: ignore
+
+    first = await conn.execute(text(f"SELECT min(transaction_date) FROM {old}"))
+    oldest = first.scalar()
+    since = oldest.astimezone(ZoneInfo(settings.TIMEZONE)).date() if oldest else None
+    await ensure_partitions(conn, since=since)
+
+    columns = ", ".join(c.name for c in Transaction.__table__.columns)  # type: ignore
+    copied = await conn.execute(
+        text(f"INSERT INTO {PARENT} ({columns}) SELECT {columns} FROM {old}")
+    )
+    if not keep_old:
+        await conn.execute(text(f"DROP TABLE {old}"))
+    return copied.rowcount
+
+
+async def main(args: argparse.Namespace):
+    from app.db.session import engine
+
+    async with engine.begin() as conn:
+        if args.command == "convert":
+            rows = await convert_to_partitioned(conn, keep_old=args.keep_old)
+            logger.info("Transactions table partitioned", rows=rows)
+            return
+        if not await is_partitioned(conn):
+            logger.error("transactions is not partitioned; run 'convert' first")
+            return
+        if args.command == "ensure":
+            created = await ensure_partitions(conn, ahead=args.ahead)
+            logger.info("Partitions ensured", created=created)
+        elif args.command == "brin":
+            indexed = await add_brin_indexes(conn, older_than=args.older_than)
+            logger.info("BRIN indexes ensured", partitions=indexed)
+        elif args.command == "archive":
+            archived = await archive_partitions(conn, args.older_than, args.drop)
+            logger.info("Partitions archived", partitions=archived, dropped=args.drop)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Manage transaction partitions")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    convert = commands.add_parser("convert", help="Partition an existing table")
+    convert.add_argument("--keep-old", action="store_true")
+
+    ensure = commands.add_parser("ensure", help="Create upcoming partitions")
+    ensure.add_argument(
+        "--ahead", type=int, default=settings.TRANSACTIONS_PARTITIONS_AHEAD
+    )
+
+    brin = commands.add_parser("brin", help="Add BRIN indexes to cold partitions")
+    brin.add_argument("--older-than", type=int, default=3, help="months")
+
+    archive = commands.add_parser("archive", help="Detach old partitions")
+    archive.add_argument("--older-than", type=int, required=True, help="months")
+    archive.add_argument("--drop", action="store_true", help="Drop, not archive")
+
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,51 @@
+from typing import Any, Sequence, TypeVar
+from sqlalchemy import ColumnElement, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+T = TypeVar("T")
+
+
+async def save(session: AsyncSession, instance: T) -> T:
+    """
+    Inserts or updates ``instance`` with a single flush.
+
+    Primary keys and timestamps are generated client side and anything the
+    database generates is fetched through INSERT/UPDATE ... RETURNING during
+    the flush, so the instance is complete without a ``refresh()``.
+    """
+    session.add(instance)
+    await session.flush()
+    return instance
+
+
+async def save_all(session: AsyncSession, instances: Sequence[T]) -> Sequence[T]:
+    """
+    Persists ``instances`` (and cascaded children) in one flush; rows of the
+    same table are batched into multi-row INSERT statements.
+    """
+    session.add_all(instances)
+    await session.flush()
+    return instances
+
+
+async def update_returning(
+    session: AsyncSession,
+    model: type[T],
+    where: ColumnElement[bool],
+    values: dict[str, Any],
+) -> T | None:
+    """
+    Runs ``UPDATE ... SET values WHERE where RETURNING *`` and returns the
+    updated row as an ORM instance (refreshing the copy already in the
+    session, if any). Use for updates computed by the database, such as
+    counters, that must not race with concurrent writers.
+    """
+    stmt = (
+        update(model)
+        .where(where)
+        .values(**values)
+        .returning(model)
+        .execution_options(populate_existing=True, synchronize_session=False)
+    )
+    result = await session.scalars(stmt)
+    return result.first()
@@ -0,0 +1,35 @@
+"""
+Rebuilds the daily finance rollups from raw transactions.
+
+Run after backfills, bulk fixes made directly in SQL, or a TIMEZONE change:
+    python -m app.db.rebuild_rollups
+    python -m app.db.rebuild_rollups --business-id <uuid>
+"""
+
+import argparse
+import asyncio
+from uuid import UUID
+from app.db.session import unit_of_work
+from app.modules.finance.repository import FinanceRepository
+from app.core.logging import logger
+
+
+async def main(business_id: UUID | None = None):
+    logger.info("Rebuilding finance rollups...", business_id=business_id)
+    async with unit_of_work() as session:
+        repo = FinanceRepository(session)
+        horizon = await repo.rollup_horizon()
+        if horizon:
+            logger.warning(
+                "Keeping rollups before the oldest attached partition",
+                horizon=str(horizon),
+            )
+        rows = await repo.rebuild_rollups(business_id)
+    logger.info("Finance rollups rebuilt", rows=rows)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Rebuild daily finance rollups")
+    parser.add_argument("--business-id", type=UUID, default=None)
+    args = parser.parse_args()
+    asyncio.run(main(args.business_id))
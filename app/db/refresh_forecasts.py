@@ -0,0 +1,25 @@
+"""
+Recomputes the cached cash-flow forecasts of all active businesses now,
+instead of waiting for the background refresh:
+    python -m app.db.refresh_forecasts
+"""
+
+import asyncio
+from app.db.session import unit_of_work
+from app.modules.finance.forecast import refresh_all
+from app.modules.finance.repository import FinanceRepository
+from app.core.logging import logger
+
+
+async def main():
+    logger.info("Refreshing cash-flow forecasts...")
+    async with unit_of_work() as session:
+        refreshed = await refresh_all(FinanceRepository(session))
+    if refreshed is None:
+        logger.info("Another worker is refreshing forecasts; skipped")
+    else:
+        logger.info("Cash-flow forecasts refreshed", businesses=refreshed)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,59 @@
+import functools
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable, Optional, TypeVar
+from sqlalchemy import Engine, event
+from sqlalchemy.orm import Session
+
+T = TypeVar("T")
+
+_read_only: ContextVar[bool] = ContextVar("db_read_only", default=False)
+
+PIN_PRIMARY = "pin_primary"
+
+
+def read_only(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+    """
+    Marks a repository method as safe to serve from the read replica.
+    """
+
+    @functools.wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any) -> T:
+        token = _read_only.set(True)
+        try:
+            return await func(*args, **kwargs)
+        finally:
+            _read_only.reset(token)
+
+    return wrapper
+
+
+def pin_primary(session: Any) -> None:
+    """
+    Forces every later query of this session to the primary, e.g. when a
+    read must observe a write committed by another session.
+    """
+    session.info[PIN_PRIMARY] = True
+
+
+class RoutingSession(Session):
+    """
+    Sends read-only queries to the replica until the session writes
+    anything; after its first flush it stays on the primary so reads
+    observe its own writes.
+    """
+
+    replica: Optional[Engine] = None
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        if (
+            self.replica is not None
+            and _read_only.get()
+            and not self.info.get(PIN_PRIMARY)
+        ):
+            return self.replica
+        return super().get_bind(mapper=mapper, clause=clause, **kwargs)
+
+
+@event.listens_for(RoutingSession, "after_flush")
+def _pin_after_write(session: Session, flush_context: Any) -> None:
+    session.info[PIN_PRIMARY] = True
@@ -1,5 +1,5 @@
 import asyncio
-from app.db.session import AsyncSessionLocal
+from app.db.session import unit_of_work
 from app.db.seeds.auth_seed import seed_users, seed_additional_users
 from app.db.seeds.business_seed import seed_business
 from app.db.seeds.gamification_seed import seed_gamification
@@ -10,7 +10,7 @@ from app.core.logging import logger
 
 async def main():
     logger.info("Starting seeder...")
-    async with AsyncSessionLocal() as session:
+    async with unit_of_work() as session:
         await seed_gamification(session)
         demo_user = await seed_users(session)
         if demo_user:
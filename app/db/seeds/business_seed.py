@@ -3,7 +3,6 @@ from sqlmodel import select, desc
 from app.modules.auth.models import User
 from app.modules.business.models import BusinessProfile, BusinessLevel
 from app.core.logging import logger
-from app.modules.finance.repository import FinanceRepository
 
 
 async def seed_business(session: AsyncSession, user: User) -> BusinessProfile | None:
@@ -29,9 +28,6 @@ async def seed_business(session: AsyncSession, user: User) -> BusinessProfile |
         await session.commit()
         await session.refresh(profile)
 
-        finance_repo = FinanceRepository(session)
-        await finance_repo.create_default_categories(profile.id)
-
         logger.info("Created Business Profile")
     else:
         logger.info("Business Profile exists")
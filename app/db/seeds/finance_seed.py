@@ -2,7 +2,8 @@ from datetime import datetime, timedelta, timezone
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
-from app.modules.finance.models import Transaction, TransactionCategory
+from app.modules.finance.models import Transaction
+from app.modules.finance.repository import FinanceRepository
 from app.core.logging import logger
 
 
@@ -13,23 +14,10 @@ async def seed_finance(session: AsyncSession, business_id: UUID):
     )
     existing = result.scalars().all()
 
-    # Check if this business already has categories (it should, from creation)
-    stmt_cat = select(TransactionCategory).where(
-        TransactionCategory.business_id == business_id
-    )
-    cats_result = await session.execute(stmt_cat)
-    business_cats = {c.name: c.id for c in cats_result.scalars().all()}
-
-    # If no categories found (e.g. old business profile), create them now
-    if not business_cats:
-        from app.modules.finance.repository import FinanceRepository
-
-        repo = FinanceRepository(session)
-        await repo.create_default_categories(business_id)
-
-        # Refresh
-        cats_result = await session.execute(stmt_cat)
-        business_cats = {c.name: c.id for c in cats_result.scalars().all()}
+    # Shared defaults plus any categories of this business
+    repo = FinanceRepository(session)
+    await repo.ensure_system_categories()
+    business_cats = {c.name: c.id for c in await repo.get_categories(business_id)}
 
     if not existing:
         transactions = []
@@ -78,6 +66,8 @@ async def seed_finance(session: AsyncSession, business_id: UUID):
 
         if transactions:
             session.add_all(transactions)
+            await session.flush()
+            await repo.apply_to_rollups([t.id for t in transactions], 1)
             await session.commit()
             logger.info(f"Created {len(transactions)} transactions")
     else:
@@ -1,13 +1,66 @@
 # Database setup with SQLModel
-from typing import AsyncGenerator
+from contextlib import asynccontextmanager
+from typing import Any, AsyncGenerator, Callable
+from uuid import uuid4
+from fastapi import Depends
+from sqlalchemy import event
+from sqlalchemy.orm import Session
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlmodel import SQLModel
 from app.core.config import settings
+from app.core.logging import logger
+from app.db.instrumentation import instrument_engine
+from app.db.pool import InstrumentedQueuePool
+from app.db.routing import RoutingSession
 
-engine = create_async_engine(settings.DATABASE_URL, echo=False, future=True)
+
+def _engine_options() -> dict[str, Any]:
+    connect_args: dict[str, Any] = {
+        # SQLAlchemy's own prepared statement cache and asyncpg's cache
+        "prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+        "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+    }
+    if settings.DB_PGBOUNCER_MODE:
+        # PgBouncer in transaction mode cannot keep prepared statements
+        # across transactions, so disable caching and use unique names.
+        connect_args.update(
+            prepared_statement_cache_size=0,
+            statement_cache_size=0,
+            prepared_statement_name_func=lambda: f"__asyncpg_{uuid4()}__",
+        )
+
+    return {
+        "poolclass": InstrumentedQueuePool,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+        "connect_args": connect_args,
+    }
+
+
+engine = create_async_engine(
+    settings.DATABASE_URL, echo=False, future=True, **_engine_options()
+)
+
+replica_engine = (
+    create_async_engine(
+        settings.DATABASE_REPLICA_URL, echo=False, future=True, **_engine_options()
+    )
+    if settings.DATABASE_REPLICA_URL
+    else None
+)
+instrument_engine(engine)
+if replica_engine is not None:
+    instrument_engine(replica_engine)
+    RoutingSession.replica = replica_engine.sync_engine
 
 AsyncSessionLocal = async_sessionmaker(
-    bind=engine, class_=AsyncSession, expire_on_commit=False
+    bind=engine,
+    class_=AsyncSession,
+    sync_session_class=RoutingSession,
+    expire_on_commit=False,
 )
 
 
@@ -16,6 +69,78 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
         yield session
 
 
+async def commit_db(
+    db: AsyncSession = Depends(get_db),
+) -> AsyncGenerator[None, None]:
+    """
+    Unit of work for a request: repositories only flush, and the request's
+    session is committed once after the endpoint returns (or rolled back if
+    it raised). Registered app-wide with ``scope="function"`` so the commit
+    happens before the response is sent.
+    """
+    try:
+        yield
+    except Exception:
+        await db.rollback()
+        raise
+    else:
+        await db.commit()
+
+
+@asynccontextmanager
+async def unit_of_work() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Session for work outside a request (agent tools, background tasks),
+    committed once when the block exits without an error.
+    """
+    async with AsyncSessionLocal() as session:
+        try:
+            yield session
+        except Exception:
+            await session.rollback()
+            raise
+        await session.commit()
+
+
+def on_commit(session: AsyncSession, callback: Callable[[], Any]) -> None:
+    """
+    Runs ``callback`` after the session's current transaction commits, for
+    side effects that must not observe uncommitted state (cache
+    invalidation, background jobs). Dropped if the transaction rolls back.
+    """
+    session.info.setdefault("on_commit", []).append(callback)
+
+
+@event.listens_for(RoutingSession, "after_commit")
+def _run_commit_hooks(session: Session) -> None:
+    for callback in session.info.pop("on_commit", []):
+        callback()
+
+
+@event.listens_for(RoutingSession, "after_rollback")
+def _drop_commit_hooks(session: Session) -> None:
+    session.info.pop("on_commit", None)
+
+
+def _create_schema(connection) -> None:
+    SQLModel.metadata.create_all(connection)
+    # create_all skips tables that already exist, so add indexes introduced
+    # after a table was first created
+    for table in SQLModel.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(connection, checkfirst=True)
+
+
 async def init_db():
     async with engine.begin() as conn:
-        await conn.run_sync(SQLModel.metadata.create_all)
+        await conn.run_sync(_create_schema)
+        if settings.TRANSACTIONS_PARTITIONED:
+            from app.db.partitions import ensure_partitions, is_partitioned
+
+            if await is_partitioned(conn):
+                await ensure_partitions(conn)
+            else:
+                logger.warning(
+                    "TRANSACTIONS_PARTITIONED is set but transactions is a plain "
+                    "table; run `python -m app.db.partitions convert`"
+                )
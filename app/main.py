@@ -1,5 +1,6 @@
+import asyncio
 from contextlib import asynccontextmanager
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.core.config import settings
 from app.modules.auth.routes import router as auth_router
@@ -10,9 +11,22 @@ from app.modules.chat.routes import router as chat_router
 from app.modules.gamification.routes import router as gamification_router
 from app.modules.gamification.admin_routes import router as gamification_admin_router
 from app.modules.finance.routes import router as finance_router
-from app.db.session import init_db, AsyncSessionLocal
+from app.modules.finance.repository import FinanceRepository
+from app.modules.auth.cache import PRINCIPAL_CHANNEL, principal_cache
+from app.modules.finance.cache import CATEGORY_CHANNEL, category_cache
+from app.modules.finance.forecast import refresh_loop
+from app.modules.finance.recurring import materialize_loop
+from app.modules.finance.service import TRANSACTION_CREATED
+from app.modules.gamification.handlers import award_points
+from app.modules.milestone.service import MILESTONE_COMPLETED, TASK_COMPLETED
+from app.modules.system.admin_routes import router as system_admin_router
+from app.db.session import commit_db, init_db, unit_of_work, AsyncSessionLocal
+from app.db.instrumentation import QueryStatsMiddleware
+from app.db.notifications import notification_listener
+from app.db.outbox import OUTBOX_CHANNEL, outbox_dispatcher
 from app.core.logging import logger
-from app.db.init_data import init_admin_user
+from app.core.security import password_hasher
+from app.db.init_data import init_admin_user, init_system_categories
 from app.mcp_server import mcp
 from app.core.mcp_client import init_mcp_tools, cleanup_mcp_tools
 
@@ -26,6 +40,49 @@ async def lifespan(app: FastAPI):
     async with AsyncSessionLocal() as session:
         await init_admin_user(session)
 
+    async with unit_of_work() as session:
+        await init_system_categories(session)
+
+    # Backfill finance rollups on first start after the table was added
+    async with unit_of_work() as session:
+        finance_repo = FinanceRepository(session)
+        if await finance_repo.rollups_missing():
+            rows = await finance_repo.rebuild_rollups()
+            logger.info("Finance rollups backfilled", rows=rows)
+
+    # Cross-worker cache invalidation
+    notification_listener.subscribe(
+        CATEGORY_CHANNEL,
+        category_cache.handle_notification,
+        on_reconnect=category_cache.clear,
+    )
+    notification_listener.subscribe(
+        PRINCIPAL_CHANNEL,
+        principal_cache.handle_notification,
+        on_reconnect=principal_cache.reset,
+    )
+    notification_listener.subscribe(
+        OUTBOX_CHANNEL, outbox_dispatcher.wake, on_reconnect=outbox_dispatcher.wake
+    )
+    notification_listener.start()
+
+    # Side effects of domain events, delivered after the write commits
+    for event_type in (TRANSACTION_CREATED, TASK_COMPLETED, MILESTONE_COMPLETED):
+        outbox_dispatcher.subscribe(event_type, award_points)
+    outbox_dispatcher.start()
+
+    forecast_task = None
+    if settings.FORECAST_REFRESH_INTERVAL_MINUTES > 0:
+        forecast_task = asyncio.create_task(
+            refresh_loop(settings.FORECAST_REFRESH_INTERVAL_MINUTES)
+        )
+
+    recurring_task = None
+    if settings.RECURRING_RUN_INTERVAL_MINUTES > 0:
+        recurring_task = asyncio.create_task(
+            materialize_loop(settings.RECURRING_RUN_INTERVAL_MINUTES)
+        )
+
     # Initialize MCP Client Tools
     await init_mcp_tools()
 
@@ -34,6 +91,13 @@ async def lifespan(app: FastAPI):
 
     # Cleanup
     await cleanup_mcp_tools()
+    await notification_listener.stop()
+    await outbox_dispatcher.stop()
+    for task in (forecast_task, recurring_task):
+        if task:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+    password_hasher.shutdown()
     logger.info("Shutting down application...")
 
 
@@ -41,16 +105,23 @@ app = FastAPI(
     title=settings.PROJECT_NAME,
     openapi_url=f"{settings.API_V1_STR}/openapi.json",
     lifespan=lifespan,
+    dependencies=[Depends(commit_db, scope="function")],
 )
 
 origins = settings.FRONTEND_URL.split(",")
 
+app.add_middleware(
+    QueryStatsMiddleware,
+    expose_headers=settings.ENV.lower() != "production",
+    repeat_threshold=settings.DB_QUERY_REPEAT_THRESHOLD,
+)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=origins,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-DB-Queries", "Server-Timing"],
 )
 
 
@@ -85,6 +156,11 @@ app.include_router(
 app.include_router(
     finance_router, prefix=f"{settings.API_V1_STR}/finance", tags=["Finance"]
 )
+app.include_router(
+    system_admin_router,
+    prefix=f"{settings.API_V1_STR}/admin/system",
+    tags=["System (Admin)"],
+)
 
 # Mount MCP Server
 app.mount("/mcp", mcp.sse_app())
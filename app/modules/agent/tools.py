@@ -1,15 +1,18 @@
 from uuid import UUID
-from datetime import datetime
+from datetime import date, datetime
 from typing import List
 from app.modules.milestone.models import Milestone, MilestoneTask
 from app.modules.milestone.repository import MilestoneRepository
 from app.modules.business.repository import BusinessRepository
 from app.modules.gamification.repository import GamificationRepository
-from app.modules.finance.models import TransactionCreate, TransactionCategoryCreate
+from app.modules.finance.models import (
+    RecurringTransactionCreate,
+    TransactionCreate,
+    TransactionCategoryCreate,
+)
 from app.modules.finance.repository import FinanceRepository
 from app.modules.finance.service import FinanceService
-from app.modules.gamification.service import GamificationService
-from app.db.session import AsyncSessionLocal
+from app.db.session import unit_of_work
 from sqlalchemy.orm.attributes import flag_modified
 
 
@@ -35,7 +38,7 @@ async def create_milestone_tool(
         reward_points: Points awarded upon completion (default 0).
     """
     try:
-        async with AsyncSessionLocal() as session:
+        async with unit_of_work() as session:
             repo = MilestoneRepository(session)
 
             milestone_tasks = [
@@ -72,7 +75,7 @@ async def list_milestones_tool(
         status: Filter by status. Default is 'in_progress'. Use 'active' for (pending + in_progress), or 'all' for everything.
     """
     try:
-        async with AsyncSessionLocal() as session:
+        async with unit_of_work() as session:
             repo = MilestoneRepository(session)
 
             status_filter = None
@@ -123,7 +126,7 @@ async def update_milestone_tool(
         reward_points: Update reward points.
     """
     try:
-        async with AsyncSessionLocal() as session:
+        async with unit_of_work() as session:
             repo = MilestoneRepository(session)
             milestone = await repo.get_by_id(UUID(milestone_id))
 
@@ -151,7 +154,7 @@ async def complete_task_tool(task_id: str) -> str:
         task_id: The UUID of the task to complete.
     """
     try:
-        async with AsyncSessionLocal() as session:
+        async with unit_of_work() as session:
             repo = MilestoneRepository(session)
             task = await repo.get_task_by_id(UUID(task_id))
 
@@ -185,7 +188,7 @@ async def start_milestone_tool(milestone_id: str) -> str:
         milestone_id: The UUID of the milestone to start.
     """
     try:
-        async with AsyncSessionLocal() as session:
+        async with unit_of_work() as session:
             repo = MilestoneRepository(session)
             milestone = await repo.get_by_id(UUID(milestone_id))
 
@@ -210,7 +213,7 @@ async def delete_milestone_tool(milestone_id: str) -> str:
         milestone_id: The UUID of the milestone to delete.
     """
     try:
-        async with AsyncSessionLocal() as session:
+        async with unit_of_work() as session:
             repo = MilestoneRepository(session)
             milestone = await repo.get_by_id(UUID(milestone_id))
 
@@ -236,7 +239,7 @@ async def create_transaction_category_tool(
         type: 'INCOME' or 'EXPENSE'.
     """
     try:
-        async with AsyncSessionLocal() as session:
+        async with unit_of_work() as session:
             repo = FinanceRepository(session)
             business_repo = BusinessRepository(session)
             service = FinanceService(repo, business_repo)
@@ -261,12 +264,9 @@ async def list_recent_transactions_tool(business_id: str, limit: int = 5) -> str
         limit: Number of transactions to return (default 5).
     """
     try:
-        async with AsyncSessionLocal() as session:
+        async with unit_of_work() as session:
             repo = FinanceRepository(session)
-            # unpack the tuple (transactions, count)
-            transactions, _ = await repo.get_by_business_id(
-                UUID(business_id), skip=0, limit=limit
-            )
+            transactions = await repo.get_page_after(UUID(business_id), limit=limit)
 
             if not transactions:
                 return "No recent transactions found."
@@ -296,7 +296,7 @@ async def get_business_summary_tool(business_id: str) -> str:
         business_id: The UUID of the business.
     """
     try:
-        async with AsyncSessionLocal() as session:
+        async with unit_of_work() as session:
             business_repo = BusinessRepository(session)
             gamification_repo = GamificationRepository(session)
 
@@ -363,12 +363,10 @@ async def record_transaction_tool(
         if not category_id:
             return "Error: 'category_id' is required. Please check available categories first."
 
-        async with AsyncSessionLocal() as session:
+        async with unit_of_work() as session:
             repo = FinanceRepository(session)
             business_repo = BusinessRepository(session)
-            gamification_repo = GamificationRepository(session)
-            gamification_service = GamificationService(gamification_repo, business_repo)
-            service = FinanceService(repo, business_repo, gamification_service)
+            service = FinanceService(repo, business_repo)
 
             cat_uuid = UUID(category_id)
 
@@ -397,29 +395,129 @@ async def record_transaction_tool(
         return f"Error recording transaction: {str(e)}"
 
 
-async def get_financial_report_tool(business_id: str, period: str = "month") -> str:
+async def create_recurring_transaction_tool(
+    business_id: str,
+    type: str,
+    amount: float,
+    category_id: str,
+    frequency: str = "monthly",
+    every: int = 1,
+    start_date: str | None = None,
+    end_date: str | None = None,
+    description: str = "",
+    payment_method: str = "CASH",
+) -> str:
+    """
+    Sets up a transaction that is recorded automatically on a schedule, e.g.
+    monthly rent or salaries. Use this instead of recording the same fixed
+    cost every period. Occurrences up to today are recorded immediately.
+    CRITICAL: You MUST provide a valid 'category_id'. call 'get_transaction_categories_tool' first if needed.
+
+    Args:
+        business_id: The UUID of the business.
+        type: 'INCOME' or 'EXPENSE'.
+        amount: Amount of each occurrence.
+        category_id: The UUID of the category (must match the type).
+        frequency: 'daily', 'weekly', 'monthly' or 'yearly'.
+        every: Repeat every N periods (e.g. 2 with 'weekly' = every two weeks).
+        start_date: ISO date of the first occurrence (e.g., '2024-01-25'), at most 31 days ago. Defaults to today.
+        end_date: Optional ISO date after which nothing is recorded.
+        description: Brief description.
+        payment_method: 'CASH', 'TRANSFER', 'QRIS', etc.
+    """
+    try:
+        async with unit_of_work() as session:
+            service = FinanceService(
+                FinanceRepository(session), BusinessRepository(session)
+            )
+            try:
+                start = date.fromisoformat(start_date) if start_date else None
+                end = date.fromisoformat(end_date) if end_date else None
+            except ValueError:
+                return "Error: Invalid date format. Use ISO format (YYYY-MM-DD)."
+
+            recurring = await service.create_recurring(
+                UUID(business_id),
+                RecurringTransactionCreate(
+                    amount=amount,
+                    type=type,
+                    category_id=UUID(category_id),
+                    frequency=frequency.lower(),
+                    every=every,
+                    start_date=start,
+                    end_date=end,
+                    description=description,
+                    payment_method=payment_method,
+                ),
+            )
+            return (
+                f"Success: {recurring.frequency} {recurring.type} of {amount} "
+                f"for '{recurring.category_name}' scheduled. Already recorded: "
+                f"{recurring.occurrences}. Next on {recurring.next_run_date}. "
+                f"ID: {recurring.id}"
+            )
+    except Exception as e:
+        return f"Error scheduling recurring transaction: {str(e)}"
+
+
+async def get_financial_report_tool(
+    business_id: str, period: str = "month", compare: bool = False
+) -> str:
     """
-    Gets a financial summary (Income, Expense, Profit) for a period.
+    Gets a financial summary (Income, Expense, Profit) for a period, plus a
+    30-day cash-flow forecast. Set compare=True to also get the previous period (e.g. last month) with
+    changes and growth per category, instead of calling this tool twice.
 
     Args:
         business_id: The UUID of the business.
         period: 'week', 'month', or 'year'.
+        compare: Include the previous period of the same length.
     """
     try:
-        async with AsyncSessionLocal() as session:
+        async with unit_of_work() as session:
             repo = FinanceRepository(session)
             business_repo = BusinessRepository(session)
             service = FinanceService(repo, business_repo)
 
-            summary = await service.get_summary(UUID(business_id), period)
+            summary = await service.get_summary(UUID(business_id), period, compare)
 
-            return (
+            report = (
                 f"Financial Report ({period}):\n"
                 f"Total Income: {summary.total_income}\n"
                 f"Total Expense: {summary.total_expense}\n"
                 f"Net Profit: {summary.net_profit}\n"
                 f"Period: {summary.period_start} to {summary.period_end}"
             )
+            if summary.comparison:
+                c = summary.comparison
+
+                def growth(value):
+                    return "n/a" if value is None else f"{value:+}%"
+
+                lines = [
+                    f"\nPrevious Period: {c.period_start} to {c.period_end}",
+                    f"Income: {c.total_income} (change {c.income_change:+}, {growth(c.income_growth)})",
+                    f"Expense: {c.total_expense} (change {c.expense_change:+}, {growth(c.expense_growth)})",
+                    f"Net Profit: {c.net_profit} (change {c.net_profit_change:+}, {growth(c.net_profit_growth)})",
+                    "By category (current vs previous):",
+                ]
+                lines += [
+                    f"- {cat.type} {cat.category}: {cat.current} vs {cat.previous} ({growth(cat.growth)})"
+                    for cat in c.categories
+                ]
+                report += "\n".join(lines)
+
+            forecast = await service.get_forecast(UUID(business_id))
+            if forecast.observed_days:
+                report += (
+                    f"\n\n30-Day Forecast (from {forecast.observed_days} active days):\n"
+                    f"Projected Net Cash Flow: {forecast.projected_net_30d}\n"
+                    f"Smoothed Daily Net: {forecast.smoothed_daily_net} "
+                    f"(trend {forecast.trend_per_day:+} per day)\n"
+                    f"7/28-Day Average Daily Net: {forecast.moving_average_7d} / "
+                    f"{forecast.moving_average_28d}"
+                )
+            return report
     except Exception as e:
         return f"Error getting financial report: {str(e)}"
 
@@ -433,9 +531,11 @@ async def get_transaction_categories_tool(business_id: str) -> str:
         business_id: The UUID of the business.
     """
     try:
-        async with AsyncSessionLocal() as session:
-            repo = FinanceRepository(session)
-            categories = await repo.get_categories(UUID(business_id))
+        async with unit_of_work() as session:
+            service = FinanceService(
+                FinanceRepository(session), BusinessRepository(session)
+            )
+            categories = await service.get_categories(UUID(business_id))
 
             if not categories:
                 return "No categories found."
@@ -486,7 +586,7 @@ async def update_business_context_tool(
         update_condition_text: New text for the condition at that index.
     """
     try:
-        async with AsyncSessionLocal() as session:
+        async with unit_of_work() as session:
             repo = BusinessRepository(session)
             business = await repo.get_by_id(UUID(business_id))
 
@@ -10,6 +10,7 @@ from app.modules.agent.tools import (
     start_milestone_tool,
     get_business_summary_tool,
     record_transaction_tool,
+    create_recurring_transaction_tool,
     get_financial_report_tool,
     update_business_context_tool,
     get_transaction_categories_tool,
@@ -146,7 +147,7 @@ def get_chat_workflow(
            
         2. **Financial Assistant**:
            - Record: `record_transaction_tool`.
-           - Report: `get_financial_report_tool`.
+           - Report: `get_financial_report_tool` (pass `compare=True` to compare with the previous period in one call).
            - Categories: `get_transaction_categories_tool` (Always check available categories before suggesting categorization).
            - Motivation: Remind them that recording daily transactions earns 5 points!
            
@@ -178,6 +179,7 @@ def get_chat_workflow(
         - **TOOL CALLING**: NEVER output the tool call as text (e.g., `update_business_context_tool(...)`). You MUST execute the tool using the proper tool calling protocol.
         - **FINANCE RULE**: Before recording a transaction, ALWAYS call `get_transaction_categories_tool` to see valid categories. NEVER invent a category ID. If unsure, ask the user to pick one.
         - **CATEGORY RULE**: If the user needs a category that doesn't exist, offer to create it using `create_transaction_category_tool`.
+        - **RECURRING RULE**: For fixed costs or income that repeat (rent, salaries, utilities), offer to schedule them once with `create_recurring_transaction_tool` instead of recording each period by hand.
         - **ANTI-HALLUCINATION**: DO NOT say you completed an action unless you have successfully called the relevant tool (e.g., `record_transaction_tool`) and received a success message in the tool result. If you are just checking data (like categories or milestones), say "Saya cek dulu ya" and STOP.
 
 
@@ -193,6 +195,7 @@ def get_chat_workflow(
             start_milestone_tool,
             get_business_summary_tool,
             record_transaction_tool,
+            create_recurring_transaction_tool,
             get_financial_report_tool,
             update_business_context_tool,
             get_transaction_categories_tool,
@@ -0,0 +1,154 @@
+import time
+from collections import OrderedDict
+from uuid import UUID
+from typing import Any
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.modules.auth.models import CurrentPrincipal
+
+# NOTIFY channel carrying a changed user id ("revoke:<id>" when their token
+# claims changed, "*" for everyone)
+PRINCIPAL_CHANNEL = "auth_principals_changed"
+REVOKE_PREFIX = "revoke:"
+
+
+def claims_version() -> int:
+    """Version stamp (epoch milliseconds) embedded in rich access tokens."""
+    return int(time.time() * 1000)
+
+
+class ClaimsRevocations:
+    """
+    Small table of "principal changed at" marks used to reject stale
+    self-contained access tokens.
+
+    A token stamped before its user's last change is stale. Marks older than
+    the access token lifetime are dropped because every token they could
+    reject has expired; if the table overflows, the evicted mark becomes a
+    global floor so nothing is ever trusted wrongly. The floor starts at
+    construction time: a worker cannot have seen changes made before it
+    started, so it re-checks every token issued earlier.
+    """
+
+    def __init__(self, maxsize: int, ttl_seconds: float):
+        self.maxsize = maxsize
+        self.ttl_ms = int(ttl_seconds * 1000)
+        self._floor = claims_version()
+        self._changed: OrderedDict[UUID, int] = OrderedDict()
+
+    def revoke(self, user_id: UUID) -> None:
+        self._changed[user_id] = claims_version()
+        self._changed.move_to_end(user_id)
+        self._prune()
+
+    def revoke_all(self) -> None:
+        self._floor = claims_version()
+        self._changed.clear()
+
+    def is_fresh(self, user_id: UUID, version: int) -> bool:
+        self._prune()
+        return version > self._floor and version > self._changed.get(user_id, 0)
+
+    def _prune(self) -> None:
+        cutoff = claims_version() - self.ttl_ms
+        while self._changed:
+            user_id, changed_at = next(iter(self._changed.items()))
+            if changed_at > cutoff and len(self._changed) <= self.maxsize:
+                break
+            self._changed.popitem(last=False)
+            if changed_at > cutoff:
+                self._floor = max(self._floor, changed_at)
+
+
+class PrincipalCache:
+    """
+    Caches the resolved `CurrentPrincipal` per token subject so hot requests
+    skip the database entirely.
+
+    A load takes a ticket from `version()` before reading; invalidating a
+    user marks them with a newer ticket, and a principal loaded under an
+    older ticket is never stored. That closes the race between a slow read
+    and a concurrent update. Marks only matter to loads still in flight, so
+    at most `maxsize` are kept; an evicted mark raises a global floor that
+    rejects every older load instead.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self._cache: TTLCache[UUID, CurrentPrincipal] = TTLCache(maxsize, ttl)
+        self._max_marks = max(maxsize, 1000)
+        self._ticket = 0
+        self._floor = 0
+        self._invalidated: OrderedDict[UUID, int] = OrderedDict()
+        self.revocations = ClaimsRevocations(
+            maxsize=max(maxsize, 1000),
+            ttl_seconds=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+        )
+
+    def version(self, user_id: UUID) -> int:
+        return self._ticket
+
+    def get(self, user_id: UUID) -> CurrentPrincipal | None:
+        return self._cache.get(user_id)
+
+    def set(self, user_id: UUID, principal: CurrentPrincipal, version: int) -> None:
+        if version < self._floor or version < self._invalidated.get(user_id, 0):
+            return
+        self._cache.set(user_id, principal)
+
+    def invalidate(self, user_id: UUID) -> None:
+        self._ticket += 1
+        self._invalidated[user_id] = self._ticket
+        self._invalidated.move_to_end(user_id)
+        while len(self._invalidated) > self._max_marks:
+            _, ticket = self._invalidated.popitem(last=False)
+            self._floor = max(self._floor, ticket)
+        self._cache.pop(user_id)
+
+    def revoke(self, user_id: UUID) -> None:
+        """
+        Invalidates the user and rejects their earlier rich-claims tokens.
+        Only for changes to token claims (`bid`, `role`); points and level
+        are informational and just `invalidate`.
+        """
+        self.invalidate(user_id)
+        self.revocations.revoke(user_id)
+
+    def clear(self) -> None:
+        """Drops every entry, e.g. after a business level was edited."""
+        self._ticket += 1
+        self._floor = self._ticket
+        self._invalidated.clear()
+        self._cache.clear()
+
+    def reset(self) -> None:
+        """
+        Drops every entry and re-checks every earlier token, for when
+        notifications from other workers may have been missed.
+        """
+        self.clear()
+        self.revocations.revoke_all()
+
+    def handle_notification(self, payload: str) -> None:
+        """Applies an invalidation or revocation sent by another worker."""
+        if payload == "*":
+            self.clear()
+            return
+        revoke = payload.startswith(REVOKE_PREFIX)
+        try:
+            user_id = UUID(payload.removeprefix(REVOKE_PREFIX))
+        except ValueError:
+            self.reset()
+            return
+        if revoke:
+            self.revoke(user_id)
+        else:
+            self.invalidate(user_id)
+
+    def stats(self) -> dict[str, Any]:
+        return self._cache.stats()
+
+
+principal_cache = PrincipalCache(
+    maxsize=settings.PRINCIPAL_CACHE_MAX_SIZE,
+    ttl=settings.PRINCIPAL_CACHE_TTL_SECONDS,
+)
@@ -5,46 +5,108 @@ from jose import jwt, JWTError
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.config import settings
 from app.db.session import get_db
-from app.modules.auth.models import User
+from app.modules.auth.cache import principal_cache
+from app.modules.auth.models import User, CurrentPrincipal, PrincipalClaims
 from app.modules.auth.repository import AuthRepository
 from app.modules.business.models import BusinessProfile
-from app.modules.business.repository import BusinessRepository
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"{settings.API_V1_STR}/auth/login")
 
+credentials_exception = HTTPException(
+    status_code=status.HTTP_401_UNAUTHORIZED,
+    detail="Could not validate credentials",
+    headers={"WWW-Authenticate": "Bearer"},
+)
 
-async def get_current_user(
-    token: str = Depends(oauth2_scheme), db: AsyncSession = Depends(get_db)
-) -> User:
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
 
+def _decode_access_token(token: str) -> tuple[UUID, dict]:
     try:
         payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
         user_id: str | None = payload.get("sub")
         if user_id is None:
             raise credentials_exception
-    except JWTError:
+        return UUID(user_id), payload
+    except (JWTError, ValueError):
         raise credentials_exception
 
+
+async def _resolve_principal(user_id: UUID, db: AsyncSession) -> CurrentPrincipal:
+    principal = principal_cache.get(user_id)
+    if principal is not None:
+        return principal
+
+    version = principal_cache.version(user_id)
     repo = AuthRepository(db)
 
-    user = await repo.get_by_id(UUID(user_id))
+    principal = await repo.get_principal(user_id)
 
-    if user is None:
+    if principal is None:
         raise credentials_exception
 
-    return user
+    # Detach the snapshot so later writes in this request never mutate
+    # the instance that other requests read from the cache.
+    db.expunge(principal.user)
+    if principal.business:
+        db.expunge(principal.business)
+    if principal.level:
+        db.expunge(principal.level)
+    principal_cache.set(user_id, principal, version)
+
+    return principal
+
+
+async def get_current_principal(
+    token: str = Depends(oauth2_scheme), db: AsyncSession = Depends(get_db)
+) -> CurrentPrincipal:
+    """
+    Resolves the caller (user, business, level) with a single query, or from
+    the in-process principal cache when the subject was seen recently.
+    FastAPI caches this per request, so every dependency below shares it.
+    """
+    user_id, _ = _decode_access_token(token)
+    return await _resolve_principal(user_id, db)
+
+
+async def get_principal_claims(
+    token: str = Depends(oauth2_scheme), db: AsyncSession = Depends(get_db)
+) -> PrincipalClaims:
+    """
+    Authorization-only view of the caller for routes that just need ids and
+    the role. A fresh rich-claims token is trusted without any lookup; tokens
+    stamped before the user's last change seen by this worker fall back to
+    the principal cache/database.
+    """
+    user_id, payload = _decode_access_token(token)
+
+    version = payload.get("pv")
+    if (
+        settings.ACCESS_TOKEN_RICH_CLAIMS
+        and isinstance(version, int)
+        and principal_cache.revocations.is_fresh(user_id, version)
+    ):
+        business_id = payload.get("bid")
+        level_id = payload.get("lvl")
+        return PrincipalClaims(
+            user_id=user_id,
+            role=payload.get("role", "user"),
+            business_id=UUID(business_id) if business_id else None,
+            level_id=UUID(level_id) if level_id else None,
+        )
+
+    principal = await _resolve_principal(user_id, db)
+    return PrincipalClaims.from_principal(principal)
+
+
+async def get_current_user(
+    principal: CurrentPrincipal = Depends(get_current_principal),
+) -> User:
+    return principal.user
 
 
 async def get_optional_current_business(
-    current_user: User = Depends(get_current_user), db: AsyncSession = Depends(get_db)
+    principal: CurrentPrincipal = Depends(get_current_principal),
 ) -> BusinessProfile | None:
-    repo = BusinessRepository(db)
-    return await repo.get_by_user_id(current_user.id)
+    return principal.business
 
 
 async def get_current_business(
@@ -57,3 +119,32 @@ async def get_current_business(
         )
 
     return current_business
+
+
+async def get_current_business_id(
+    claims: PrincipalClaims = Depends(get_principal_claims),
+    db: AsyncSession = Depends(get_db),
+) -> UUID:
+    business_id = claims.business_id
+    if not business_id and claims.principal is None:
+        # The token may predate the business profile (possibly created on
+        # another worker), so a missing claim is never trusted on its own.
+        principal = await _resolve_principal(claims.user_id, db)
+        business_id = principal.business.id if principal.business else None
+
+    if not business_id:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="User does not have a business profile. Please create one first.",
+        )
+
+    return business_id
+
+
+async def require_admin(
+    claims: PrincipalClaims = Depends(get_principal_claims),
+) -> PrincipalClaims:
+    if claims.role != "admin":
+        raise HTTPException(status_code=403, detail="Not authorized")
+
+    return claims
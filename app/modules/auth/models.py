@@ -3,7 +3,12 @@ from uuid import UUID, uuid4
 from datetime import datetime, timezone
 from sqlalchemy import Column, DateTime
 from typing import Optional
-from app.modules.business.models import BusinessProfileRead
+from dataclasses import dataclass
+from app.modules.business.models import (
+    BusinessLevel,
+    BusinessProfile,
+    BusinessProfileRead,
+)
 
 
 class UserBase(SQLModel):
@@ -51,3 +56,37 @@ class UserRead(UserBase):
 
 class UserWithBusinessRead(UserRead):
     business: Optional[BusinessProfileRead] = None
+
+
+@dataclass
+class CurrentPrincipal:
+    """The authenticated caller: user plus (optional) business and its level."""
+
+    user: User
+    business: Optional[BusinessProfile] = None
+    level: Optional[BusinessLevel] = None
+
+
+@dataclass
+class PrincipalClaims:
+    """
+    Authorization facts about the caller. Taken straight from a rich access
+    token when it is fresh, otherwise derived from the resolved principal.
+    """
+
+    user_id: UUID
+    role: str
+    business_id: Optional[UUID] = None
+    level_id: Optional[UUID] = None
+    principal: Optional[CurrentPrincipal] = None
+
+    @classmethod
+    def from_principal(cls, principal: CurrentPrincipal) -> "PrincipalClaims":
+        business = principal.business
+        return cls(
+            user_id=principal.user.id,
+            role=principal.user.role,
+            business_id=business.id if business else None,
+            level_id=business.level_id if business else None,
+            principal=principal,
+        )
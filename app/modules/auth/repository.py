@@ -1,7 +1,9 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
-from app.modules.auth.models import User
+from app.modules.auth.models import User, CurrentPrincipal
+from app.modules.business.models import BusinessProfile, BusinessLevel
 from uuid import UUID
+from app.db.persistence import save
 
 class AuthRepository:
     def __init__(self, session: AsyncSession):
@@ -15,8 +17,21 @@ class AuthRepository:
         result = await self.session.execute(select(User).where(User.id == user_id))
         return result.scalars().first()
 
+    async def get_principal(self, user_id: UUID) -> CurrentPrincipal | None:
+        """Loads user, business profile and business level in one joined query."""
+        statement = (
+            select(User, BusinessProfile, BusinessLevel)
+            .join(BusinessProfile, BusinessProfile.user_id == User.id, isouter=True)  # type: ignore
+            .join(BusinessLevel, BusinessProfile.level_id == BusinessLevel.id, isouter=True)  # type: ignore
+            .where(User.id == user_id)
+        )
+        result = await self.session.execute(statement)
+        row = result.first()
+        if row is None:
+            return None
+
+        user, business, level = row
+        return CurrentPrincipal(user=user, business=business, level=level)
+
     async def create(self, user: User) -> User:
-        self.session.add(user)
-        await self.session.commit()
-        await self.session.refresh(user)
-        return user
+        return await save(self.session, user)
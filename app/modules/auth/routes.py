@@ -1,12 +1,9 @@
 from fastapi import APIRouter, Depends, Response, Cookie, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.db.session import get_db
-from app.modules.auth.dependencies import (
-    get_current_user,
-    get_optional_current_business,
-)
+from app.modules.auth.dependencies import get_current_principal
 from app.modules.auth.models import (
-    User,
+    CurrentPrincipal,
     UserCreate,
     UserRead,
     UserLogin,
@@ -14,8 +11,7 @@ from app.modules.auth.models import (
 )
 from app.modules.auth.repository import AuthRepository
 from app.modules.auth.service import AuthService
-from app.modules.business.models import BusinessProfile, BusinessProfileRead
-from app.modules.business.repository import BusinessRepository
+from app.modules.business.service import BusinessService
 
 router = APIRouter()
 
@@ -27,24 +23,18 @@ def get_auth_service(db: AsyncSession = Depends(get_db)) -> AuthService:
 
 @router.get("/me", response_model=UserWithBusinessRead)
 async def read_users_me(
-    current_user: User = Depends(get_current_user),
-    current_business: BusinessProfile | None = Depends(get_optional_current_business),
-    db: AsyncSession = Depends(get_db),
+    principal: CurrentPrincipal = Depends(get_current_principal),
 ):
-    if not current_business and current_user.role == "user":
+    current_user = principal.user
+    if not principal.business and current_user.role == "user":
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User does not have a business profile. Please create one first.",
         )
 
     business_read = None
-    if current_business:
-        business_read = BusinessProfileRead.model_validate(current_business)
-        if current_business.level_id:
-            business_repo = BusinessRepository(db)
-            level = await business_repo.get_level(current_business.level_id)
-            if level:
-                business_read.level_name = level.name
+    if principal.business:
+        business_read = BusinessService.to_read(principal.business, principal.level)
 
     return UserWithBusinessRead(**current_user.model_dump(), business=business_read)
 
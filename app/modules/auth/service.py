@@ -4,18 +4,44 @@ from fastapi import HTTPException, status, Response
 from app.modules.auth.repository import AuthRepository
 from app.modules.auth.models import UserCreate, User
 from app.core.security import (
-    get_password_hash,
-    verify_password,
+    PasswordHasherBusyError,
+    password_hasher,
     create_access_token,
     create_refresh_token,
 )
 from app.core.config import settings
+from app.modules.auth.cache import claims_version
 
 
 class AuthService:
     def __init__(self, repo: AuthRepository):
         self.repo = repo
 
+    @staticmethod
+    def _busy_exception() -> HTTPException:
+        return HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Authentication is busy, please retry shortly",
+            headers={"Retry-After": "1"},
+        )
+
+    async def _issue_access_token(self, user: User) -> str:
+        claims: dict = {"sub": str(user.id)}
+        if settings.ACCESS_TOKEN_RICH_CLAIMS:
+            # Stamp before reading, so a concurrent change marks this token stale
+            version = claims_version()
+            principal = await self.repo.get_principal(user.id)
+            business = principal.business if principal else None
+            claims.update(
+                role=user.role,
+                bid=str(business.id) if business else None,
+                lvl=str(business.level_id) if business and business.level_id else None,
+                pv=version,
+            )
+
+        access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+        return create_access_token(data=claims, expires_delta=access_token_expires)
+
     async def register_user(self, user_in: UserCreate) -> User:
         existing_user = await self.repo.get_by_email(user_in.email)
         if existing_user:
@@ -23,7 +49,10 @@ class AuthService:
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Email already registered",
             )
-        hashed_password = get_password_hash(user_in.password)
+        try:
+            hashed_password = await password_hasher.hash(user_in.password)
+        except PasswordHasherBusyError:
+            raise self._busy_exception()
         db_user = User(
             email=user_in.email, hashed_password=hashed_password, name=user_in.name
         )
@@ -33,16 +62,20 @@ class AuthService:
         self, email: str, password: str, response: Response
     ) -> dict:
         user = await self.repo.get_by_email(email)
-        if not user or not verify_password(password, user.hashed_password):
+        valid = False
+        if user:
+            try:
+                valid = await password_hasher.verify(password, user.hashed_password)
+            except PasswordHasherBusyError:
+                raise self._busy_exception()
+
+        if not user or not valid:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Incorrect email or password",
                 headers={"WWW-Authenticate": "Bearer"},
             )
-        access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-        access_token = create_access_token(
-            data={"sub": str(user.id)}, expires_delta=access_token_expires
-        )
+        access_token = await self._issue_access_token(user)
 
         refresh_token_expires = timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
         refresh_token = create_refresh_token(
@@ -98,9 +131,6 @@ class AuthService:
                 detail="User not found",
             )
 
-        access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-        access_token = create_access_token(
-            data={"sub": str(user.id)}, expires_delta=access_token_expires
-        )
+        access_token = await self._issue_access_token(user)
 
         return {"access_token": access_token}
@@ -1,8 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException
 from typing import Sequence
 from uuid import UUID
-from app.modules.auth.dependencies import get_current_user
-from app.modules.auth.models import User
+from app.modules.auth.dependencies import require_admin
 from app.modules.business.models import (
     BusinessLevel,
     BusinessLevelCreate,
@@ -12,31 +11,24 @@ from app.modules.business.models import (
 from app.modules.business.repository import BusinessRepository
 from app.modules.business.dependencies import get_business_repo
 
-router = APIRouter()
+router = APIRouter(dependencies=[Depends(require_admin)])
 
 
 @router.post("/levels", response_model=BusinessLevelRead)
 async def create_level(
     level_in: BusinessLevelCreate,
-    current_user: User = Depends(get_current_user),
     repo: BusinessRepository = Depends(get_business_repo),
 ):
     """Create a new business level (Admin only)."""
-    if current_user.role != "admin":
-        raise HTTPException(status_code=403, detail="Not authorized")
-
     level = BusinessLevel(**level_in.model_dump())
     return await repo.create_level(level)
 
 
 @router.get("/levels", response_model=Sequence[BusinessLevelRead])
 async def get_levels_admin(
-    current_user: User = Depends(get_current_user),
     repo: BusinessRepository = Depends(get_business_repo),
 ):
     """List all available business levels (Admin)."""
-    if current_user.role != "admin":
-        raise HTTPException(status_code=403, detail="Not authorized")
     return await repo.get_levels()
 
 
@@ -44,13 +36,9 @@ async def get_levels_admin(
 async def update_level(
     level_id: UUID,
     level_in: BusinessLevelUpdate,
-    current_user: User = Depends(get_current_user),
     repo: BusinessRepository = Depends(get_business_repo),
 ):
     """Update a business level (Admin only)."""
-    if current_user.role != "admin":
-        raise HTTPException(status_code=403, detail="Not authorized")
-
     level = await repo.get_level(level_id)
     if not level:
         raise HTTPException(status_code=404, detail="Level not found")
@@ -65,13 +53,9 @@ async def update_level(
 @router.delete("/levels/{level_id}")
 async def delete_level(
     level_id: UUID,
-    current_user: User = Depends(get_current_user),
     repo: BusinessRepository = Depends(get_business_repo),
 ):
     """Delete a business level (Admin only)."""
-    if current_user.role != "admin":
-        raise HTTPException(status_code=403, detail="Not authorized")
-
     level = await repo.get_level(level_id)
     if not level:
         raise HTTPException(status_code=404, detail="Level not found")
@@ -2,7 +2,7 @@ from sqlmodel import SQLModel, Field, Relationship
 from uuid import UUID, uuid4
 from datetime import datetime, timezone
 from typing import Optional, List, TYPE_CHECKING
-from sqlalchemy import Column, DateTime, JSON
+from sqlalchemy import Column, DateTime, Index, JSON
 
 if TYPE_CHECKING:
     from app.modules.milestone.models import Milestone
@@ -58,6 +58,14 @@ class BusinessProfile(BusinessProfileBase, table=True):
         return self.deleted_at is not None
 
 
+# Leaderboard ordering and rank counting over live profiles
+Index(
+    "ix_business_profiles_total_points_live",
+    BusinessProfile.total_points.desc(),  # type: ignore
+    postgresql_where=BusinessProfile.deleted_at.is_(None),  # type: ignore
+)
+
+
 class BusinessProfileCreate(BusinessProfileBase):
     pass
 
@@ -1,45 +1,71 @@
+from functools import partial
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select, asc, desc, func
 from uuid import UUID
 from typing import Sequence
+from app.db.persistence import save, update_returning
+from app.db.routing import read_only
+from app.db.session import on_commit
 from app.modules.business.models import BusinessProfile, BusinessLevel
 from app.modules.auth.models import User
+from app.db.notifications import notify
+from app.modules.auth.cache import PRINCIPAL_CHANNEL, REVOKE_PREFIX, principal_cache
 
 
 class BusinessRepository:
     def __init__(self, session: AsyncSession):
         self.session = session
 
+    async def _invalidate_principal(
+        self, user_id: UUID | None = None, revoke: bool = False
+    ) -> None:
+        # Drop now and again after commit, so a principal reloaded from the
+        # pre-commit row by a concurrent request does not stay cached, and
+        # tell the other workers once the change commits.
+        # `revoke` also rejects the user's older tokens; only for claim
+        # changes, since a stale token costs a lookup on every request.
+        if user_id is None:
+            drop, payload = principal_cache.clear, "*"
+        elif revoke:
+            drop = partial(principal_cache.revoke, user_id)
+            payload = f"{REVOKE_PREFIX}{user_id}"
+        else:
+            drop, payload = partial(principal_cache.invalidate, user_id), str(user_id)
+        drop()
+        on_commit(self.session, drop)
+        await notify(self.session, PRINCIPAL_CHANNEL, payload)
+
     async def get_by_user_id(self, user_id: UUID) -> BusinessProfile | None:
         statement = select(BusinessProfile).where(BusinessProfile.user_id == user_id)
         result = await self.session.execute(statement)
         return result.scalars().first()
 
     async def get_by_id(self, business_id: UUID) -> BusinessProfile | None:
-        statement = select(BusinessProfile).where(BusinessProfile.id == business_id)
-        result = await self.session.execute(statement)
-        return result.scalars().first()
+        # Identity map first: after add_points/update the row is already here
+        return await self.session.get(BusinessProfile, business_id)
 
     async def create(self, profile: BusinessProfile) -> BusinessProfile:
-        self.session.add(profile)
-        await self.session.commit()
-        await self.session.refresh(profile)
+        await save(self.session, profile)
+        # New `bid` claim
+        await self._invalidate_principal(profile.user_id, revoke=True)
         return profile
 
     async def update(self, profile: BusinessProfile) -> BusinessProfile:
-        self.session.add(profile)
-        await self.session.commit()
-        await self.session.refresh(profile)
+        await save(self.session, profile)
+        await self._invalidate_principal(profile.user_id)
         return profile
 
     async def add_points(self, business_id: UUID, points: int) -> int:
-        profile = await self.get_by_id(business_id)
+        # Increment in the database so concurrent awards cannot overwrite
+        # each other; RETURNING hands back the new total in the same trip.
+        profile = await update_returning(
+            self.session,
+            BusinessProfile,
+            BusinessProfile.id == business_id,  # type: ignore
+            {"total_points": func.coalesce(BusinessProfile.total_points, 0) + points},
+        )
         if profile:
-            current = profile.total_points or 0
-            profile.total_points = current + points
-            self.session.add(profile)
-            await self.session.commit()
-            await self.session.refresh(profile)
+            await self._invalidate_principal(profile.user_id)
             return profile.total_points
         return 0
 
@@ -55,20 +81,18 @@ class BusinessRepository:
         return result
 
     async def create_level(self, level: BusinessLevel) -> BusinessLevel:
-        self.session.add(level)
-        await self.session.commit()
-        await self.session.refresh(level)
-        return level
+        return await save(self.session, level)
 
     async def update_level(self, level: BusinessLevel) -> BusinessLevel:
-        self.session.add(level)
-        await self.session.commit()
-        await self.session.refresh(level)
+        await save(self.session, level)
+        # Cached principals embed their level, so drop them all
+        await self._invalidate_principal()
         return level
 
     async def delete_level(self, level: BusinessLevel) -> None:
         await self.session.delete(level)
-        await self.session.commit()
+        await self.session.flush()
+        await self._invalidate_principal()
 
     async def get_level_by_points(self, points: int) -> BusinessLevel | None:
         # Find the highest level where required_points <= points
@@ -81,6 +105,7 @@ class BusinessRepository:
         result = await self.session.execute(stmt)
         return result.scalars().first()
 
+    @read_only
     async def get_top_businesses(
         self, limit: int = 10
     ) -> Sequence[tuple[BusinessProfile, User, BusinessLevel | None]]:
@@ -96,6 +121,19 @@ class BusinessRepository:
         result = await self.session.execute(stmt)
         return result.all()  # type: ignore
 
+    async def get_with_owner(
+        self, business_id: UUID
+    ) -> tuple[BusinessProfile, User, BusinessLevel | None] | None:
+        stmt = (
+            select(BusinessProfile, User, BusinessLevel)
+            .join(User, BusinessProfile.user_id == User.id)  # type: ignore
+            .join(BusinessLevel, BusinessProfile.level_id == BusinessLevel.id, isouter=True)  # type: ignore
+            .where(BusinessProfile.id == business_id)
+        )
+        result = await self.session.execute(stmt)
+        return result.first()  # type: ignore
+
+    @read_only
     async def calculate_rank(self, points: int) -> int:
         stmt = (
             select(func.count())
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.responses import StreamingResponse
 from typing import List
 from app.core.utils import format_sse
@@ -11,8 +11,8 @@ from app.modules.business.models import (
 from app.modules.business.repository import BusinessRepository
 from app.modules.business.service import BusinessService
 from app.modules.business.dependencies import get_business_service, get_business_repo
-from app.modules.auth.dependencies import get_current_user
-from app.modules.auth.models import User
+from app.modules.auth.dependencies import get_current_user, get_current_principal
+from app.modules.auth.models import User, CurrentPrincipal
 
 router = APIRouter()
 
@@ -40,11 +40,15 @@ async def create_business_profile(
 
 @router.get("/profile", response_model=BusinessProfileRead)
 async def get_business_profile(
-    current_user: User = Depends(get_current_user),
-    service: BusinessService = Depends(get_business_service),
+    principal: CurrentPrincipal = Depends(get_current_principal),
 ):
     """Get the business profile of the current user."""
-    return await service.get_profile(current_user.id)
+    if not principal.business:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Business profile not found",
+        )
+    return BusinessService.to_read(principal.business, principal.level)
 
 
 @router.patch("/profile", response_model=BusinessProfileRead)
@@ -2,13 +2,13 @@ from uuid import UUID
 from typing import AsyncGenerator
 from fastapi import HTTPException, status
 from app.modules.business.models import (
+    BusinessLevel,
     BusinessProfile,
     BusinessProfileCreate,
     BusinessProfileUpdate,
     BusinessProfileRead,
 )
 from app.modules.business.repository import BusinessRepository
-from app.modules.finance.repository import FinanceRepository
 from app.modules.agent.service import AgentService
 from app.db.session import AsyncSessionLocal
 from app.core.utils import format_sse
@@ -19,6 +19,16 @@ class BusinessService:
     def __init__(self, repo: BusinessRepository):
         self.repo = repo
 
+    @staticmethod
+    def to_read(
+        profile: BusinessProfile, level: BusinessLevel | None = None
+    ) -> BusinessProfileRead:
+        profile_read = BusinessProfileRead.model_validate(profile)
+        if level:
+            profile_read.level_name = level.name
+            profile_read.level_icon = level.icon
+        return profile_read
+
     async def get_profile(self, user_id: UUID) -> BusinessProfileRead:
         profile = await self.repo.get_by_user_id(user_id)
         if not profile:
@@ -27,18 +37,11 @@ class BusinessService:
                 detail="Business profile not found",
             )
 
-        level_name = None
-        level_icon = None
+        level = None
         if profile.level_id:
             level = await self.repo.get_level(profile.level_id)
-            if level:
-                level_name = level.name
-                level_icon = level.icon
 
-        profile_read = BusinessProfileRead.model_validate(profile)
-        profile_read.level_name = level_name
-        profile_read.level_icon = level_icon
-        return profile_read
+        return self.to_read(profile, level)
 
     async def create_profile(
         self, user_id: UUID, profile_in: BusinessProfileCreate
@@ -51,11 +54,8 @@ class BusinessService:
             )
 
         profile = BusinessProfile(user_id=user_id, **profile_in.model_dump())
-        profile = await self.repo.create(profile)
-        finance_repo = FinanceRepository(self.repo.session)
-        await finance_repo.create_default_categories(profile.id)
-
-        return profile
+        # Default transaction categories are shared system rows; nothing to copy
+        return await self.repo.create(profile)
 
     async def update_profile(
         self, user_id: UUID, profile_in: BusinessProfileUpdate
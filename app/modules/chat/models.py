@@ -2,7 +2,7 @@ from sqlmodel import SQLModel, Field, Relationship
 from uuid import UUID, uuid4
 from datetime import datetime, timezone
 from typing import List, Optional
-from sqlalchemy import Column, DateTime
+from sqlalchemy import Column, DateTime, Index
 
 
 class ChatSessionBase(SQLModel):
@@ -29,6 +29,15 @@ class ChatSession(ChatSessionBase, table=True):
         return self.deleted_at is not None
 
 
+# Session list per business, newest first
+Index(
+    "ix_chat_sessions_business_id_created_at_live",
+    ChatSession.business_id,
+    ChatSession.created_at.desc(),  # type: ignore
+    postgresql_where=ChatSession.deleted_at.is_(None),  # type: ignore
+)
+
+
 class ChatMessageBase(SQLModel):
     role: str = Field(index=True)
     content: str
@@ -54,6 +63,14 @@ class ChatMessage(ChatMessageBase, table=True):
         return self.deleted_at is not None
 
 
+# Message history of a session in chronological order
+Index(
+    "ix_chat_messages_session_id_created_at",
+    ChatMessage.session_id,
+    ChatMessage.created_at,
+)
+
+
 class ChatMessageCreate(SQLModel):
     content: str
     session_id: Optional[UUID] = None
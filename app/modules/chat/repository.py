@@ -2,6 +2,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
 from uuid import UUID
 from typing import Sequence
+from app.db.persistence import save
+from app.db.routing import read_only
 from app.modules.chat.models import ChatMessage, ChatSession
 
 
@@ -10,10 +12,7 @@ class ChatRepository:
         self.session = session
 
     async def create_session(self, session_data: ChatSession) -> ChatSession:
-        self.session.add(session_data)
-        await self.session.commit()
-        await self.session.refresh(session_data)
-        return session_data
+        return await save(self.session, session_data)
 
     async def get_session(self, session_id: UUID) -> ChatSession | None:
         statement = (
@@ -24,6 +23,7 @@ class ChatRepository:
         result = await self.session.execute(statement)
         return result.scalars().first()
 
+    @read_only
     async def get_sessions_by_business(
         self, business_id: UUID
     ) -> Sequence[ChatSession]:
@@ -37,11 +37,9 @@ class ChatRepository:
         return result.scalars().all()
 
     async def create_message(self, message: ChatMessage) -> ChatMessage:
-        self.session.add(message)
-        await self.session.commit()
-        await self.session.refresh(message)
-        return message
+        return await save(self.session, message)
 
+    @read_only
     async def get_history(
         self, session_id: UUID, limit: int = 50
     ) -> Sequence[ChatMessage]:
@@ -57,5 +55,4 @@ class ChatRepository:
     async def delete_session(self, session: ChatSession) -> None:
         from datetime import datetime, timezone
         session.deleted_at = datetime.now(timezone.utc)
-        self.session.add(session)
-        await self.session.commit()
+        await save(self.session, session)
@@ -125,6 +125,9 @@ class ChatService:
             content=message_in.content,
         )
         await self.repo.create_message(user_msg)
+        # Streaming outlives the request's unit of work; commit before the
+        # long-running agent call so no transaction is held open meanwhile
+        await self.repo.session.commit()
 
         history_msgs = await self.repo.get_history(session_id, limit=10)
         chat_history = [
@@ -200,6 +203,7 @@ class ChatService:
                 content=full_response_text,
             )
             await self.repo.create_message(assistant_msg)
+            await self.repo.session.commit()
 
         except Exception as e:
             logger.error(f"Chat Error: {e}")
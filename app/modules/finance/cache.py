@@ -0,0 +1,97 @@
+from dataclasses import dataclass, field
+from uuid import UUID
+from typing import Any
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.modules.finance.models import FinancialSummary, TransactionCategoryRead
+
+# NOTIFY channel carrying the id of a business whose categories changed
+# ("*" for all businesses)
+CATEGORY_CHANNEL = "finance_categories_changed"
+
+
+@dataclass
+class CategorySet:
+    """A business's categories as detached read models, plus an id index."""
+
+    categories: list[TransactionCategoryRead]
+    by_id: dict[UUID, TransactionCategoryRead] = field(default_factory=dict)
+
+    def __post_init__(self):
+        self.by_id = {c.id: c for c in self.categories}
+
+
+class CategoryCache:
+    """
+    Caches each business's category list so that validating a transaction's
+    category is a dictionary lookup.
+
+    Versioned per business: a list loaded before an invalidation is never
+    stored.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self._cache: TTLCache[UUID, tuple[tuple[int, int], CategorySet]] = TTLCache(
+            maxsize, ttl
+        )
+        self._epoch = 0
+        self._versions: dict[UUID, int] = {}
+
+    def version(self, business_id: UUID) -> tuple[int, int]:
+        return self._epoch, self._versions.get(business_id, 0)
+
+    def get(self, business_id: UUID) -> CategorySet | None:
+        entry = self._cache.get(business_id)
+        if entry is None:
+            return None
+
+        version, categories = entry
+        if version != self.version(business_id):
+            self._cache.pop(business_id)
+            return None
+        return categories
+
+    def set(
+        self, business_id: UUID, categories: CategorySet, version: tuple[int, int]
+    ) -> None:
+        if version != self.version(business_id):
+            return
+        self._cache.set(business_id, (version, categories))
+
+    def invalidate(self, business_id: UUID) -> None:
+        self._versions[business_id] = self._versions.get(business_id, 0) + 1
+        self._cache.pop(business_id)
+
+    def clear(self) -> None:
+        self._epoch += 1
+        self._versions.clear()
+        self._cache.clear()
+
+    def handle_notification(self, payload: str) -> None:
+        """Applies an invalidation sent by another worker."""
+        if payload == "*":
+            self.clear()
+            return
+        try:
+            self.invalidate(UUID(payload))
+        except ValueError:
+            self.clear()
+
+    def stats(self) -> dict[str, Any]:
+        return self._cache.stats()
+
+
+category_cache = CategoryCache(
+    maxsize=settings.CATEGORY_CACHE_MAX_SIZE,
+    ttl=settings.CATEGORY_CACHE_TTL_SECONDS,
+)
+
+
+# (business_id, period, compare) -> (etag, summary). The ETag embeds the
+# business's finance version, so a write anywhere makes the entry unusable.
+summary_cache: TTLCache[tuple[UUID, str, bool], tuple[str, FinancialSummary]] = (
+    TTLCache(
+        maxsize=settings.SUMMARY_CACHE_MAX_SIZE,
+        ttl=settings.SUMMARY_CACHE_TTL_SECONDS,
+    )
+)
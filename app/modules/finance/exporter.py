@@ -0,0 +1,66 @@
+import csv
+import io
+import json
+from typing import Any, AsyncIterator, Sequence
+from zoneinfo import ZoneInfo
+from app.core.config import settings
+
+# Same column names the importer accepts, so an export can be re-imported
+EXPORT_COLUMNS = (
+    "id",
+    "date",
+    "type",
+    "amount",
+    "category",
+    "payment_method",
+    "description",
+)
+
+EXPORT_MEDIA_TYPES = {
+    "csv": "text/csv; charset=utf-8",
+    "ndjson": "application/x-ndjson",
+}
+
+
+def _values(row: Sequence[Any], tz: ZoneInfo) -> list[Any]:
+    id_, date, type_, amount, category, method, description = row
+    return [
+        str(id_),
+        date.astimezone(tz).isoformat(),
+        type_,
+        str(amount),
+        category,
+        method,
+        description,
+    ]
+
+
+async def csv_chunks(
+    batches: AsyncIterator[Sequence[Sequence[Any]]],
+) -> AsyncIterator[str]:
+    """Renders batches of export rows as CSV text, one chunk per batch."""
+    tz = ZoneInfo(settings.TIMEZONE)
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    writer.writerow(EXPORT_COLUMNS)
+    async for batch in batches:
+        writer.writerows(_values(row, tz) for row in batch)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue()  # header only: no transactions
+
+
+async def ndjson_chunks(
+    batches: AsyncIterator[Sequence[Sequence[Any]]],
+) -> AsyncIterator[str]:
+    """Renders batches of export rows as NDJSON, one chunk per batch."""
+    tz = ZoneInfo(settings.TIMEZONE)
+    async for batch in batches:
+        yield "".join(
+            json.dumps(dict(zip(EXPORT_COLUMNS, _values(row, tz))), ensure_ascii=False)
+            + "\n"
+            for row in batch
+        )
@@ -0,0 +1,159 @@
+"""
+Batched cash-flow forecasting.
+
+Daily net cash flow (income - expense) of up to `BATCH_SIZE` businesses is
+loaded from the daily rollups into one businesses x days matrix, and every
+statistic is computed for all rows at once with NumPy; there is no Python
+loop per business or per day.
+"""
+
+import asyncio
+from datetime import date, datetime, timedelta, timezone
+from typing import Optional, Sequence
+from uuid import UUID
+from zoneinfo import ZoneInfo
+import numpy as np
+from sqlalchemy import func, select
+from app.core.config import settings
+from app.core.logging import logger
+from app.db.session import unit_of_work
+from app.modules.finance.repository import FinanceRepository
+
+HISTORY_DAYS = 90
+HORIZON_DAYS = 30
+SMOOTHING_ALPHA = 0.3  # weight of the newest day in exponential smoothing
+TREND_DAMPING = 0.9  # trend contribution shrinks by this factor each day
+BATCH_SIZE = 1000
+
+# pg_try_advisory_xact_lock key so only one worker refreshes at a time
+REFRESH_LOCK_KEY = 0x7E1A7E4F
+
+
+def history_window(today: Optional[date] = None) -> tuple[date, date]:
+    """The last `HISTORY_DAYS` complete local days, ending yesterday."""
+    today = today or datetime.now(ZoneInfo(settings.TIMEZONE)).date()
+    end = today - timedelta(days=1)
+    return end - timedelta(days=HISTORY_DAYS - 1), end
+
+
+def build_matrix(
+    business_ids: Sequence[UUID],
+    rows: Sequence[tuple[UUID, date, float]],
+    start: date,
+    days: int = HISTORY_DAYS,
+) -> np.ndarray:
+    """Scatters (business, day, net) rows into a zero-filled matrix."""
+    matrix = np.zeros((len(business_ids), days))
+    if rows:
+        index = {business_id: i for i, business_id in enumerate(business_ids)}
+        ids, days_, values = zip(*rows)
+        matrix[
+            [index[b] for b in ids],
+            [(d - start).days for d in days_],
+        ] = values
+    return matrix
+
+
+def forecast(matrix: np.ndarray) -> dict[str, np.ndarray]:
+    """
+    Computes per-row statistics of a businesses x days matrix (oldest day
+    first): 7/28-day moving averages, the exponentially smoothed level, the
+    least-squares daily trend and a damped-trend projection of the next
+    `HORIZON_DAYS` days.
+    """
+    days = matrix.shape[1]
+
+    # Exponential smoothing as one weighted sum: the level after the last
+    # day gives weight alpha * (1 - alpha)^age to each day and the rest to
+    # the first day, which seeds the level.
+    age = np.arange(days - 1, -1, -1)
+    weights = SMOOTHING_ALPHA * (1 - SMOOTHING_ALPHA) ** age
+    weights[0] = (1 - SMOOTHING_ALPHA) ** (days - 1)
+    level = matrix @ weights
+
+    # Ordinary least squares slope against the centred day index
+    t = np.arange(days) - (days - 1) / 2
+    trend = matrix @ t / (t @ t)
+
+    # Damped trend: day h adds trend * (phi + phi^2 + ... + phi^h)
+    damping = np.cumsum(TREND_DAMPING ** np.arange(1, HORIZON_DAYS + 1))
+    projection = level[:, None] + trend[:, None] * damping[None, :]
+
+    return {
+        "observed_days": np.count_nonzero(matrix, axis=1),
+        "moving_average_7d": matrix[:, -7:].mean(axis=1),
+        "moving_average_28d": matrix[:, -28:].mean(axis=1),
+        "smoothed_daily_net": level,
+        "trend_per_day": trend,
+        "projected_net_30d": projection.sum(axis=1),
+        "projection": np.round(projection, 2),
+    }
+
+
+async def refresh_batch(
+    repo: FinanceRepository, business_ids: Sequence[UUID], today: Optional[date] = None
+) -> None:
+    """Recomputes and stores the forecasts of `business_ids` in one pass."""
+    if not business_ids:
+        return
+    start, end = history_window(today)
+    rows = await repo.get_daily_net(business_ids, start, end)
+    stats = forecast(build_matrix(business_ids, rows, start))
+
+    now = datetime.now(timezone.utc)
+    await repo.upsert_forecasts(
+        [
+            {
+                "business_id": business_id,
+                "as_of": end,
+                "computed_at": now,
+                "observed_days": int(stats["observed_days"][i]),
+                "moving_average_7d": round(float(stats["moving_average_7d"][i]), 2),
+                "moving_average_28d": round(float(stats["moving_average_28d"][i]), 2),
+                "smoothed_daily_net": round(float(stats["smoothed_daily_net"][i]), 2),
+                "trend_per_day": round(float(stats["trend_per_day"][i]), 2),
+                "projected_net_30d": round(float(stats["projected_net_30d"][i]), 2),
+                "projection": stats["projection"][i].tolist(),
+            }
+            for i, business_id in enumerate(business_ids)
+        ]
+    )
+
+
+async def refresh_all(repo: FinanceRepository) -> Optional[int]:
+    """
+    Refreshes every business with activity in the history window, in
+    batches of `BATCH_SIZE`. Returns the number of forecasts written, or
+    None if another worker holds the refresh lock.
+    """
+    locked = await repo.session.execute(
+        select(func.pg_try_advisory_xact_lock(REFRESH_LOCK_KEY))
+    )
+    if not locked.scalar():
+        return None
+
+    start, _ = history_window()
+    refreshed = 0
+    after = None
+    while True:
+        business_ids = await repo.get_active_business_ids(start, after, BATCH_SIZE)
+        if not business_ids:
+            return refreshed
+        await refresh_batch(repo, business_ids)
+        refreshed += len(business_ids)
+        after = business_ids[-1]
+
+
+async def refresh_loop(interval_minutes: int) -> None:
+    """Background task that refreshes all forecasts every interval."""
+    while True:
+        try:
+            async with unit_of_work() as session:
+                refreshed = await refresh_all(FinanceRepository(session))
+            if refreshed is not None:
+                logger.info("Cash-flow forecasts refreshed", businesses=refreshed)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error("Cash-flow forecast refresh failed", error=str(e))
+        await asyncio.sleep(interval_minutes * 60)
@@ -0,0 +1,129 @@
+import codecs
+import csv
+import json
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from decimal import Decimal, InvalidOperation
+from typing import Any, AsyncIterator, Optional
+from zoneinfo import ZoneInfo
+from app.core.config import settings
+
+CSV_CONTENT_TYPES = ("text/csv", "application/csv")
+NDJSON_CONTENT_TYPES = ("application/x-ndjson", "application/jsonl")
+
+MAX_AMOUNT = Decimal("10000000000")  # Numeric(12, 2)
+
+
+@dataclass
+class RawRow:
+    """One record of an upload; `row` is the line it starts on."""
+
+    row: int
+    data: Optional[dict[str, Any]] = None
+    error: Optional[str] = None
+
+
+async def iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    """
+    Splits a byte stream into text lines without buffering the whole body.
+    Handles UTF-8 (with or without BOM) sequences split across chunks.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    buffer = ""
+    async for chunk in chunks:
+        buffer += decoder.decode(chunk)
+        *lines, buffer = buffer.split("\n")
+        for line in lines:
+            yield line.rstrip("\r")
+    buffer += decoder.decode(b"", final=True)
+    if buffer:
+        yield buffer.rstrip("\r")
+
+
+async def iter_csv_rows(chunks: AsyncIterator[bytes]) -> AsyncIterator[RawRow]:
+    """
+    Parses a CSV upload with a header row. Quoted fields may span lines.
+    Header names are matched case-insensitively.
+    """
+    header: Optional[list[str]] = None
+    pending: list[str] = []
+    quotes = 0
+    line_no = start = 0
+
+    async for line in iter_lines(chunks):
+        line_no += 1
+        if not pending:
+            start = line_no
+        pending.append(line)
+        quotes += line.count('"')
+        if quotes % 2:
+            continue  # inside a quoted field
+
+        text = "\n".join(pending)
+        pending, quotes = [], 0
+        if not text.strip():
+            continue
+
+        values = next(csv.reader([text]))
+        if header is None:
+            header = [name.strip().lower() for name in values]
+            continue
+        yield RawRow(start, data=dict(zip(header, values)))
+
+    if pending:
+        yield RawRow(start, error="Unterminated quoted field")
+
+
+async def iter_ndjson_rows(chunks: AsyncIterator[bytes]) -> AsyncIterator[RawRow]:
+    """Parses newline-delimited JSON: one transaction object per line."""
+    line_no = 0
+    async for line in iter_lines(chunks):
+        line_no += 1
+        if not line.strip():
+            continue
+        try:
+            data = json.loads(line)
+        except json.JSONDecodeError as e:
+            yield RawRow(line_no, error=f"Invalid JSON: {e.msg}")
+            continue
+        if not isinstance(data, dict):
+            yield RawRow(line_no, error="Expected a JSON object")
+            continue
+        yield RawRow(line_no, data={str(k).lower(): v for k, v in data.items()})
+
+
+def field(data: dict[str, Any], *names: str) -> Optional[str]:
+    """First non-empty value among `names`, as a stripped string."""
+    for name in names:
+        value = data.get(name)
+        if value is not None and str(value).strip() != "":
+            return str(value).strip()
+    return None
+
+
+def parse_amount(value: Optional[str]) -> Decimal:
+    if value is None:
+        raise ValueError("Missing amount")
+    try:
+        amount = Decimal(value).quantize(Decimal("0.01"))
+    except InvalidOperation:
+        raise ValueError(f"Invalid amount: {value}")
+    if not 0 < amount < MAX_AMOUNT:
+        raise ValueError(f"Amount out of range: {value}")
+    return amount
+
+
+def parse_date(value: Optional[str]) -> datetime:
+    """
+    ISO 8601 date or datetime. Values without an offset are local time in
+    `settings.TIMEZONE`, as they are typed into spreadsheets.
+    """
+    if value is None:
+        return datetime.now(timezone.utc)
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        raise ValueError(f"Invalid date: {value}")
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=ZoneInfo(settings.TIMEZONE))
+    return parsed
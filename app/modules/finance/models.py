@@ -1,8 +1,18 @@
 from sqlmodel import SQLModel, Field, Relationship
 from uuid import UUID, uuid4
-from datetime import datetime, timezone
+from datetime import date, datetime, timezone
 from typing import Optional
-from sqlalchemy import Column, DateTime, Numeric
+from sqlalchemy import (
+    JSON,
+    BigInteger,
+    Column,
+    Date,
+    DateTime,
+    Index,
+    Numeric,
+    PrimaryKeyConstraint,
+)
+from app.core.config import settings
 
 
 class TransactionCategoryBase(SQLModel):
@@ -25,8 +35,20 @@ class TransactionCategory(TransactionCategoryBase, table=True):
     )
 
 
+# System default categories (business_id NULL) are shared by every business
+# and stored once per name and type
+Index(
+    "uq_transaction_categories_system_type_name",
+    TransactionCategory.type,
+    TransactionCategory.name,
+    unique=True,
+    postgresql_where=TransactionCategory.business_id.is_(None),  # type: ignore
+)
+
+
 class TransactionCategoryRead(TransactionCategoryBase):
     id: UUID
+    business_id: Optional[UUID] = None
 
 
 class TransactionCategoryCreate(TransactionCategoryBase):
@@ -49,10 +71,23 @@ class TransactionBase(SQLModel):
     )
 
 
+def _transaction_table_args() -> tuple:
+    # A partitioned table's primary key must contain the partition key, so
+    # the table key becomes (id, transaction_date); the ORM keeps using `id`.
+    if settings.TRANSACTIONS_PARTITIONED:
+        return (
+            PrimaryKeyConstraint("id", "transaction_date"),
+            {"postgresql_partition_by": "RANGE (transaction_date)"},
+        )
+    return (PrimaryKeyConstraint("id"),)
+
+
 class Transaction(TransactionBase, table=True):
     __tablename__ = "transactions"  # type: ignore
+    __table_args__ = _transaction_table_args()
+    __mapper_args__ = {"primary_key": ["id"]}
 
-    id: UUID = Field(default_factory=uuid4, primary_key=True)
+    id: UUID = Field(default_factory=uuid4)
     business_id: UUID = Field(foreign_key="business_profiles.id", index=True)
     category: Optional["TransactionCategory"] = Relationship()
 
@@ -62,6 +97,151 @@ class Transaction(TransactionBase, table=True):
     )
 
 
+# Transaction list (newest first, keyset on date + id) and date-bounded
+# summaries per business
+Index(
+    "ix_transactions_business_id_transaction_date",
+    Transaction.business_id,
+    Transaction.transaction_date.desc(),  # type: ignore
+    Transaction.id.desc(),  # type: ignore
+)
+
+
+class FinanceDailyRollup(SQLModel, table=True):
+    """
+    Per-day totals of a business's transactions, maintained in the same
+    database transaction as every insert/delete. `day` is the local date in
+    `settings.TIMEZONE`.
+    """
+
+    __tablename__ = "finance_daily_rollups"  # type: ignore
+
+    business_id: UUID = Field(foreign_key="business_profiles.id", primary_key=True)
+    day: date = Field(sa_column=Column(Date, primary_key=True))
+    type: str = Field(primary_key=True)
+    category_name: str = Field(primary_key=True)
+    payment_method: str = Field(primary_key=True)
+    total_amount: float = Field(
+        default=0, sa_column=Column(Numeric(14, 2), nullable=False)
+    )
+    tx_count: int = Field(default=0)
+
+
+class FinanceVersion(SQLModel, table=True):
+    """
+    Counter bumped in the same transaction as every change to a business's
+    transactions; cached finance aggregates and ETags are keyed by it.
+    """
+
+    __tablename__ = "finance_versions"  # type: ignore
+
+    business_id: UUID = Field(foreign_key="business_profiles.id", primary_key=True)
+    version: int = Field(default=0, sa_column=Column(BigInteger, nullable=False))
+
+
+class FinanceForecastBase(SQLModel):
+    as_of: date = Field(sa_column=Column(Date, nullable=False))
+    observed_days: int = 0
+    moving_average_7d: float = 0
+    moving_average_28d: float = 0
+    smoothed_daily_net: float = 0
+    trend_per_day: float = 0
+    projected_net_30d: float = 0
+    projection: list[float] = Field(default_factory=list, sa_column=Column(JSON))
+
+
+class FinanceForecast(FinanceForecastBase, table=True):
+    """
+    Latest cash-flow forecast per business, recomputed in batches by
+    `app.modules.finance.forecast`. `as_of` is the last local day of history
+    used; `projection` holds the expected net cash flow of each next day.
+    """
+
+    __tablename__ = "finance_forecasts"  # type: ignore
+
+    business_id: UUID = Field(foreign_key="business_profiles.id", primary_key=True)
+    computed_at: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc),
+        sa_column=Column(DateTime(timezone=True), nullable=False),
+    )
+
+
+class CashFlowForecast(FinanceForecastBase):
+    computed_at: datetime
+
+
+RECURRING_FREQUENCIES = ("daily", "weekly", "monthly", "yearly")
+
+
+class RecurringTransactionBase(SQLModel):
+    amount: float = Field(sa_column=Column(Numeric(12, 2), nullable=False))
+    type: str = Field(description="INCOME or EXPENSE")
+    category_id: UUID = Field(foreign_key="transaction_categories.id")
+    payment_method: str = Field(default="CASH", description="CASH, TRANSFER, QRIS, ETC")
+    description: Optional[str] = None
+    frequency: str = Field(description="daily, weekly, monthly or yearly")
+    every: int = Field(default=1, description="Repeat every N periods")
+    start_date: date = Field(sa_column=Column(Date, nullable=False))
+    end_date: Optional[date] = Field(default=None, sa_column=Column(Date))
+
+
+class RecurringTransaction(RecurringTransactionBase, table=True):
+    """
+    Template of a transaction that repeats. Occurrence n falls on
+    `start_date + n * every * frequency` (month ends are clamped, as in
+    PostgreSQL date arithmetic); `occurrences` counts those already
+    materialized and `next_run_date` is the date of the next one.
+    """
+
+    __tablename__ = "recurring_transactions"  # type: ignore
+
+    id: UUID = Field(default_factory=uuid4, primary_key=True)
+    business_id: UUID = Field(foreign_key="business_profiles.id", index=True)
+    category_name: str
+    occurrences: int = 0
+    next_run_date: date = Field(sa_column=Column(Date, nullable=False))
+    is_active: bool = True
+    created_at: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc),
+        sa_column=Column(DateTime(timezone=True), nullable=False),
+    )
+    last_run_at: Optional[datetime] = Field(
+        default=None, sa_column=Column(DateTime(timezone=True))
+    )
+
+
+# Due templates for the scheduler
+Index(
+    "ix_recurring_transactions_next_run_date_active",
+    RecurringTransaction.next_run_date,
+    postgresql_where=RecurringTransaction.is_active,  # type: ignore
+)
+
+
+class RecurringTransactionCreate(RecurringTransactionBase):
+    start_date: Optional[date] = None  # defaults to today
+    end_date: Optional[date] = None
+
+
+class RecurringTransactionUpdate(SQLModel):
+    amount: Optional[float] = None
+    payment_method: Optional[str] = None
+    description: Optional[str] = None
+    end_date: Optional[date] = None
+    is_active: Optional[bool] = None
+
+
+class RecurringTransactionRead(RecurringTransactionBase):
+    id: UUID
+    business_id: UUID
+    category_name: str
+    occurrences: int
+    next_run_date: date
+    is_active: bool
+    created_at: datetime
+    last_run_at: Optional[datetime] = None
+
+
 class TransactionRead(TransactionBase):
     id: UUID
     business_id: UUID
@@ -76,6 +256,13 @@ class TransactionPagination(SQLModel):
     pages: int
 
 
+class TransactionCursorPage(SQLModel):
+    items: list[TransactionRead]
+    next_cursor: Optional[str] = None
+    size: int
+    total: Optional[int] = None
+
+
 class TransactionCreate(SQLModel):
     amount: float
     type: str
@@ -87,12 +274,85 @@ class TransactionCreate(SQLModel):
     transaction_date: Optional[datetime] = None
 
 
+class TransactionBatchItem(TransactionCreate):
+    # Client-generated id; resending an item with the same id is a no-op
+    id: Optional[UUID] = None
+
+
+class TransactionBatchCreate(SQLModel):
+    transactions: list[TransactionBatchItem]
+
+
+class TransactionBatchResult(SQLModel):
+    created: list[TransactionRead] = []
+    duplicates: list[UUID] = []
+    # Credited after the commit by the outbox dispatcher, not yet received
+    points_pending: int = 0
+
+
 class CategoryBreakdown(SQLModel):
     category: str
     amount: float
     percentage: float
 
 
+class PaymentMethodBreakdown(SQLModel):
+    payment_method: str
+    income: float
+    expense: float
+    percentage_of_income: float
+    percentage_of_expense: float
+
+
+class TransactionImportError(SQLModel):
+    row: int
+    error: str
+
+
+class TransactionImportResult(SQLModel):
+    imported: int = 0
+    failed: int = 0
+    errors: list[TransactionImportError] = []
+    # Credited after the commit by the outbox dispatcher, not yet received
+    points_pending: int = 0
+
+
+class CashFlowTimeSeries(SQLModel):
+    """Columnar series: the i-th value of each array belongs to buckets[i]."""
+
+    bucket: str
+    buckets: list[date]
+    income: list[float]
+    expense: list[float]
+    net: list[float]
+
+
+class CategoryComparison(SQLModel):
+    category: str
+    type: str
+    current: float
+    previous: float
+    change: float
+    growth: Optional[float] = None  # percent; None when previous is 0
+
+
+class SummaryComparison(SQLModel):
+    """The previous period of the same length and the change against it."""
+
+    period_start: datetime
+    period_end: datetime
+    total_income: float
+    total_expense: float
+    net_profit: float
+    income_change: float
+    expense_change: float
+    net_profit_change: float
+    income_growth: Optional[float] = None
+    expense_growth: Optional[float] = None
+    net_profit_growth: Optional[float] = None
+    categories: list[CategoryComparison] = []
+
+
 class FinancialSummary(SQLModel):
     total_income: float
     total_expense: float
@@ -101,3 +361,5 @@ class FinancialSummary(SQLModel):
     period_end: Optional[datetime] = None
     income_breakdown: list[CategoryBreakdown] = []
     expense_breakdown: list[CategoryBreakdown] = []
+    payment_method_breakdown: list[PaymentMethodBreakdown] = []
+    comparison: Optional[SummaryComparison] = None
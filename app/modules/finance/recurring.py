@@ -0,0 +1,34 @@
+"""
+Scheduler for recurring transactions: materializes the due occurrences of
+every business's templates (see `FinanceService.materialize_recurring`).
+"""
+
+import asyncio
+from app.core.logging import logger
+from app.db.session import unit_of_work
+from app.modules.business.repository import BusinessRepository
+from app.modules.finance.repository import FinanceRepository
+from app.modules.finance.service import FinanceService
+
+
+async def materialize_due() -> int:
+    """One run over all businesses; returns the transactions created."""
+    async with unit_of_work() as session:
+        service = FinanceService(
+            FinanceRepository(session), BusinessRepository(session)
+        )
+        return await service.materialize_recurring()
+
+
+async def materialize_loop(interval_minutes: int) -> None:
+    """Background task that materializes due occurrences every interval."""
+    while True:
+        try:
+            created = await materialize_due()
+            if created:
+                logger.info("Recurring transactions materialized", transactions=created)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error("Recurring transaction run failed", error=str(e))
+        await asyncio.sleep(interval_minutes * 60)
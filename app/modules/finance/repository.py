@@ -1,10 +1,150 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy import (
+    Date,
+    DateTime,
+    Row,
+    and_,
+    case,
+    cast,
+    delete,
+    literal,
+    literal_column,
+    or_,
+    text,
+    tuple_,
+    union_all,
+    update,
+)
+from sqlalchemy.dialects.postgresql import insert
 from sqlmodel import select, desc, func
-from uuid import UUID
-from typing import Sequence, Optional
-from datetime import datetime
-from app.modules.finance.models import Transaction, TransactionCategory
+from uuid import UUID, uuid4
+from typing import AsyncIterator, Sequence, Optional
+from datetime import date, datetime, time, timedelta, timezone
+from dataclasses import dataclass, field
+from functools import partial
+from zoneinfo import ZoneInfo
+from app.core.config import settings
+from app.db.notifications import notify
+from app.db.partitions import list_partitions
+from app.db.persistence import save
+from app.db.routing import pin_primary, read_only
+from app.db.session import on_commit
+from app.modules.finance.cache import CATEGORY_CHANNEL, category_cache
+from app.modules.finance.models import (
+    FinanceDailyRollup,
+    FinanceForecast,
+    FinanceVersion,
+    RecurringTransaction,
+    Transaction,
+    TransactionCategory,
+)
+
+ROLLUP_KEY = ("business_id", "day", "type", "category_name", "payment_method")
+TIMESERIES_BUCKETS = ("day", "week", "month")
+DEFAULT_CATEGORIES = [
+    # EXPENSE
+    {"name": "Bahan Baku", "type": "EXPENSE", "icon": "🛒"},
+    {"name": "Gaji Karyawan", "type": "EXPENSE", "icon": "👤"},
+    {"name": "Sewa Tempat", "type": "EXPENSE", "icon": "🏠"},
+    {"name": "Listrik & Air", "type": "EXPENSE", "icon": "⛏️"},
+    {"name": "Transportasi", "type": "EXPENSE", "icon": "🚚"},
+    {"name": "Pemasaran", "type": "EXPENSE", "icon": "📢"},
+    {"name": "Lainnya", "type": "EXPENSE", "icon": "♾️"},
+    # INCOME
+    {"name": "Penjualan", "type": "INCOME", "icon": "💲"},
+    {"name": "Investasi", "type": "INCOME", "icon": "📈"},
+    {"name": "Bonus", "type": "INCOME", "icon": "🤑"},
+    {"name": "Lainnya", "type": "INCOME", "icon": "🧲"},
+]
+EXPORT_BATCH_SIZE = 1000
+COPY_COLUMNS = (
+    "id",
+    "business_id",
+    "amount",
+    "type",
+    "category_id",
+    "category_name",
+    "payment_method",
+    "description",
+    "transaction_date",
+    "created_at",
+)
+
+RECURRING_BATCH_SIZE = 500
+
+# First key of the two-key pg_advisory_xact_lock serializing batch creates
+# with client ids per business (the second key is derived from its id)
+CLIENT_IDS_LOCK_CLASS = 0x7E1B
+# Occurrences materialized per template and run; longer backlogs (e.g. a
+# daily template started long ago) continue in the next batch
+RECURRING_MAX_CATCH_UP = 31
+# Frequencies in make_interval(years, months, weeks, days) argument order
+RECURRING_UNITS = ("yearly", "monthly", "weekly", "daily")
+
+
+@dataclass
+class SummaryStats:
+    """Aggregates of one period, keyed by transaction type."""
+
+    totals: dict[str, float] = field(
+        default_factory=lambda: {"INCOME": 0.0, "EXPENSE": 0.0}
+    )
+    categories: dict[str, dict[str, float]] = field(
+        default_factory=lambda: {"INCOME": {}, "EXPENSE": {}}
+    )
+    payment_methods: dict[str, dict[str, float]] = field(default_factory=dict)
+
+
+def _occurrence_date(template, n):
+    """
+    SQL date of occurrence `n` of a recurring template (`template` gives
+    its columns): start_date + make_interval(years, months, weeks, days).
+    """
+    steps = template.every * n
+    parts = [
+        case((template.frequency == frequency, steps), else_=0)
+        for frequency in RECURRING_UNITS
+    ]
+    return cast(template.start_date + func.make_interval(*parts), Date)
+
+
+def local_day(column):
+    """SQL expression for the local calendar date of a timestamptz column."""
+    return cast(func.timezone(settings.TIMEZONE, column), Date)
+
+
+def split_by_day(
+    start: Optional[datetime], end: datetime
+) -> tuple[Optional[date], date, Optional[tuple[datetime, datetime]], datetime]:
+    """
+    Splits [start, end] into whole local days [first_day, end_day) that can be
+    read from the rollups, plus the partial edges read from raw transactions:
+    a head [start, first midnight) and a tail [tail_start, end]. Naive
+    datetimes are taken as UTC, like asyncpg does.
+    """
+    tz = ZoneInfo(settings.TIMEZONE)
+
+    def aware(value: datetime) -> datetime:
+        return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+    def midnight(day: date) -> datetime:
+        return datetime.combine(day, time.min, tzinfo=tz)
+
+    end_day = aware(end).astimezone(tz).date()
+    if start is None:
+        return None, end_day, None, midnight(end_day)
+
+    local_start = aware(start).astimezone(tz)
+    first_day = local_start.date()
+    head = None
+    if local_start != midnight(first_day):
+        first_day += timedelta(days=1)
+        head = (start, midnight(first_day))
+    if first_day >= end_day:
+        # Shorter than a whole local day: read it all from raw rows
+        return first_day, first_day, None, start
+
+    return first_day, end_day, head, midnight(end_day)
 
 
 class FinanceRepository:
@@ -12,10 +152,20 @@ class FinanceRepository:
         self.session = session
 
     async def create(self, transaction: Transaction) -> Transaction:
-        self.session.add(transaction)
-        await self.session.commit()
-        await self.session.refresh(transaction)
-        return transaction
+        return await save(self.session, transaction)
+
+    def _business_transactions(
+        self,
+        business_id: UUID,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ):
+        statement = select(Transaction).where(Transaction.business_id == business_id)
+        if start_date:
+            statement = statement.where(Transaction.transaction_date >= start_date)
+        if end_date:
+            statement = statement.where(Transaction.transaction_date <= end_date)
+        return statement
 
     async def get_by_business_id(
         self,
@@ -25,88 +175,483 @@ class FinanceRepository:
         skip: int = 0,
         limit: int = 100,
     ) -> tuple[Sequence[Transaction], int]:
+        total = await self.count_by_business_id(business_id, start_date, end_date)
+
+        # Apply pagination
         statement = (
-            select(Transaction)
-            .where(Transaction.business_id == business_id)
-            .order_by(desc(Transaction.transaction_date))
-            .options(selectinload(Transaction.category))  # type: ignore
+            self._business_transactions(business_id, start_date, end_date)
+            .order_by(desc(Transaction.transaction_date), desc(Transaction.id))
+            .offset(skip)
+            .limit(limit)
         )
+        result = await self.session.execute(statement)
 
-        if start_date:
-            statement = statement.where(Transaction.transaction_date >= start_date)
-        if end_date:
-            statement = statement.where(Transaction.transaction_date <= end_date)
+        return result.scalars().all(), total
 
-        # Get total count
-        count_statement = select(func.count()).select_from(statement.subquery())
-        count_result = await self.session.execute(count_statement)
-        total = count_result.scalar_one()
+    async def stream_for_export(
+        self,
+        business_id: UUID,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> AsyncIterator[Sequence[Row]]:
+        """
+        Yields plain rows (id, date, type, amount, category, payment method,
+        description) oldest first, in batches of `EXPORT_BATCH_SIZE` fetched
+        from a server-side cursor, so memory does not grow with history.
+        """
+        statement = (
+            self._business_transactions(business_id, start_date, end_date)
+            .with_only_columns(
+                Transaction.id,
+                Transaction.transaction_date,
+                Transaction.type,
+                Transaction.amount,
+                Transaction.category_name,
+                Transaction.payment_method,
+                Transaction.description,
+            )
+            .order_by(Transaction.transaction_date, Transaction.id)  # type: ignore
+            .execution_options(yield_per=EXPORT_BATCH_SIZE)
+        )
+        result = await self.session.stream(statement)
+        async for batch in result.partitions():
+            yield batch
 
-        # Apply pagination
-        statement = statement.offset(skip).limit(limit)
+    async def count_by_business_id(
+        self,
+        business_id: UUID,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> int:
+        statement = self._business_transactions(
+            business_id, start_date, end_date
+        ).with_only_columns(func.count())
         result = await self.session.execute(statement)
+        return result.scalar_one()
 
-        return result.scalars().all(), total
+    async def get_page_after(
+        self,
+        business_id: UUID,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        after: Optional[tuple[datetime, UUID]] = None,
+        limit: int = 20,
+    ) -> Sequence[Transaction]:
+        """
+        Keyset pagination: the next `limit` transactions (newest first) that
+        sort strictly after the (transaction_date, id) key `after`.
+        """
+        statement = self._business_transactions(business_id, start_date, end_date)
+        if after:
+            statement = statement.where(
+                tuple_(Transaction.transaction_date, Transaction.id) < tuple_(*after)
+            )
+        statement = statement.order_by(
+            desc(Transaction.transaction_date), desc(Transaction.id)
+        ).limit(limit)
+        result = await self.session.execute(statement)
+        return result.scalars().all()
+
+    def _period_rows(
+        self,
+        business_id: UUID,
+        start_date: Optional[datetime],
+        end_date: datetime,
+        period: int,
+    ) -> list:
+        """
+        Selects (period, type, category, payment method, amount) rows that
+        sum to the totals of [start_date, end_date]. Whole local days come
+        from the daily rollups; only the partial days at the edges are read
+        from raw transactions.
+        """
+        first_day, end_day, head, tail_start = split_by_day(start_date, end_date)
 
+        rollups = select(
+            literal(period).label("period"),
+            FinanceDailyRollup.type,
+            FinanceDailyRollup.category_name,
+            FinanceDailyRollup.payment_method,
+            FinanceDailyRollup.total_amount.label("amount"),  # type: ignore
+        ).where(
+            FinanceDailyRollup.business_id == business_id,
+            FinanceDailyRollup.day < end_day,
+        )
+        if first_day is not None:
+            rollups = rollups.where(FinanceDailyRollup.day >= first_day)
+
+        edges = [
+            and_(
+                Transaction.transaction_date >= tail_start,
+                Transaction.transaction_date <= end_date,
+            )
+        ]
+        if head:
+            edges.append(
+                and_(
+                    Transaction.transaction_date >= head[0],
+                    Transaction.transaction_date < head[1],
+                )
+            )
+        raw = select(
+            literal(period).label("period"),
+            Transaction.type,
+            Transaction.category_name,
+            Transaction.payment_method,
+            Transaction.amount,
+        ).where(Transaction.business_id == business_id, or_(*edges))
+
+        return [rollups, raw]
+
+    async def _summarize(
+        self,
+        business_id: UUID,
+        periods: Sequence[tuple[Optional[datetime], datetime]],
+    ) -> list[SummaryStats]:
+        """
+        Totals, per-category and per-payment-method sums for each period in
+        one query: GROUPING SETS for the breakdowns and one FILTERed sum per
+        period.
+        """
+        combined = union_all(
+            *(
+                rows
+                for i, (start, end) in enumerate(periods)
+                for rows in self._period_rows(business_id, start, end, i)
+            )
+        ).subquery()
+        type_, category, method = (
+            combined.c.type,
+            combined.c.category_name,
+            combined.c.payment_method,
+        )
+        stmt = select(
+            type_,
+            category,
+            method,
+            func.grouping(category).label("category_rolled_up"),
+            func.grouping(method).label("method_rolled_up"),
+            *(
+                func.sum(combined.c.amount).filter(combined.c.period == i)
+                for i in range(len(periods))
+            ),
+        ).group_by(
+            func.grouping_sets(
+                tuple_(type_),
+                tuple_(type_, category),
+                tuple_(type_, method),
+            )
+        )
+
+        result = await self.session.execute(stmt)
+
+        stats = [SummaryStats() for _ in periods]
+        for type_, cat_name, method, no_category, no_method, *amounts in result.all():
+            if type_ not in ("INCOME", "EXPENSE"):
+                continue
+            for period, amount in zip(stats, amounts):
+                amount = float(amount or 0)
+                if not no_category:
+                    if amount:
+                        period.categories[type_][cat_name] = amount
+                elif not no_method:
+                    if amount:
+                        methods = period.payment_methods.setdefault(
+                            method, {"INCOME": 0.0, "EXPENSE": 0.0}
+                        )
+                        methods[type_] = amount
+                else:
+                    period.totals[type_] = amount
+        return stats
+
+    @read_only
     async def get_summary_stats(
         self,
         business_id: UUID,
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
-    ) -> tuple[float, float, dict, dict]:
+    ) -> SummaryStats:
         """
-        Calculates total income, total expense, and category breakdowns using SQL aggregation.
+        Calculates total income, total expense, and category and payment
+        method breakdowns in one GROUPING SETS query.
         """
-        # Base filter
-        filters = [Transaction.business_id == business_id]
-        if start_date:
-            filters.append(Transaction.transaction_date >= start_date)
-        if end_date:
-            filters.append(Transaction.transaction_date <= end_date)
+        end_date = end_date or datetime.now(timezone.utc)
+        (stats,) = await self._summarize(business_id, [(start_date, end_date)])
+        return stats
 
-        # Query 1: Total Income & Expense
-        stmt_totals = (
-            select(Transaction.type, func.sum(Transaction.amount).label("total_amount"))
-            .where(*filters)
-            .group_by(Transaction.type)
+    @read_only
+    async def get_comparison_stats(
+        self,
+        business_id: UUID,
+        current: tuple[datetime, datetime],
+        previous: tuple[datetime, datetime],
+    ) -> tuple[SummaryStats, SummaryStats]:
+        """
+        Summary stats of two periods (each start/end inclusive) computed in a
+        single scan.
+        """
+        current_stats, previous_stats = await self._summarize(
+            business_id, [current, previous]
         )
+        return current_stats, previous_stats
 
-        result_totals = await self.session.execute(stmt_totals)
-        totals = result_totals.all()
+    @read_only
+    async def get_timeseries(
+        self, business_id: UUID, bucket: str, start: date, end: date
+    ) -> list[tuple[date, float, float]]:
+        """
+        Income and expense per local day/week/month bucket between ``start``
+        and ``end`` (inclusive), read from the daily rollups. Buckets without
+        transactions are returned as zeros.
+        """
+        if bucket not in TIMESERIES_BUCKETS:
+            raise ValueError(f"Unsupported bucket: {bucket}")
 
-        total_income = 0.0
-        total_expense = 0.0
+        def truncate(value):
+            return func.date_trunc(bucket, cast(value, DateTime))
 
-        for type_, amount in totals:
-            if type_ == "INCOME":
-                total_income = float(amount or 0)
-            elif type_ == "EXPENSE":
-                total_expense = float(amount or 0)
+        totals = (
+            select(
+                truncate(FinanceDailyRollup.day).label("bucket"),
+                func.sum(FinanceDailyRollup.total_amount)
+                .filter(FinanceDailyRollup.type == "INCOME")
+                .label("income"),
+                func.sum(FinanceDailyRollup.total_amount)
+                .filter(FinanceDailyRollup.type == "EXPENSE")
+                .label("expense"),
+            )
+            .where(
+                FinanceDailyRollup.business_id == business_id,
+                FinanceDailyRollup.day >= start,
+                FinanceDailyRollup.day <= end,
+            )
+            .group_by(text("1"))
+            .subquery()
+        )
+        series = (
+            func.generate_series(
+                truncate(datetime.combine(start, time.min)),
+                truncate(datetime.combine(end, time.min)),
+                literal_column(f"INTERVAL '1 {bucket}'"),
+            )
+            .table_valued("bucket")
+            .render_derived()
+        )
 
-        # Query 2: Breakdown by Category
-        stmt_breakdown = (
+        stmt = (
             select(
-                Transaction.type,
-                Transaction.category_name,
-                func.sum(Transaction.amount).label("total_amount"),
+                cast(series.c.bucket, Date),
+                func.coalesce(totals.c.income, 0),
+                func.coalesce(totals.c.expense, 0),
             )
-            .where(*filters)
-            .group_by(Transaction.type, Transaction.category_name)
+            .select_from(series.outerjoin(totals, totals.c.bucket == series.c.bucket))
+            .order_by(series.c.bucket)
         )
+        result = await self.session.execute(stmt)
+        return [
+            (day, float(income), float(expense))
+            for day, income, expense in result.all()
+        ]
 
-        result_breakdown = await self.session.execute(stmt_breakdown)
-        breakdowns = result_breakdown.all()
+    # --- Daily Rollups ---
 
-        income_categories = {}
-        expense_categories = {}
+    def _rollup_source(self, sign: int = 1):
+        day = local_day(Transaction.transaction_date)
+        return select(
+            Transaction.business_id,
+            day.label("day"),
+            Transaction.type,
+            Transaction.category_name,
+            Transaction.payment_method,
+            (func.sum(Transaction.amount) * sign).label("total_amount"),
+            (func.count() * sign).label("tx_count"),
+        ).group_by(
+            Transaction.business_id,
+            day,
+            Transaction.type,
+            Transaction.category_name,
+            Transaction.payment_method,
+        )
 
-        for type_, cat_name, amount in breakdowns:
-            if type_ == "INCOME":
-                income_categories[cat_name] = float(amount or 0)
-            elif type_ == "EXPENSE":
-                expense_categories[cat_name] = float(amount or 0)
+    async def apply_to_rollups(
+        self, transaction_ids: Sequence[UUID], sign: int
+    ) -> None:
+        """
+        Adds (sign=1) or subtracts (sign=-1) the given transactions to their
+        daily rollup rows and bumps their businesses' finance version. Call
+        after inserting and before deleting them.
+        """
+        if not transaction_ids:
+            return
+        source = self._rollup_source(sign).where(
+            Transaction.id.in_(transaction_ids)  # type: ignore
+        )
+        stmt = insert(FinanceDailyRollup).from_select(
+            [*ROLLUP_KEY, "total_amount", "tx_count"], source
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=list(ROLLUP_KEY),
+            set_={
+                "total_amount": FinanceDailyRollup.total_amount
+                + stmt.excluded.total_amount,
+                "tx_count": FinanceDailyRollup.tx_count + stmt.excluded.tx_count,
+            },
+        )
+        await self.session.execute(stmt)
+
+        if sign < 0:
+            await self.session.execute(
+                delete(FinanceDailyRollup).where(
+                    FinanceDailyRollup.business_id.in_(  # type: ignore
+                        select(Transaction.business_id)
+                        .where(Transaction.id.in_(transaction_ids))  # type: ignore
+                        .distinct()
+                    ),
+                    FinanceDailyRollup.tx_count <= 0,
+                )
+            )
+
+        await self._bump_versions(
+            select(Transaction.business_id)
+            .where(Transaction.id.in_(transaction_ids))  # type: ignore
+            .distinct()
+        )
+
+    async def _bump_versions(self, business_ids) -> None:
+        """Increments the finance version of the businesses selected."""
+        stmt = insert(FinanceVersion).from_select(
+            ["business_id", "version"],
+            select(business_ids.subquery().c.business_id, literal(1)),
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["business_id"],
+            set_={"version": FinanceVersion.version + 1},
+        )
+        await self.session.execute(stmt)
+
+    async def get_version(self, business_id: UUID) -> int:
+        # From the primary: under replica lag a poll right after a write
+        # would see the old version and get a stale 304
+        result = await self.session.execute(
+            select(FinanceVersion.version).where(
+                FinanceVersion.business_id == business_id
+            )
+        )
+        return result.scalar() or 0
 
-        return total_income, total_expense, income_categories, expense_categories
+    async def rollup_horizon(self) -> Optional[date]:
+        """
+        First local day from which every transaction is still attached, or
+        None when all are. With partitioning that is the start of the
+        oldest monthly partition, since older months may have been archived
+        and their totals now live only in the rollups.
+        """
+        if not settings.TRANSACTIONS_PARTITIONED:
+            return None
+        partitions = await list_partitions(await self.session.connection())
+        return min(partitions) if partitions else None
+
+    async def rebuild_rollups(self, business_id: Optional[UUID] = None) -> int:
+        """
+        Recomputes rollups from raw transactions (all businesses, or one),
+        from `rollup_horizon` on; earlier rollups are kept as they are.
+        Locks the rollup table so concurrent writers wait for the rebuild.
+        """
+        await self.session.execute(
+            text("LOCK TABLE finance_daily_rollups IN EXCLUSIVE MODE")
+        )
+        source = self._rollup_source()
+        clear = delete(FinanceDailyRollup)
+        horizon = await self.rollup_horizon()
+        if horizon:
+            start = datetime.combine(
+                horizon, time.min, tzinfo=ZoneInfo(settings.TIMEZONE)
+            )
+            source = source.where(Transaction.transaction_date >= start)
+            clear = clear.where(FinanceDailyRollup.day >= horizon)  # type: ignore
+        if business_id:
+            source = source.where(Transaction.business_id == business_id)
+            clear = clear.where(FinanceDailyRollup.business_id == business_id)
+        await self.session.execute(clear)
+        result = await self.session.execute(
+            insert(FinanceDailyRollup).from_select(
+                [*ROLLUP_KEY, "total_amount", "tx_count"], source
+            )
+        )
+
+        businesses = select(Transaction.business_id).distinct()
+        if business_id:
+            businesses = businesses.where(Transaction.business_id == business_id)
+        await self._bump_versions(businesses)
+        return result.rowcount
+
+    async def rollups_missing(self) -> bool:
+        """True when transactions exist but no rollup has been built yet."""
+        has_rollups = select(FinanceDailyRollup.business_id).limit(1).exists()
+        has_transactions = select(Transaction.id).limit(1).exists()
+        result = await self.session.execute(select(has_transactions & ~has_rollups))
+        return bool(result.scalar())
+
+    async def copy_transactions(self, records: Sequence[tuple]) -> None:
+        """
+        Bulk-loads transactions (tuples in `COPY_COLUMNS` order) with COPY on
+        the session's own connection, so they commit or roll back with the
+        rest of the unit of work.
+        """
+        connection = await self.session.connection()
+        raw = await connection.get_raw_connection()
+        await raw.driver_connection.copy_records_to_table(  # type: ignore
+            Transaction.__tablename__, records=records, columns=COPY_COLUMNS
+        )
+        pin_primary(self.session)
+
+    async def lock_client_ids(self, business_id: UUID) -> None:
+        """
+        Waits for other transactions creating client-id batches for this
+        business, and holds them off until commit, so a concurrently sent
+        retry sees this batch's rows when it checks for duplicates.
+        """
+        key = int.from_bytes(business_id.bytes[:4], "big", signed=True)
+        await self.session.execute(
+            select(func.pg_advisory_xact_lock(CLIENT_IDS_LOCK_CLASS, key))
+        )
+        pin_primary(self.session)
+
+    async def get_existing_ids(
+        self, business_id: UUID, ids: Sequence[UUID]
+    ) -> set[UUID]:
+        """
+        Ids among `ids` the business already has. Raises ValueError if one
+        belongs to another business's transaction.
+        """
+        if not ids:
+            return set()
+        result = await self.session.execute(
+            select(Transaction.id, Transaction.business_id).where(
+                Transaction.id.in_(ids)  # type: ignore
+            )
+        )
+        existing = set()
+        for id_, owner in result.all():
+            if owner != business_id:
+                raise ValueError(f"Transaction ID {id_} is already in use")
+            existing.add(id_)
+        return existing
+
+    async def insert_transactions(self, rows: Sequence[dict]) -> list[UUID]:
+        """
+        Inserts all rows in one statement, skipping any that conflict with an
+        existing key. Returns the ids actually inserted.
+        """
+        if not rows:
+            return []
+        result = await self.session.execute(
+            insert(Transaction)
+            .values(list(rows))
+            .on_conflict_do_nothing()
+            .returning(Transaction.id)
+        )
+        return list(result.scalars().all())
 
     async def get_by_id(self, transaction_id: UUID) -> Transaction | None:
         result = await self.session.get(Transaction, transaction_id)
@@ -114,60 +659,296 @@ class FinanceRepository:
 
     async def delete(self, transaction: Transaction) -> None:
         await self.session.delete(transaction)
-        await self.session.commit()
+        await self.session.flush()
+
+    # --- Forecasts ---
+
+    async def get_active_business_ids(
+        self, since: date, after: Optional[UUID] = None, limit: int = 1000
+    ) -> list[UUID]:
+        """Businesses with rollups since `since`, ordered by id (keyset)."""
+        statement = (
+            select(FinanceDailyRollup.business_id)
+            .where(FinanceDailyRollup.day >= since)
+            .distinct()
+            .order_by(FinanceDailyRollup.business_id)
+            .limit(limit)
+        )
+        if after is not None:
+            statement = statement.where(FinanceDailyRollup.business_id > after)
+        result = await self.session.execute(statement)
+        return list(result.scalars().all())
+
+    async def get_daily_net(
+        self, business_ids: Sequence[UUID], start: date, end: date
+    ) -> list[tuple[UUID, date, float]]:
+        """(business, local day, income - expense) for days with activity."""
+        net = func.sum(
+            case(
+                (FinanceDailyRollup.type == "INCOME", FinanceDailyRollup.total_amount),
+                else_=-FinanceDailyRollup.total_amount,
+            )
+        )
+        statement = (
+            select(FinanceDailyRollup.business_id, FinanceDailyRollup.day, net)
+            .where(
+                FinanceDailyRollup.business_id.in_(business_ids),  # type: ignore
+                FinanceDailyRollup.day >= start,
+                FinanceDailyRollup.day <= end,
+            )
+            .group_by(FinanceDailyRollup.business_id, FinanceDailyRollup.day)
+        )
+        result = await self.session.execute(statement)
+        return [(bid, day, float(value)) for bid, day, value in result.all()]
+
+    async def upsert_forecasts(self, rows: Sequence[dict]) -> None:
+        if not rows:
+            return
+        stmt = insert(FinanceForecast).values(list(rows))
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["business_id"],
+            set_={
+                column: stmt.excluded[column]
+                for column in rows[0]
+                if column != "business_id"
+            },
+        )
+        await self.session.execute(stmt)
+
+    async def get_forecast(self, business_id: UUID) -> FinanceForecast | None:
+        # populate_existing: rows are rewritten by upsert_forecasts, which
+        # bypasses the identity map
+        return await self.session.get(
+            FinanceForecast, business_id, populate_existing=True
+        )
+
+    # --- Recurring Transactions ---
+
+    async def create_recurring(
+        self, recurring: RecurringTransaction
+    ) -> RecurringTransaction:
+        return await save(self.session, recurring)
+
+    async def update_recurring(
+        self, recurring: RecurringTransaction
+    ) -> RecurringTransaction:
+        return await save(self.session, recurring)
+
+    async def get_recurring(self, business_id: UUID) -> Sequence[RecurringTransaction]:
+        result = await self.session.execute(
+            select(RecurringTransaction)
+            .where(RecurringTransaction.business_id == business_id)
+            .order_by(RecurringTransaction.next_run_date, RecurringTransaction.id)  # type: ignore
+        )
+        return result.scalars().all()
+
+    async def get_recurring_by_id(
+        self, recurring_id: UUID
+    ) -> RecurringTransaction | None:
+        # populate_existing: materialize_recurring advances templates with a
+        # bulk UPDATE that bypasses the identity map
+        return await self.session.get(
+            RecurringTransaction, recurring_id, populate_existing=True
+        )
+
+    async def delete_recurring(self, recurring: RecurringTransaction) -> None:
+        await self.session.delete(recurring)
+        await self.session.flush()
+
+    async def materialize_recurring(
+        self,
+        today: date,
+        limit: int = RECURRING_BATCH_SIZE,
+        recurring_ids: Optional[Sequence[UUID]] = None,
+    ) -> list[Row]:
+        """
+        Creates the transactions of up to `limit` due templates (at most
+        `RECURRING_MAX_CATCH_UP` occurrences each) and advances them, all in
+        one statement. Due templates are locked with SKIP LOCKED so
+        concurrent runs never materialize the same occurrence twice.
+        Returns the (id, business_id, earns_points) of the transactions
+        created; only occurrences dated on or after the template's creation
+        day earn points, so backdated templates cannot farm them.
+        """
+        R = RecurringTransaction
+        due_filter = [
+            R.is_active,
+            R.next_run_date <= today,
+            or_(R.end_date.is_(None), R.next_run_date <= R.end_date),  # type: ignore
+        ]
+        if recurring_ids is not None:
+            due_filter.append(R.id.in_(recurring_ids))  # type: ignore
+        due = (
+            select(R)
+            .where(*due_filter)
+            .order_by(R.next_run_date, R.id)  # type: ignore
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+            .cte("due")
+        )
+
+        series = (
+            func.generate_series(
+                due.c.occurrences, due.c.occurrences + RECURRING_MAX_CATCH_UP - 1
+            )
+            .table_valued("n")
+            .render_derived()
+            .lateral()
+        )
+        occurrence_date = _occurrence_date(due.c, series.c.n)
+        occurrences = (
+            select(
+                due.c.id.label("recurring_id"),
+                # Generated here so the result can report per-row facts
+                func.gen_random_uuid().label("id"),
+                due.c.business_id,
+                due.c.amount,
+                due.c.type,
+                due.c.category_id,
+                due.c.category_name,
+                due.c.payment_method,
+                due.c.description,
+                occurrence_date.label("day"),
+                (occurrence_date >= local_day(due.c.created_at)).label(
+                    "earns_points"
+                ),
+            )
+            .select_from(due)
+            .join(series, literal(True))
+            .where(
+                occurrence_date <= today,
+                or_(due.c.end_date.is_(None), occurrence_date <= due.c.end_date),
+            )
+            .cte("occurrence_rows")
+        )
+
+        tz = settings.TIMEZONE
+        inserted = (
+            insert(Transaction)
+            .from_select(
+                [*COPY_COLUMNS],
+                select(
+                    occurrences.c.id,
+                    occurrences.c.business_id,
+                    occurrences.c.amount,
+                    occurrences.c.type,
+                    occurrences.c.category_id,
+                    occurrences.c.category_name,
+                    occurrences.c.payment_method,
+                    occurrences.c.description,
+                    # Local midnight of the occurrence day
+                    func.timezone(tz, cast(occurrences.c.day, DateTime)),
+                    func.now(),
+                ),
+            )
+            .cte("inserted")
+        )
+
+        counts = (
+            select(occurrences.c.recurring_id, func.count().label("created"))
+            .group_by(occurrences.c.recurring_id)
+            .subquery()
+        )
+        advanced = (
+            update(R)
+            .where(R.id == counts.c.recurring_id)
+            .values(
+                occurrences=R.occurrences + counts.c.created,
+                next_run_date=_occurrence_date(
+                    R.__table__.c,  # type: ignore
+                    R.occurrences + counts.c.created,
+                ),
+                last_run_at=func.now(),
+            )
+            .cte("advanced")
+        )
+
+        result = await self.session.execute(
+            select(
+                occurrences.c.id,
+                occurrences.c.business_id,
+                occurrences.c.earns_points,
+            ).add_cte(inserted, advanced)
+        )
+        pin_primary(self.session)
+        return list(result.all())
 
     # --- Category Methods ---
 
+    async def _invalidate_categories(self, business_id: Optional[UUID]) -> None:
+        # Drop now and again after commit (see BusinessRepository), and tell
+        # the other workers once the change commits
+        drop = (
+            partial(category_cache.invalidate, business_id)
+            if business_id
+            else category_cache.clear
+        )
+        drop()
+        on_commit(self.session, drop)
+        await notify(self.session, CATEGORY_CHANNEL, str(business_id or "*"))
+
     async def create_category(
         self, category: TransactionCategory
     ) -> TransactionCategory:
-        self.session.add(category)
-        await self.session.commit()
-        await self.session.refresh(category)
+        await save(self.session, category)
+        await self._invalidate_categories(category.business_id)
         return category
 
     async def get_categories(self, business_id: UUID) -> Sequence[TransactionCategory]:
+        """
+        System defaults plus the business's own categories. Businesses created
+        before the defaults were shared have their own copies; those win over
+        the system row with the same type and name.
+        """
         statement = (
             select(TransactionCategory)
-            .where(TransactionCategory.business_id == business_id)
-            .order_by(TransactionCategory.type, TransactionCategory.name)
+            .where(
+                or_(
+                    TransactionCategory.business_id == business_id,
+                    TransactionCategory.business_id.is_(None),  # type: ignore
+                )
+            )
+            .distinct(TransactionCategory.type, TransactionCategory.name)
+            .order_by(
+                TransactionCategory.type,
+                TransactionCategory.name,
+                TransactionCategory.business_id.asc().nulls_last(),  # type: ignore
+            )
         )
 
         result = await self.session.execute(statement)
         return result.scalars().all()
 
-    async def create_default_categories(self, business_id: UUID) -> None:
-        """Creates default transaction categories for a new business."""
-        default_categories = [
-            # EXPENSE
-            {"name": "Bahan Baku", "type": "EXPENSE", "icon": "🛒"},
-            {"name": "Gaji Karyawan", "type": "EXPENSE", "icon": "👤"},
-            {"name": "Sewa Tempat", "type": "EXPENSE", "icon": "🏠"},
-            {"name": "Listrik & Air", "type": "EXPENSE", "icon": "⛏️"},
-            {"name": "Transportasi", "type": "EXPENSE", "icon": "🚚"},
-            {"name": "Pemasaran", "type": "EXPENSE", "icon": "📢"},
-            {"name": "Lainnya", "type": "EXPENSE", "icon": "♾️"},
-            # INCOME
-            {"name": "Penjualan", "type": "INCOME", "icon": "💲"},
-            {"name": "Investasi", "type": "INCOME", "icon": "📈"},
-            {"name": "Bonus", "type": "INCOME", "icon": "🤑"},
-            {"name": "Lainnya", "type": "INCOME", "icon": "🧲"},
-        ]
-
-        for data in default_categories:
-            category = TransactionCategory(
-                name=data["name"],
-                type=data["type"],
-                icon=data["icon"],
-                business_id=business_id,
+    async def ensure_system_categories(self) -> int:
+        """
+        Inserts any missing shared default categories. Safe to run from
+        several workers at once; returns the number of rows added.
+        """
+        now = datetime.now(timezone.utc)
+        stmt = (
+            insert(TransactionCategory)
+            .values(
+                [
+                    {"id": uuid4(), "business_id": None, "created_at": now, **data}
+                    for data in DEFAULT_CATEGORIES
+                ]
             )
-            self.session.add(category)
-
-        await self.session.commit()
+            .on_conflict_do_nothing(
+                index_elements=["type", "name"],
+                index_where=TransactionCategory.business_id.is_(None),  # type: ignore
+            )
+            .returning(TransactionCategory.id)
+        )
+        result = await self.session.execute(stmt)
+        added = len(result.all())
+        if added:
+            await self._invalidate_categories(None)
+        return added
 
     async def get_category_by_id(self, category_id: UUID) -> TransactionCategory | None:
         return await self.session.get(TransactionCategory, category_id)
 
     async def delete_category(self, category: TransactionCategory) -> None:
         await self.session.delete(category)
-        await self.session.commit()
+        await self.session.flush()
+        await self._invalidate_categories(category.business_id)
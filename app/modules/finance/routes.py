@@ -1,24 +1,47 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import (
+    APIRouter,
+    Depends,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    status,
+)
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import Optional, List
-from datetime import datetime
+from typing import Literal, Optional, List
+from datetime import date, datetime
 from uuid import UUID
 from app.db.session import get_db
-from app.modules.auth.dependencies import get_current_user
-from app.modules.auth.models import User
+from app.modules.auth.dependencies import get_current_business, get_current_business_id
+from app.modules.business.models import BusinessProfile
 from app.modules.business.repository import BusinessRepository
 from app.modules.finance.models import (
     TransactionCreate,
     TransactionRead,
+    TransactionBatchCreate,
+    TransactionBatchResult,
     FinancialSummary,
     TransactionPagination,
+    TransactionCursorPage,
+    CashFlowTimeSeries,
+    CashFlowForecast,
     TransactionCategoryRead,
     TransactionCategoryCreate,
+    TransactionImportResult,
+    RecurringTransactionCreate,
+    RecurringTransactionRead,
+    RecurringTransactionUpdate,
+)
+from app.modules.finance.exporter import EXPORT_MEDIA_TYPES
+from app.modules.finance.importer import (
+    CSV_CONTENT_TYPES,
+    NDJSON_CONTENT_TYPES,
+    iter_csv_rows,
+    iter_ndjson_rows,
 )
 from app.modules.finance.repository import FinanceRepository
 from app.modules.finance.service import FinanceService
-from app.modules.gamification.repository import GamificationRepository
-from app.modules.gamification.service import GamificationService
 
 
 router = APIRouter()
@@ -27,27 +50,109 @@ router = APIRouter()
 def get_service(session: AsyncSession = Depends(get_db)) -> FinanceService:
     repo = FinanceRepository(session)
     business_repo = BusinessRepository(session)
-    gamification_repo = GamificationRepository(session)
-    gamification_service = GamificationService(gamification_repo, business_repo)
-    return FinanceService(repo, business_repo, gamification_service)
+    return FinanceService(repo, business_repo)
 
 
 @router.post("/transactions", response_model=TransactionRead)
 async def create_transaction(
     transaction_in: TransactionCreate,
     service: FinanceService = Depends(get_service),
-    current_user: User = Depends(get_current_user),
-    session: AsyncSession = Depends(get_db),
+    business: BusinessProfile = Depends(get_current_business),
 ):
-    business_repo = BusinessRepository(session)
-    business = await business_repo.get_by_user_id(current_user.id)
-    if not business:
+    return await service.create_transaction(business.id, transaction_in)
+
+
+@router.post(
+    "/transactions/batch",
+    response_model=TransactionBatchResult,
+    status_code=status.HTTP_201_CREATED,
+)
+async def create_transactions_batch(
+    batch_in: TransactionBatchCreate,
+    service: FinanceService = Depends(get_service),
+    business: BusinessProfile = Depends(get_current_business),
+):
+    """
+    Creates many transactions at once (POS sync, offline queues). Send a
+    client-generated `id` per item so a retried batch skips the items that
+    were already stored; they are returned in `duplicates`.
+    `points_pending` are credited shortly after the response.
+    """
+    try:
+        return await service.create_transactions_batch(
+            business.id, batch_in.transactions
+        )
+    except ValueError as e:
         raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Business profile not found",
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
         )
 
-    return await service.create_transaction(business.id, transaction_in)
+
+@router.post(
+    "/transactions/import",
+    response_model=TransactionImportResult,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "text/csv": {"schema": {"type": "string"}},
+                "application/x-ndjson": {"schema": {"type": "string"}},
+            },
+        }
+    },
+)
+async def import_transactions(
+    request: Request,
+    service: FinanceService = Depends(get_service),
+    business: BusinessProfile = Depends(get_current_business),
+):
+    """
+    Imports many transactions from a CSV (with header) or NDJSON body sent
+    as-is, not as a form upload. Columns: `date`, `type`, `amount`,
+    `category` (name) or `category_id`, `payment_method`, `description`.
+    Invalid rows are skipped and reported with their line number.
+    `points_pending` are credited shortly after the response.
+    """
+    content_type = request.headers.get("content-type", "").split(";")[0].strip()
+    if content_type in CSV_CONTENT_TYPES:
+        rows = iter_csv_rows(request.stream())
+    elif content_type in NDJSON_CONTENT_TYPES:
+        rows = iter_ndjson_rows(request.stream())
+    else:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail="Send text/csv or application/x-ndjson",
+        )
+
+    try:
+        return await service.import_transactions(business.id, rows)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+
+
+@router.get("/transactions/export")
+async def export_transactions(
+    format: Literal["csv", "ndjson"] = "csv",
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    service: FinanceService = Depends(get_service),
+    business_id: UUID = Depends(get_current_business_id),
+):
+    """
+    Streams all matching transactions, oldest first, as a CSV or NDJSON
+    download in the same columns the import endpoint accepts.
+    """
+    return StreamingResponse(
+        service.export_transactions(business_id, format, start_date, end_date),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={
+            "Content-Disposition": f'attachment; filename="transactions.{format}"'
+        },
+    )
 
 
 @router.get("/transactions", response_model=TransactionPagination)
@@ -57,53 +162,116 @@ async def get_transactions(
     page: int = 1,
     size: int = 20,
     service: FinanceService = Depends(get_service),
-    current_user: User = Depends(get_current_user),
-    session: AsyncSession = Depends(get_db),
+    business_id: UUID = Depends(get_current_business_id),
 ):
-    business_repo = BusinessRepository(session)
-    business = await business_repo.get_by_user_id(current_user.id)
-    if not business:
+    return await service.get_transactions(business_id, start_date, end_date, page, size)
+
+
+@router.get("/transactions/cursor", response_model=TransactionCursorPage)
+async def get_transactions_by_cursor(
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    cursor: Optional[str] = None,
+    size: int = Query(20, ge=1, le=100),
+    include_total: bool = False,
+    service: FinanceService = Depends(get_service),
+    business_id: UUID = Depends(get_current_business_id),
+):
+    """
+    Newest-first transactions using an opaque cursor. Pass `next_cursor`
+    from the previous response to get the next page; it is null on the last
+    page. The total is only counted when `include_total` is set.
+    """
+    try:
+        return await service.get_transactions_page(
+            business_id, start_date, end_date, cursor, size, include_total
+        )
+    except ValueError as e:
         raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Business profile not found",
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
         )
 
-    return await service.get_transactions(business.id, start_date, end_date, page, size)
-
 
 @router.get("/summary", response_model=FinancialSummary)
 async def get_financial_summary(
+    request: Request,
+    response: Response,
     period: str = "month",
+    compare: bool = False,
     service: FinanceService = Depends(get_service),
-    current_user: User = Depends(get_current_user),
-    session: AsyncSession = Depends(get_db),
+    business_id: UUID = Depends(get_current_business_id),
 ):
-    business_repo = BusinessRepository(session)
-    business = await business_repo.get_by_user_id(current_user.id)
-    if not business:
+    """
+    With `compare=true` the response includes the previous period of the
+    same length, with deltas and growth percentages overall and per category.
+
+    Responses carry an `ETag`; send it back as `If-None-Match` to get an
+    empty `304` while no transaction changed.
+    """
+    try:
+        etag = await service.summary_etag(business_id, period, compare)
+        if etag:
+            headers = {
+                "ETag": etag,
+                "Cache-Control": "private, no-cache",
+                # The same URL answers for whichever account sent the token
+                "Vary": "Authorization",
+            }
+            if_none_match = request.headers.get("if-none-match", "")
+            if etag in (tag.strip() for tag in if_none_match.split(",")):
+                return Response(
+                    status_code=status.HTTP_304_NOT_MODIFIED, headers=headers
+                )
+            response.headers.update(headers)
+        return await service.get_cached_summary(business_id, period, compare, etag)
+    except ValueError as e:
         raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Business profile not found",
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+
+
+@router.get("/timeseries", response_model=CashFlowTimeSeries)
+async def get_cash_flow_timeseries(
+    bucket: Literal["day", "week", "month"] = "day",
+    start: Optional[date] = Query(None, alias="from"),
+    end: Optional[date] = Query(None, alias="to"),
+    service: FinanceService = Depends(get_service),
+    business_id: UUID = Depends(get_current_business_id),
+):
+    """
+    Income, expense and net per day/week/month in the business timezone,
+    with empty buckets filled with zeros. `from`/`to` are inclusive local
+    dates; weeks start on Monday.
+    """
+    try:
+        return await service.get_timeseries(business_id, bucket, start, end)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
         )
 
-    return await service.get_summary(business.id, period)
+
+@router.get("/forecast", response_model=CashFlowForecast)
+async def get_cash_flow_forecast(
+    service: FinanceService = Depends(get_service),
+    business_id: UUID = Depends(get_current_business_id),
+):
+    """
+    Moving averages, smoothed daily net cash flow, trend and a 30-day
+    projection based on the last 90 complete days.
+    """
+    return await service.get_forecast(business_id)
 
 
 @router.delete("/transactions/{transaction_id}")
 async def delete_transaction(
     transaction_id: UUID,
     service: FinanceService = Depends(get_service),
-    current_user: User = Depends(get_current_user),
-    session: AsyncSession = Depends(get_db),
+    business: BusinessProfile = Depends(get_current_business),
 ):
-    business_repo = BusinessRepository(session)
-    business = await business_repo.get_by_user_id(current_user.id)
-    if not business:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Business profile not found",
-        )
-
     transaction = await service.repo.get_by_id(transaction_id)
     if not transaction:
         raise HTTPException(
@@ -117,44 +285,89 @@ async def delete_transaction(
             detail="Not authorized to delete this transaction",
         )
 
-    await service.repo.delete(transaction)
+    await service.delete_transaction(transaction)
     return {"message": "Transaction deleted successfully"}
 
 
-# --- Category Routes ---
+# --- Recurring Transaction Routes ---
 
-@router.get("/categories", response_model=List[TransactionCategoryRead])
-async def get_categories(
+@router.get("/recurring", response_model=List[RecurringTransactionRead])
+async def get_recurring_transactions(
     service: FinanceService = Depends(get_service),
-    current_user: User = Depends(get_current_user),
-    session: AsyncSession = Depends(get_db),
+    business_id: UUID = Depends(get_current_business_id),
 ):
-    business_repo = BusinessRepository(session)
-    business = await business_repo.get_by_user_id(current_user.id)
-    if not business:
+    return await service.get_recurring(business_id)
+
+
+@router.post("/recurring", response_model=RecurringTransactionRead)
+async def create_recurring_transaction(
+    recurring_in: RecurringTransactionCreate,
+    service: FinanceService = Depends(get_service),
+    business: BusinessProfile = Depends(get_current_business),
+):
+    """
+    Creates a template that records the same transaction every `every`
+    days/weeks/months/years from `start_date` (default today) until
+    `end_date`. Occurrences up to today are recorded right away.
+    """
+    try:
+        return await service.create_recurring(business.id, recurring_in)
+    except ValueError as e:
         raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Business profile not found",
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+
+
+@router.patch("/recurring/{recurring_id}", response_model=RecurringTransactionRead)
+async def update_recurring_transaction(
+    recurring_id: UUID,
+    recurring_in: RecurringTransactionUpdate,
+    service: FinanceService = Depends(get_service),
+    business: BusinessProfile = Depends(get_current_business),
+):
+    """Set `is_active` to false to pause; resuming skips missed dates."""
+    try:
+        return await service.update_recurring(business.id, recurring_id, recurring_in)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+
+
+@router.delete("/recurring/{recurring_id}")
+async def delete_recurring_transaction(
+    recurring_id: UUID,
+    service: FinanceService = Depends(get_service),
+    business: BusinessProfile = Depends(get_current_business),
+):
+    try:
+        await service.delete_recurring(business.id, recurring_id)
+        return {"message": "Recurring transaction deleted successfully"}
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
         )
 
-    return await service.get_categories(business.id)
+
+# --- Category Routes ---
+
+@router.get("/categories", response_model=List[TransactionCategoryRead])
+async def get_categories(
+    service: FinanceService = Depends(get_service),
+    business_id: UUID = Depends(get_current_business_id),
+):
+    return await service.get_categories(business_id)
 
 
 @router.post("/categories", response_model=TransactionCategoryRead)
 async def create_category(
     category_in: TransactionCategoryCreate,
     service: FinanceService = Depends(get_service),
-    current_user: User = Depends(get_current_user),
-    session: AsyncSession = Depends(get_db),
+    business: BusinessProfile = Depends(get_current_business),
 ):
-    business_repo = BusinessRepository(session)
-    business = await business_repo.get_by_user_id(current_user.id)
-    if not business:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Business profile not found",
-        )
-
     return await service.create_category(business.id, category_in)
 
 
@@ -162,17 +375,8 @@ async def create_category(
 async def delete_category(
     category_id: UUID,
     service: FinanceService = Depends(get_service),
-    current_user: User = Depends(get_current_user),
-    session: AsyncSession = Depends(get_db),
+    business: BusinessProfile = Depends(get_current_business),
 ):
-    business_repo = BusinessRepository(session)
-    business = await business_repo.get_by_user_id(current_user.id)
-    if not business:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Business profile not found",
-        )
-
     try:
         await service.delete_category(business.id, category_id)
         return {"message": "Category deleted successfully"}
@@ -1,21 +1,110 @@
-from uuid import UUID
-from typing import Optional, Sequence
-from datetime import datetime, timedelta
+from collections import Counter
+from uuid import UUID, uuid4
+from typing import AsyncIterator, Optional
+from datetime import date, datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
 from dateutil.relativedelta import relativedelta
+from app.core.config import settings
+from app.core.utils import decode_cursor, encode_cursor
+from app.db.outbox import publish_many
+from app.db.routing import pin_primary
 from app.modules.business.repository import BusinessRepository
-from app.modules.finance.repository import FinanceRepository
+from app.modules.finance.cache import CategorySet, category_cache, summary_cache
+from app.modules.finance.forecast import history_window, refresh_batch
+from app.modules.finance.exporter import csv_chunks, ndjson_chunks
+from app.modules.finance.importer import RawRow, field, parse_amount, parse_date
+from app.modules.finance.repository import FinanceRepository, SummaryStats
 from app.modules.finance.models import (
     Transaction,
     TransactionCreate,
     TransactionRead,
+    TransactionBatchItem,
+    TransactionBatchResult,
     FinancialSummary,
     TransactionPagination,
+    TransactionCursorPage,
+    CashFlowTimeSeries,
+    CashFlowForecast,
     CategoryBreakdown,
+    CategoryComparison,
+    SummaryComparison,
+    PaymentMethodBreakdown,
     TransactionCategory,
     TransactionCategoryCreate,
+    TransactionCategoryRead,
+    TransactionImportError,
+    TransactionImportResult,
+    RecurringTransaction,
+    RecurringTransactionCreate,
+    RecurringTransactionRead,
+    RecurringTransactionUpdate,
 )
-from app.modules.gamification.service import GamificationService
 import math
+import time
+
+# Default window per bucket when the caller gives no start date
+TIMESERIES_DEFAULT_SPAN = {
+    "day": relativedelta(days=29),
+    "week": relativedelta(weeks=11),
+    "month": relativedelta(months=11),
+}
+TIMESERIES_MAX_DAYS = 5 * 366
+
+# Length of each summary period ("all" is unbounded)
+SUMMARY_PERIODS = {
+    "day": relativedelta(days=1),
+    "week": relativedelta(days=7),
+    "month": relativedelta(months=1),
+    "year": relativedelta(years=1),
+}
+
+# Simple logic: 5 points per transaction for being diligent ("Telaten")
+POINTS_PER_TRANSACTION = 5
+
+# Outbox event for new transactions: {business_id, count, points}
+TRANSACTION_CREATED = "transaction_created"
+
+# Step of a recurring template per frequency; must match the SQL in
+# FinanceRepository.materialize_recurring (both clamp month ends)
+RECURRING_STEPS = {
+    "daily": "days",
+    "weekly": "weeks",
+    "monthly": "months",
+    "yearly": "years",
+}
+
+# How far back a new recurring template may start; its past occurrences
+# are recorded by the creating request
+RECURRING_MAX_BACKDATE_DAYS = 31
+
+BATCH_MAX_TRANSACTIONS = 500
+
+IMPORT_CHUNK_SIZE = 1000
+IMPORT_MAX_ROWS = 50_000
+IMPORT_MAX_REPORTED_ERRORS = 100
+
+
+def occurrence_date(recurring: RecurringTransaction, n: int) -> date:
+    """Date of occurrence `n` (0-based) of a recurring template."""
+    step = relativedelta(**{RECURRING_STEPS[recurring.frequency]: recurring.every * n})
+    return recurring.start_date + step
+
+
+def first_occurrence_from(recurring: RecurringTransaction, day: date) -> int:
+    """Index of the first occurrence on or after `day`, in closed form."""
+    start = recurring.start_date
+    if recurring.frequency in ("daily", "weekly"):
+        elapsed = (day - start).days
+        period = 7 if recurring.frequency == "weekly" else 1
+    else:
+        elapsed = (day.year - start.year) * 12 + day.month - start.month
+        period = 12 if recurring.frequency == "yearly" else 1
+    # First occurrence whose day (or month) is not before `day`'s
+    n = max(0, -(-elapsed // (period * recurring.every)))
+    # In `day`'s month, the occurrence may still fall before `day`
+    if occurrence_date(recurring, n) < day:
+        n += 1
+    return n
 
 
 class FinanceService:
@@ -23,16 +112,15 @@ class FinanceService:
         self,
         repo: FinanceRepository,
         business_repo: BusinessRepository,
-        gamification_service: Optional[GamificationService] = None,
     ):
         self.repo = repo
         self.business_repo = business_repo
-        self.gamification_service = gamification_service
 
     async def create_transaction(
         self, business_id: UUID, transaction_in: TransactionCreate
     ) -> Transaction:
-        cat = await self.repo.get_category_by_id(transaction_in.category_id)
+        categories = await self.get_category_set(business_id)
+        cat = categories.by_id.get(transaction_in.category_id)
         if not cat:
             raise ValueError(f"Category with ID {transaction_in.category_id} not found")
         final_category_name = cat.name
@@ -42,30 +130,199 @@ class FinanceService:
         if data.get("transaction_date") is None:
             del data["transaction_date"]
 
-        data["category"] = final_category_name
         data["category_name"] = final_category_name
 
-        # Ensure atomic transaction
-        async with self.repo.session.begin_nested():
-            transaction = Transaction(**data, business_id=business_id)
-            transaction = await self.repo.create(transaction)
+        transaction = Transaction(**data, business_id=business_id)
+        transaction = await self.repo.create(transaction)
+        await self.repo.apply_to_rollups([transaction.id], 1)
 
-            if self.gamification_service:
-                # Simple logic: 5 points per transaction for being diligent ("Telaten")
-                points_to_award = 5
-                new_total = await self.business_repo.add_points(
-                    business_id, points_to_award
-                )
+        await self._publish_created({business_id: 1})
+
+        return transaction
+
+    async def create_transactions_batch(
+        self, business_id: UUID, items: list[TransactionBatchItem]
+    ) -> TransactionBatchResult:
+        """
+        Creates up to `BATCH_MAX_TRANSACTIONS` transactions with one insert,
+        one rollup update and one outbox event. Items whose `id` already
+        exists (e.g. a retried request) are skipped and listed as duplicates.
+        Raises ValueError if any item is invalid; nothing is created then.
+        """
+        if not items:
+            raise ValueError("At least one transaction is required")
+        if len(items) > BATCH_MAX_TRANSACTIONS:
+            raise ValueError(
+                f"Batches are limited to {BATCH_MAX_TRANSACTIONS} transactions"
+            )
+
+        categories = await self.get_category_set(business_id)
+        unknown = {i.category_id for i in items} - categories.by_id.keys()
+        if unknown:
+            raise ValueError(
+                f"Category with ID {', '.join(map(str, unknown))} not found"
+            )
+
+        now = datetime.now(timezone.utc)
+        rows: dict[UUID, dict] = {}
+        for item in items:
+            id_ = item.id or uuid4()
+            if id_ in rows:
+                continue
+            rows[id_] = {
+                **item.model_dump(exclude={"id"}),
+                "id": id_,
+                "business_id": business_id,
+                "category_name": categories.by_id[item.category_id].name,
+                "transaction_date": item.transaction_date or now,
+                "created_at": now,
+            }
+
+        # Checked up front as well as by ON CONFLICT: with a partitioned table
+        # the key includes transaction_date, so a retry whose date defaulted
+        # to "now" would not conflict. The lock makes check and insert atomic
+        # against a retry sent concurrently.
+        client_ids = [i.id for i in items if i.id is not None]
+        if client_ids:
+            await self.repo.lock_client_ids(business_id)
+        existing = await self.repo.get_existing_ids(business_id, client_ids)
+        inserted = await self.repo.insert_transactions(
+            [row for id_, row in rows.items() if id_ not in existing]
+        )
+        await self.repo.apply_to_rollups(inserted, 1)
+
+        # Skipped by ON CONFLICT without being ours: another business's id
+        taken = rows.keys() - set(inserted) - existing
+        if taken:
+            raise ValueError(f"Transaction ID {next(iter(taken))} is already in use")
+
+        result = TransactionBatchResult(
+            created=[TransactionRead.model_validate(rows[id_]) for id_ in inserted],
+            duplicates=[id_ for id_ in rows if id_ in existing],
+        )
+        await self._publish_created({business_id: len(inserted)})
+        result.points_pending = POINTS_PER_TRANSACTION * len(inserted)
+        return result
+
+    async def _publish_created(self, counts: dict[UUID, int]) -> None:
+        """
+        Records one `transaction_created` event per business for its new
+        transactions; points and gamification are handled by the outbox
+        dispatcher.
+        """
+        await publish_many(
+            self.repo.session,
+            TRANSACTION_CREATED,
+            [
+                {
+                    "business_id": str(business_id),
+                    "count": count,
+                    "points": POINTS_PER_TRANSACTION * count,
+                }
+                for business_id, count in counts.items()
+                if count > 0
+            ],
+        )
 
-                business = await self.business_repo.get_by_id(business_id)
-                if business:
-                    await self.gamification_service.process_gamification(
-                        business.id, business.user_id, new_total
+    async def import_transactions(
+        self, business_id: UUID, rows: AsyncIterator[RawRow]
+    ) -> TransactionImportResult:
+        """
+        Bulk import from a parsed upload. Valid rows are loaded with COPY in
+        chunks of `IMPORT_CHUNK_SIZE`; invalid rows are reported and skipped.
+        Raises ValueError when the upload exceeds `IMPORT_MAX_ROWS`.
+        """
+        categories = (await self.get_category_set(business_id)).categories
+        by_id = {str(c.id): c for c in categories}
+        by_name = {(c.type, c.name.casefold()): c for c in categories}
+
+        result = TransactionImportResult()
+        chunk: list[tuple] = []
+
+        async def flush_chunk() -> None:
+            await self.repo.copy_transactions(chunk)
+            await self.repo.apply_to_rollups([record[0] for record in chunk], 1)
+            result.imported += len(chunk)
+            chunk.clear()
+
+        async for raw in rows:
+            if result.imported + len(chunk) + result.failed >= IMPORT_MAX_ROWS:
+                raise ValueError(f"Uploads are limited to {IMPORT_MAX_ROWS} rows")
+            try:
+                if raw.error:
+                    raise ValueError(raw.error)
+                chunk.append(
+                    self._import_record(business_id, raw.data or {}, by_id, by_name)
+                )
+            except ValueError as e:
+                result.failed += 1
+                if len(result.errors) < IMPORT_MAX_REPORTED_ERRORS:
+                    result.errors.append(
+                        TransactionImportError(row=raw.row, error=str(e))
                     )
+                continue
+            if len(chunk) >= IMPORT_CHUNK_SIZE:
+                await flush_chunk()
+        if chunk:
+            await flush_chunk()
 
-        await self.repo.session.commit()
-        await self.repo.session.refresh(transaction)
-        return transaction
+        await self._publish_created({business_id: result.imported})
+        result.points_pending = POINTS_PER_TRANSACTION * result.imported
+        return result
+
+    @staticmethod
+    def _import_record(
+        business_id: UUID,
+        data: dict,
+        by_id: dict[str, TransactionCategoryRead],
+        by_name: dict[tuple[str, str], TransactionCategoryRead],
+    ) -> tuple:
+        type_ = (field(data, "type") or "").upper()
+        if type_ not in ("INCOME", "EXPENSE"):
+            raise ValueError("Type must be INCOME or EXPENSE")
+
+        category_id = field(data, "category_id")
+        category_name = field(data, "category", "category_name")
+        if category_id:
+            category = by_id.get(category_id)
+        elif category_name:
+            category = by_name.get((type_, category_name.casefold()))
+        else:
+            raise ValueError("Missing category")
+        if not category or category.type != type_:
+            raise ValueError(
+                f"Unknown {type_.lower()} category: {category_id or category_name}"
+            )
+
+        return (
+            uuid4(),
+            business_id,
+            parse_amount(field(data, "amount")),
+            type_,
+            category.id,
+            category.name,
+            (field(data, "payment_method") or "CASH").upper(),
+            field(data, "description"),
+            parse_date(field(data, "transaction_date", "date")),
+            datetime.now(timezone.utc),
+        )
+
+    async def delete_transaction(self, transaction: Transaction) -> None:
+        await self.repo.apply_to_rollups([transaction.id], -1)
+        await self.repo.delete(transaction)
+
+    def export_transactions(
+        self,
+        business_id: UUID,
+        format: str = "csv",
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> AsyncIterator[str]:
+        """Text chunks of the export, produced while the response is sent."""
+        batches = self.repo.stream_for_export(business_id, start_date, end_date)
+        if format == "ndjson":
+            return ndjson_chunks(batches)
+        return csv_chunks(batches)
 
     async def get_transactions(
         self,
@@ -90,28 +347,79 @@ class FinanceService:
             pages=pages,
         )
 
+    async def get_transactions_page(
+        self,
+        business_id: UUID,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        cursor: Optional[str] = None,
+        size: int = 20,
+        include_total: bool = False,
+    ) -> TransactionCursorPage:
+        after = None
+        if cursor:
+            try:
+                date_str, id_str = decode_cursor(cursor)
+                after = (datetime.fromisoformat(date_str), UUID(id_str))
+            except ValueError:
+                raise ValueError("Invalid cursor")
+
+        # Fetch one extra row to know whether another page exists
+        items = await self.repo.get_page_after(
+            business_id, start_date, end_date, after, size + 1
+        )
+        next_cursor = None
+        if len(items) > size:
+            items = items[:size]
+            last = items[-1]
+            next_cursor = encode_cursor(last.transaction_date.isoformat(), last.id)
+
+        total = None
+        if include_total:
+            total = await self.repo.count_by_business_id(
+                business_id, start_date, end_date
+            )
+
+        return TransactionCursorPage(
+            items=[TransactionRead.model_validate(t) for t in items],
+            next_cursor=next_cursor,
+            size=size,
+            total=total,
+        )
+
     async def get_summary(
         self,
         business_id: UUID,
         period: str = "month",  # "day", "week", "month", "year", "all"
+        compare: bool = False,
     ) -> FinancialSummary:
-        now = datetime.now()
-        start_date = None
+        """
+        Totals and breakdowns for the last `period`. With `compare`, the
+        previous period of the same length and the changes against it are
+        computed in the same query.
+        """
+        now = datetime.now(timezone.utc)
+        length = SUMMARY_PERIODS.get(period)
+        start_date = now - length if length else None
         end_date = now
 
-        if period == "day":
-            start_date = now - timedelta(days=1)
-        elif period == "week":
-            start_date = now - timedelta(days=7)
-        elif period == "month":
-            start_date = now - relativedelta(months=1)
-        elif period == "year":
-            start_date = now - relativedelta(years=1)
-
-        total_income, total_expense, income_categories, expense_categories = (
-            await self.repo.get_summary_stats(business_id, start_date, end_date)
-        )
+        comparison = None
+        if compare:
+            if start_date is None or length is None:
+                raise ValueError("Comparison needs a bounded period")
+            previous_start = start_date - length
+            previous_end = start_date - timedelta(microseconds=1)
+            stats, previous = await self.repo.get_comparison_stats(
+                business_id,
+                (start_date, end_date),
+                (previous_start, previous_end),
+            )
+            comparison = self._compare(stats, previous, previous_start, previous_end)
+        else:
+            stats = await self.repo.get_summary_stats(business_id, start_date, end_date)
 
+        total_income = stats.totals["INCOME"]
+        total_expense = stats.totals["EXPENSE"]
         net_profit = total_income - total_expense
 
         # Helper to create breakdown list
@@ -127,16 +435,285 @@ class FinanceService:
                 for cat, amt in categories.items()
             ]
 
+        def percentage(amount: float, total: float) -> float:
+            return round((amount / total) * 100, 2) if total else 0.0
+
+        payment_method_breakdown = [
+            PaymentMethodBreakdown(
+                payment_method=method,
+                income=amounts["INCOME"],
+                expense=amounts["EXPENSE"],
+                percentage_of_income=percentage(amounts["INCOME"], total_income),
+                percentage_of_expense=percentage(amounts["EXPENSE"], total_expense),
+            )
+            for method, amounts in stats.payment_methods.items()
+        ]
+
         return FinancialSummary(
             total_income=total_income,
             total_expense=total_expense,
             net_profit=net_profit,
             period_start=start_date,
             period_end=end_date,
-            income_breakdown=create_breakdown(income_categories, total_income),
-            expense_breakdown=create_breakdown(expense_categories, total_expense),
+            income_breakdown=create_breakdown(stats.categories["INCOME"], total_income),
+            expense_breakdown=create_breakdown(
+                stats.categories["EXPENSE"], total_expense
+            ),
+            payment_method_breakdown=payment_method_breakdown,
+            comparison=comparison,
         )
 
+    async def summary_etag(
+        self, business_id: UUID, period: str, compare: bool = False
+    ) -> Optional[str]:
+        """
+        ETag of the summary as it would be returned now: the business and
+        its finance version plus the current cache window, so rolling
+        periods still move on when nothing is written. Tags of different
+        businesses never match, since versions start at 0 for all of them.
+        None when caching is off.
+        """
+        ttl = settings.SUMMARY_CACHE_TTL_SECONDS
+        if ttl <= 0:
+            return None
+        version = await self.repo.get_version(business_id)
+        window = int(time.time() // ttl)
+        return f'W/"{business_id.hex}.{version}.{window}.{period}.{int(compare)}"'
+
+    async def get_cached_summary(
+        self, business_id: UUID, period: str, compare: bool, etag: Optional[str]
+    ) -> FinancialSummary:
+        """`get_summary`, served from the cache while `etag` is unchanged."""
+        key = (business_id, period, compare)
+        cached = summary_cache.get(key)
+        if etag and cached and cached[0] == etag:
+            return cached[1]
+
+        if etag:
+            # The tag's version came from the primary; a lagging replica
+            # could store older totals under it until the window ends
+            pin_primary(self.repo.session)
+        summary = await self.get_summary(business_id, period, compare)
+        if etag:
+            summary_cache.set(key, (etag, summary))
+        return summary
+
+    @staticmethod
+    def _compare(
+        current: SummaryStats,
+        previous: SummaryStats,
+        previous_start: datetime,
+        previous_end: datetime,
+    ) -> SummaryComparison:
+        def growth(now: float, before: float) -> Optional[float]:
+            return round((now - before) / abs(before) * 100, 2) if before else None
+
+        categories = []
+        for type_ in ("INCOME", "EXPENSE"):
+            now_by_cat = current.categories[type_]
+            before_by_cat = previous.categories[type_]
+            for name in sorted(now_by_cat.keys() | before_by_cat.keys()):
+                now = now_by_cat.get(name, 0.0)
+                before = before_by_cat.get(name, 0.0)
+                categories.append(
+                    CategoryComparison(
+                        category=name,
+                        type=type_,
+                        current=now,
+                        previous=before,
+                        change=round(now - before, 2),
+                        growth=growth(now, before),
+                    )
+                )
+
+        income, expense = current.totals["INCOME"], current.totals["EXPENSE"]
+        prev_income, prev_expense = (
+            previous.totals["INCOME"],
+            previous.totals["EXPENSE"],
+        )
+        net, prev_net = income - expense, prev_income - prev_expense
+        return SummaryComparison(
+            period_start=previous_start,
+            period_end=previous_end,
+            total_income=prev_income,
+            total_expense=prev_expense,
+            net_profit=prev_net,
+            income_change=round(income - prev_income, 2),
+            expense_change=round(expense - prev_expense, 2),
+            net_profit_change=round(net - prev_net, 2),
+            income_growth=growth(income, prev_income),
+            expense_growth=growth(expense, prev_expense),
+            net_profit_growth=growth(net, prev_net),
+            categories=categories,
+        )
+
+    async def get_timeseries(
+        self,
+        business_id: UUID,
+        bucket: str = "day",
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+    ) -> CashFlowTimeSeries:
+        if bucket not in TIMESERIES_DEFAULT_SPAN:
+            raise ValueError(f"Unsupported bucket: {bucket}")
+        end = end or datetime.now(ZoneInfo(settings.TIMEZONE)).date()
+        start = start or end - TIMESERIES_DEFAULT_SPAN[bucket]
+        if start > end:
+            raise ValueError("'from' must not be after 'to'")
+        if (end - start).days > TIMESERIES_MAX_DAYS:
+            raise ValueError("Date range is too long")
+
+        rows = await self.repo.get_timeseries(business_id, bucket, start, end)
+        return CashFlowTimeSeries(
+            bucket=bucket,
+            buckets=[day for day, _, _ in rows],
+            income=[income for _, income, _ in rows],
+            expense=[expense for _, _, expense in rows],
+            net=[round(income - expense, 2) for _, income, expense in rows],
+        )
+
+    async def get_forecast(self, business_id: UUID) -> CashFlowForecast:
+        """
+        The cached forecast, recomputed for this business alone when it is
+        missing or a new day has closed since it was computed.
+        """
+        forecast = await self.repo.get_forecast(business_id)
+        _, last_day = history_window()
+        if forecast is None or forecast.as_of < last_day:
+            await refresh_batch(self.repo, [business_id])
+            forecast = await self.repo.get_forecast(business_id)
+        return CashFlowForecast.model_validate(forecast)
+
+    # --- Recurring Transactions ---
+
+    async def create_recurring(
+        self, business_id: UUID, recurring_in: RecurringTransactionCreate
+    ) -> RecurringTransaction:
+        """
+        Stores a template and materializes its occurrences up to today, so a
+        template starting today (the default) records its first transaction
+        immediately. `start_date` may be at most `RECURRING_MAX_BACKDATE_DAYS`
+        in the past; backdated occurrences earn no points.
+        """
+        type_ = recurring_in.type.upper()
+        category = (await self.get_category_set(business_id)).by_id.get(
+            recurring_in.category_id
+        )
+        if not category:
+            raise ValueError(f"Category with ID {recurring_in.category_id} not found")
+        if category.type != type_:
+            raise ValueError(f"Category '{category.name}' is not a {type_} category")
+        if recurring_in.frequency not in RECURRING_STEPS:
+            raise ValueError(f"Frequency must be one of: {', '.join(RECURRING_STEPS)}")
+        if recurring_in.every < 1:
+            raise ValueError("'every' must be at least 1")
+        if recurring_in.amount <= 0:
+            raise ValueError("Amount must be positive")
+
+        today = datetime.now(ZoneInfo(settings.TIMEZONE)).date()
+        start = recurring_in.start_date or today
+        if start < today - timedelta(days=RECURRING_MAX_BACKDATE_DAYS):
+            raise ValueError(
+                f"start_date can be at most {RECURRING_MAX_BACKDATE_DAYS} days "
+                "in the past"
+            )
+        if recurring_in.end_date and recurring_in.end_date < start:
+            raise ValueError("end_date must not be before start_date")
+
+        recurring = RecurringTransaction(
+            **recurring_in.model_dump(exclude={"type", "start_date", "payment_method"}),
+            type=type_,
+            payment_method=recurring_in.payment_method.upper(),
+            start_date=start,
+            next_run_date=start,
+            business_id=business_id,
+            category_name=category.name,
+        )
+        await self.repo.create_recurring(recurring)
+        if start <= today:
+            await self.materialize_recurring(today, [recurring.id])
+        return await self.repo.get_recurring_by_id(recurring.id)  # type: ignore
+
+    async def get_recurring(self, business_id: UUID) -> list[RecurringTransactionRead]:
+        return [
+            RecurringTransactionRead.model_validate(r)
+            for r in await self.repo.get_recurring(business_id)
+        ]
+
+    async def _get_own_recurring(
+        self, business_id: UUID, recurring_id: UUID
+    ) -> RecurringTransaction:
+        recurring = await self.repo.get_recurring_by_id(recurring_id)
+        if not recurring:
+            raise ValueError("Recurring transaction not found")
+        if recurring.business_id != business_id:
+            raise ValueError("Not authorized to modify this recurring transaction")
+        return recurring
+
+    async def update_recurring(
+        self,
+        business_id: UUID,
+        recurring_id: UUID,
+        recurring_in: RecurringTransactionUpdate,
+    ) -> RecurringTransaction:
+        """
+        Updates amount, payment method, description, end date or the active
+        flag. Reactivating a paused template skips the occurrences it missed
+        while paused.
+        """
+        recurring = await self._get_own_recurring(business_id, recurring_id)
+        data = recurring_in.model_dump(exclude_unset=True)
+        if data.get("amount") is not None and data["amount"] <= 0:
+            raise ValueError("Amount must be positive")
+        if data.get("end_date") and data["end_date"] < recurring.start_date:
+            raise ValueError("end_date must not be before start_date")
+        if data.get("payment_method"):
+            data["payment_method"] = data["payment_method"].upper()
+
+        resuming = data.get("is_active") is True and not recurring.is_active
+        for key, value in data.items():
+            setattr(recurring, key, value)
+
+        if resuming:
+            today = datetime.now(ZoneInfo(settings.TIMEZONE)).date()
+            if recurring.next_run_date < today:
+                recurring.occurrences = first_occurrence_from(recurring, today)
+                recurring.next_run_date = occurrence_date(
+                    recurring, recurring.occurrences
+                )
+        return await self.repo.update_recurring(recurring)
+
+    async def delete_recurring(self, business_id: UUID, recurring_id: UUID) -> None:
+        """Deletes the template; transactions it already created are kept."""
+        recurring = await self._get_own_recurring(business_id, recurring_id)
+        await self.repo.delete_recurring(recurring)
+
+    async def materialize_recurring(
+        self,
+        today: Optional[date] = None,
+        recurring_ids: Optional[list[UUID]] = None,
+    ) -> int:
+        """
+        Creates every due occurrence of all templates (or `recurring_ids`)
+        with one INSERT ... SELECT per batch of templates, then updates
+        rollups once per batch and records one `transaction_created` event
+        per business for the occurrences that earn points. Returns the number
+        of transactions created.
+        """
+        today = today or datetime.now(ZoneInfo(settings.TIMEZONE)).date()
+        created = 0
+        while True:
+            rows = await self.repo.materialize_recurring(
+                today, recurring_ids=recurring_ids
+            )
+            if not rows:
+                return created
+            await self.repo.apply_to_rollups([row.id for row in rows], 1)
+            await self._publish_created(
+                Counter(row.business_id for row in rows if row.earns_points)
+            )
+            created += len(rows)
+
     # --- Category Management ---
 
     async def create_category(
@@ -147,8 +724,24 @@ class FinanceService:
         )
         return await self.repo.create_category(category)
 
-    async def get_categories(self, business_id: UUID) -> Sequence[TransactionCategory]:
-        return await self.repo.get_categories(business_id)
+    async def get_category_set(self, business_id: UUID) -> CategorySet:
+        """The business's categories, from the process-local cache if possible."""
+        cached = category_cache.get(business_id)
+        if cached is not None:
+            return cached
+
+        version = category_cache.version(business_id)
+        categories = CategorySet(
+            [
+                TransactionCategoryRead.model_validate(c)
+                for c in await self.repo.get_categories(business_id)
+            ]
+        )
+        category_cache.set(business_id, categories, version)
+        return categories
+
+    async def get_categories(self, business_id: UUID) -> list[TransactionCategoryRead]:
+        return (await self.get_category_set(business_id)).categories
 
     async def delete_category(self, business_id: UUID, category_id: UUID) -> None:
         category = await self.repo.get_category_by_id(category_id)
@@ -0,0 +1,35 @@
+from collections import defaultdict
+from typing import Any
+from uuid import UUID
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.logging import logger
+from app.modules.business.repository import BusinessRepository
+from app.modules.gamification.repository import GamificationRepository
+from app.modules.gamification.service import GamificationService
+
+
+async def award_points(session: AsyncSession, payloads: list[dict[str, Any]]) -> None:
+    """
+    Outbox handler for events carrying `business_id` and `points`: credits
+    each business once per batch, then runs level and achievement checks.
+    """
+    totals: dict[UUID, int] = defaultdict(int)
+    for payload in payloads:
+        totals[UUID(payload["business_id"])] += payload.get("points", 0)
+
+    business_repo = BusinessRepository(session)
+    service = GamificationService(GamificationRepository(session), business_repo)
+    for business_id, points in totals.items():
+        if points <= 0:
+            continue
+        new_total = await business_repo.add_points(business_id, points)
+        business = await business_repo.get_by_id(business_id)
+        if not business:
+            continue
+        unlocked = await service.process_gamification(
+            business.id, business.user_id, new_total
+        )
+        if unlocked:
+            logger.info(
+                "Achievements unlocked", business_id=str(business_id), titles=unlocked
+            )
@@ -2,6 +2,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select, func
 from uuid import UUID
 from typing import Sequence
+from app.db.persistence import save
 from app.modules.gamification.models import Achievement, UserAchievement
 
 
@@ -36,16 +37,25 @@ class GamificationRepository:
         result = await self.session.execute(stmt)
         return result.scalar_one()
 
+    async def count_achievements_by_user(
+        self, user_ids: Sequence[UUID]
+    ) -> dict[UUID, int]:
+        if not user_ids:
+            return {}
+        stmt = (
+            select(UserAchievement.user_id, func.count())
+            .where(UserAchievement.user_id.in_(user_ids))  # type: ignore
+            .group_by(UserAchievement.user_id)
+        )
+        result = await self.session.execute(stmt)
+        return {user_id: count for user_id, count in result.all()}
+
     async def unlock_achievement(self, user_id: UUID, achievement_id: UUID):
         ua = UserAchievement(user_id=user_id, achievement_id=achievement_id)
-        self.session.add(ua)
-        await self.session.commit()
+        await save(self.session, ua)
 
     async def create_achievement(self, achievement: Achievement) -> Achievement:
-        self.session.add(achievement)
-        await self.session.commit()
-        await self.session.refresh(achievement)
-        return achievement
+        return await save(self.session, achievement)
 
     async def get_achievement(self, achievement_id: UUID) -> Achievement | None:
         stmt = select(Achievement).where(Achievement.id == achievement_id)
@@ -53,11 +63,8 @@ class GamificationRepository:
         return result.scalars().first()
 
     async def update_achievement(self, achievement: Achievement) -> Achievement:
-        self.session.add(achievement)
-        await self.session.commit()
-        await self.session.refresh(achievement)
-        return achievement
+        return await save(self.session, achievement)
 
     async def delete_achievement(self, achievement: Achievement) -> None:
         await self.session.delete(achievement)
-        await self.session.commit()
+        await self.session.flush()
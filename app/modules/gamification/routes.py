@@ -2,8 +2,8 @@ from fastapi import APIRouter, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
 from app.db.session import get_db
-from app.modules.auth.dependencies import get_current_user
-from app.modules.auth.models import User
+from app.modules.auth.dependencies import get_principal_claims
+from app.modules.auth.models import PrincipalClaims
 from app.modules.gamification.models import AchievementRead, LeaderboardEntry
 from app.modules.gamification.repository import GamificationRepository
 from app.modules.gamification.dependencies import get_gamification_repo
@@ -23,12 +23,12 @@ def get_gamification_service(
 
 @router.get("/achievements", response_model=List[AchievementRead])
 async def get_achievements_user(
-    current_user: User = Depends(get_current_user),
+    claims: PrincipalClaims = Depends(get_principal_claims),
     repo: GamificationRepository = Depends(get_gamification_repo),
 ):
     """List all available achievements with unlock status for the current user."""
     all_achievements = await repo.get_all_achievements()
-    user_achievements = await repo.get_user_achievements(current_user.id)
+    user_achievements = await repo.get_user_achievements(claims.user_id)
 
     # Create map for easy lookup
     unlocked_map = {ua.achievement_id: ua for ua in user_achievements}
@@ -54,7 +54,7 @@ async def get_achievements_user(
 async def get_leaderboard(
     limit: int = 10,
     service: GamificationService = Depends(get_gamification_service),
-    current_user: User = Depends(get_current_user),
+    claims: PrincipalClaims = Depends(get_principal_claims),
 ):
     """Get the top business leaderboard based on total points."""
-    return await service.get_leaderboard(limit, current_user)
+    return await service.get_leaderboard(limit, claims)
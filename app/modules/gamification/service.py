@@ -3,7 +3,7 @@ from typing import List, Optional
 from app.modules.gamification.repository import GamificationRepository
 from app.modules.gamification.models import LeaderboardEntry
 from app.modules.business.repository import BusinessRepository
-from app.modules.auth.models import User
+from app.modules.auth.models import PrincipalClaims
 
 
 class GamificationService:
@@ -50,21 +50,24 @@ class GamificationService:
         return newly_unlocked
 
     async def get_leaderboard(
-        self, limit: int = 10, current_user: Optional[User] = None
+        self, limit: int = 10, claims: Optional[PrincipalClaims] = None
     ) -> List[LeaderboardEntry]:
         """
         Retrieves the leaderboard of top businesses.
         """
+        current_user_id = claims.user_id if claims else None
         top_businesses = await self.business_repo.get_top_businesses(limit)
 
+        achievement_counts = await self.repo.count_achievements_by_user(
+            [business.user_id for business, _, _ in top_businesses]
+        )
+
         leaderboard = []
         for rank, (business, user, level) in enumerate(top_businesses, start=1):
             # Fetch level name
             level_name = level.name if level else None
 
-            achievements_count = await self.repo.count_user_achievements(
-                business.user_id
-            )
+            achievements_count = achievement_counts.get(business.user_id, 0)
 
             leaderboard.append(
                 LeaderboardEntry(
@@ -76,41 +79,46 @@ class GamificationService:
                     achievements_count=achievements_count,
                     user_id=user.id,
                     user_name=user.name or "Unknown",
-                    is_current_user=(current_user is not None and user.id == current_user.id),
+                    is_current_user=(user.id == current_user_id),
                 )
             )
 
-        if current_user:
+        if claims and claims.business_id:
             # Check if current user is already in leaderboard
-            if not any(entry.user_id == current_user.id for entry in leaderboard):
-                business = await self.business_repo.get_by_user_id(current_user.id)
-                if business and not business.deleted_at:
-                    rank = await self.business_repo.calculate_rank(
-                        business.total_points or 0
-                    )
-
-                    level_name = None
-                    if business.level_id:
-                        level = await self.business_repo.get_level(business.level_id)
-                        if level:
-                            level_name = level.name
-
-                    achievements_count = await self.repo.count_user_achievements(
-                        current_user.id
-                    )
-
-                    leaderboard.append(
-                        LeaderboardEntry(
-                            rank=rank,
-                            business_id=business.id,
-                            business_name=business.business_name,
-                            total_points=business.total_points or 0,
-                            level_name=level_name,
-                            achievements_count=achievements_count,
-                            user_id=current_user.id,
-                            user_name=current_user.name or "Unknown",
-                            is_current_user=True,
-                        )
-                    )
+            if not any(entry.user_id == claims.user_id for entry in leaderboard):
+                entry = await self._current_user_entry(claims)
+                if entry:
+                    leaderboard.append(entry)
 
         return leaderboard
+
+    async def _current_user_entry(
+        self, claims: PrincipalClaims
+    ) -> Optional[LeaderboardEntry]:
+        if claims.principal:
+            user = claims.principal.user
+            business = claims.principal.business
+            level = claims.principal.level
+        else:
+            row = await self.business_repo.get_with_owner(claims.business_id)  # type: ignore[arg-type]
+            if not row:
+                return None
+            business, user, level = row
+
+        if not business or business.deleted_at:
+            return None
+
+        rank = await self.business_repo.calculate_rank(business.total_points or 0)
+        achievements_count = await self.repo.count_user_achievements(user.id)
+
+        return LeaderboardEntry(
+            rank=rank,
+            business_id=business.id,
+            business_name=business.business_name,
+            total_points=business.total_points or 0,
+            level_name=level.name if level else None,
+            achievements_count=achievements_count,
+            user_id=user.id,
+            user_name=user.name or "Unknown",
+            is_current_user=True,
+        )
@@ -2,7 +2,7 @@ from sqlmodel import SQLModel, Field, Relationship
 from uuid import UUID, uuid4
 from datetime import datetime, timezone
 from typing import Optional, List
-from sqlalchemy import Column, DateTime
+from sqlalchemy import Column, DateTime, Index
 from app.modules.business.models import BusinessProfile
 
 
@@ -85,6 +85,16 @@ class Milestone(MilestoneBase, table=True):
         return self.deleted_at is not None
 
 
+# Milestone lists per business, filtered by status and sorted by order
+Index(
+    "ix_milestones_business_id_status_order_live",
+    Milestone.business_id,
+    Milestone.status,
+    Milestone.order,
+    postgresql_where=Milestone.deleted_at.is_(None),  # type: ignore
+)
+
+
 class MilestoneCreate(MilestoneBase):
     tasks: List[MilestoneTaskBase] = []
 
@@ -5,6 +5,7 @@ from uuid import UUID
 from typing import List, Sequence
 from app.modules.milestone.models import Milestone, MilestoneTask
 from datetime import datetime, timezone
+from app.db.persistence import save, save_all
 
 
 class MilestoneRepository:
@@ -12,17 +13,12 @@ class MilestoneRepository:
         self.session = session
 
     async def create_bulk(self, milestones: List[Milestone]) -> Sequence[Milestone]:
-        self.session.add_all(milestones)
-        await self.session.commit()
-        for m in milestones:
-            await self.session.refresh(m)
-        return milestones
+        # Milestones and their cascaded tasks go out as one batched INSERT
+        # per table; the in-memory objects already hold every column.
+        return await save_all(self.session, milestones)
 
     async def add_task(self, task: MilestoneTask) -> MilestoneTask:
-        self.session.add(task)
-        await self.session.commit()
-        await self.session.refresh(task)
-        return task
+        return await save(self.session, task)
 
     async def get_by_business_id(
         self,
@@ -71,18 +67,11 @@ class MilestoneRepository:
         return result.scalars().first()
 
     async def update(self, milestone: Milestone) -> Milestone:
-        self.session.add(milestone)
-        await self.session.commit()
-        await self.session.refresh(milestone)
-        return milestone
+        return await save(self.session, milestone)
 
     async def update_task(self, task: MilestoneTask) -> MilestoneTask:
-        self.session.add(task)
-        await self.session.commit()
-        await self.session.refresh(task)
-        return task
+        return await save(self.session, task)
 
     async def delete(self, milestone: Milestone) -> None:
         milestone.deleted_at = datetime.now(timezone.utc)
-        self.session.add(milestone)
-        await self.session.commit()
+        await save(self.session, milestone)
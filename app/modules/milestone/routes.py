@@ -3,8 +3,8 @@ from typing import List
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.db.session import get_db
-from app.modules.auth.dependencies import get_current_user
-from app.modules.auth.models import User
+from app.modules.auth.dependencies import get_current_business
+from app.modules.business.models import BusinessProfile
 from app.modules.milestone.models import (
     Milestone,
     MilestoneCreate,
@@ -17,8 +17,6 @@ from app.modules.milestone.models import (
 from app.modules.milestone.repository import MilestoneRepository
 from app.modules.milestone.service import MilestoneService
 from app.modules.business.repository import BusinessRepository
-from app.modules.gamification.repository import GamificationRepository
-from app.modules.gamification.service import GamificationService
 from app.modules.chat.repository import ChatRepository
 
 router = APIRouter()
@@ -27,27 +25,17 @@ router = APIRouter()
 def get_service(session: AsyncSession = Depends(get_db)) -> MilestoneService:
     repo = MilestoneRepository(session)
     business_repo = BusinessRepository(session)
-    gamification_repo = GamificationRepository(session)
     chat_repo = ChatRepository(session)
-    gamification_service = GamificationService(gamification_repo, business_repo)
-    return MilestoneService(repo, business_repo, gamification_service, chat_repo)
+    return MilestoneService(repo, business_repo, chat_repo)
 
 
 @router.get("/", response_model=List[MilestoneListRead])
 async def get_milestones(
     service: MilestoneService = Depends(get_service),
-    current_user: User = Depends(get_current_user),
-    session: AsyncSession = Depends(get_db),
+    business: BusinessProfile = Depends(get_current_business),
     page: int = 1,
     size: int = 100,
 ):
-    business_repo = BusinessRepository(session)
-    business = await business_repo.get_by_user_id(current_user.id)
-    if not business:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Business profile not found",
-        )
     return await service.get_business_milestones(
         business.id, page=page, size=size
     )
@@ -57,17 +45,8 @@ async def get_milestones(
 async def create_milestones(
     milestones_in: List[MilestoneCreate],
     service: MilestoneService = Depends(get_service),
-    current_user: User = Depends(get_current_user),
-    session: AsyncSession = Depends(get_db),
+    business: BusinessProfile = Depends(get_current_business),
 ):
-    business_repo = BusinessRepository(session)
-    business = await business_repo.get_by_user_id(current_user.id)
-    if not business:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Business profile not found",
-        )
-
     milestones = []
     for m_in in milestones_in:
         milestone_data = m_in.model_dump(exclude={"tasks"})
@@ -88,18 +67,8 @@ async def create_milestones(
 async def get_milestone(
     milestone_id: UUID,
     service: MilestoneService = Depends(get_service),
-    current_user: User = Depends(get_current_user),
-    session: AsyncSession = Depends(get_db),
+    business: BusinessProfile = Depends(get_current_business),
 ):
-    # Ownership check
-    business_repo = BusinessRepository(session)
-    business = await business_repo.get_by_user_id(current_user.id)
-    if not business:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Business profile not found",
-        )
-
     milestone = await service.get_milestone(milestone_id)
     if not milestone:
         raise HTTPException(
@@ -121,18 +90,8 @@ async def update_milestone(
     milestone_id: UUID,
     milestone_in: MilestoneUpdate,
     service: MilestoneService = Depends(get_service),
-    current_user: User = Depends(get_current_user),
-    session: AsyncSession = Depends(get_db),
+    business: BusinessProfile = Depends(get_current_business),
 ):
-    # Ownership check
-    business_repo = BusinessRepository(session)
-    business = await business_repo.get_by_user_id(current_user.id)
-    if not business:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Business profile not found",
-        )
-
     milestone = await service.get_milestone(milestone_id)
     if not milestone:
         raise HTTPException(
@@ -157,18 +116,8 @@ async def update_milestone(
 async def start_milestone(
     milestone_id: UUID,
     service: MilestoneService = Depends(get_service),
-    current_user: User = Depends(get_current_user),
-    session: AsyncSession = Depends(get_db),
+    business: BusinessProfile = Depends(get_current_business),
 ):
-    # Ownership check
-    business_repo = BusinessRepository(session)
-    business = await business_repo.get_by_user_id(current_user.id)
-    if not business:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Business profile not found",
-        )
-
     # Verify existence and ownership
     milestone = await service.get_milestone(milestone_id)
     if not milestone:
@@ -192,20 +141,9 @@ async def start_milestone(
 async def complete_task(
     task_id: UUID,
     service: MilestoneService = Depends(get_service),
-    current_user: User = Depends(get_current_user),
-    session: AsyncSession = Depends(get_db),
+    business: BusinessProfile = Depends(get_current_business),
 ):
-
-    business_repo = BusinessRepository(session)
-    business = await business_repo.get_by_user_id(current_user.id)
-    if not business:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Business profile not found",
-        )
-
-    milestone_repo = MilestoneRepository(session)
-    task = await milestone_repo.get_task_by_id(task_id)
+    task = await service.repo.get_task_by_id(task_id)
 
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
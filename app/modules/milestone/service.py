@@ -8,37 +8,27 @@ from app.modules.agent.workflow import auto_generate_workflow
 from app.modules.milestone.repository import MilestoneRepository
 from app.modules.milestone.models import Milestone, MilestoneTask
 from app.modules.business.repository import BusinessRepository
-from app.modules.gamification.service import GamificationService
 from app.modules.chat.repository import ChatRepository
-from app.db.session import AsyncSessionLocal
+from app.db.outbox import publish
+from app.db.session import on_commit, unit_of_work
 from app.core.logging import logger
 
+# Outbox events: {business_id, task_id | milestone_id, points}
+TASK_COMPLETED = "task_completed"
+MILESTONE_COMPLETED = "milestone_completed"
+
 
 class MilestoneService:
     def __init__(
         self,
         repo: MilestoneRepository,
         business_repo: BusinessRepository,
-        gamification_service: Optional[GamificationService] = None,
         chat_repo: Optional[ChatRepository] = None,
     ):
         self.repo = repo
         self.business_repo = business_repo
-        self.gamification_service = gamification_service
         self.chat_repo = chat_repo
 
-    async def _award_points(self, business_id: UUID, points: int) -> None:
-        if points > 0:
-            new_total = await self.business_repo.add_points(business_id, points)
-
-            # Check for achievements if gamification service is available
-            if self.gamification_service and new_total > 0:
-                business = await self.business_repo.get_by_id(business_id)
-                if business:
-                    await self.gamification_service.process_gamification(
-                        business.id, business.user_id, new_total
-                    )
-
     async def get_business_milestones(
         self, business_id: UUID, page: int = 1, size: int = 100
     ) -> Sequence[Milestone]:
@@ -80,8 +70,17 @@ class MilestoneService:
             if task.milestone_id:
                 milestone = await self.repo.get_by_id(task.milestone_id)
                 if milestone:
-                    # Award points for Task Completion
-                    await self._award_points(milestone.business_id, task.reward_points)
+                    # Points for Task Completion are awarded by the outbox
+                    # dispatcher once this commits
+                    await publish(
+                        self.repo.session,
+                        TASK_COMPLETED,
+                        {
+                            "business_id": str(milestone.business_id),
+                            "task_id": str(task.id),
+                            "points": task.reward_points,
+                        },
+                    )
 
                     # Auto-check milestone completion
                     if milestone.tasks:
@@ -91,16 +90,26 @@ class MilestoneService:
                             milestone.completed_at = datetime.now(timezone.utc)
                             await self.repo.update(milestone)
 
-                            # Award Bonus Points for Milestone Completion
-                            await self._award_points(
-                                milestone.business_id, milestone.reward_points
+                            # Bonus Points for Milestone Completion
+                            await publish(
+                                self.repo.session,
+                                MILESTONE_COMPLETED,
+                                {
+                                    "business_id": str(milestone.business_id),
+                                    "milestone_id": str(milestone.id),
+                                    "points": milestone.reward_points,
+                                },
                             )
 
                             # Run background check for milestone generation
-                            asyncio.create_task(
-                                self._check_and_trigger_generation(
-                                    milestone.business_id, milestone
-                                )
+                            # once the completion is committed and visible
+                            on_commit(
+                                self.repo.session,
+                                lambda: asyncio.create_task(
+                                    self._check_and_trigger_generation(
+                                        milestone.business_id, milestone
+                                    )
+                                ),
                             )
 
         return task
@@ -115,7 +124,7 @@ class MilestoneService:
         """
         try:
             logger.debug("triggering background milestone generation check")
-            async with AsyncSessionLocal() as session:
+            async with unit_of_work() as session:
                 # Re-initialize repos with fresh session
                 repo = MilestoneRepository(session)
                 business_repo = BusinessRepository(session)
@@ -0,0 +1,26 @@
+from fastapi import APIRouter, Depends
+from app.core.security import password_hasher
+from app.db.instrumentation import route_query_stats
+from app.db.pool import pool_stats
+from app.db.session import engine, replica_engine
+from app.modules.auth.cache import principal_cache
+from app.modules.auth.dependencies import require_admin
+from app.modules.finance.cache import category_cache, summary_cache
+
+router = APIRouter(dependencies=[Depends(require_admin)])
+
+
+@router.get("/metrics")
+async def get_metrics():
+    """In-process runtime metrics for this worker (Admin only)."""
+    metrics = {
+        "db_pool": pool_stats(engine),
+        "db_queries": route_query_stats.stats(),
+        "principal_cache": principal_cache.stats(),
+        "category_cache": category_cache.stats(),
+        "summary_cache": summary_cache.stats(),
+        "password_hasher": password_hasher.stats(),
+    }
+    if replica_engine is not None:
+        metrics["db_replica_pool"] = pool_stats(replica_engine)
+    return metrics
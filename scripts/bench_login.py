@@ -0,0 +1,109 @@
+"""
+Login throughput benchmark.
+
+Measures latency of a cheap endpoint on its own, then again while a number of
+clients hammer POST /auth/login. With bcrypt running on the event loop the
+probe p99 jumps to hundreds of milliseconds; with the hashing pool it should
+stay close to the baseline.
+
+Usage (against a running server with a seeded user):
+    python scripts/bench_login.py --email demo@telaten.com --password demo123
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+import httpx
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def report(label: str, samples: list[float]) -> None:
+    if not samples:
+        print(f"{label:<22} no samples")
+        return
+    ms = [s * 1000 for s in samples]
+    print(
+        f"{label:<22} n={len(ms):<6} "
+        f"p50={statistics.median(ms):7.1f}ms "
+        f"p95={percentile(ms, 95):7.1f}ms "
+        f"p99={percentile(ms, 99):7.1f}ms "
+        f"max={max(ms):7.1f}ms"
+    )
+
+
+async def probe(
+    client: httpx.AsyncClient, path: str, deadline: float, interval: float
+) -> list[float]:
+    samples = []
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        await client.get(path)
+        samples.append(time.perf_counter() - start)
+        await asyncio.sleep(interval)
+    return samples
+
+
+async def login_loop(
+    client: httpx.AsyncClient, payload: dict, deadline: float, stats: dict
+) -> None:
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        response = await client.post("/api/v1/auth/login", json=payload)
+        elapsed = time.perf_counter() - start
+        if response.status_code == 200:
+            stats["ok"].append(elapsed)
+        elif response.status_code == 503:
+            stats["rejected"] += 1
+        else:
+            stats["failed"] += 1
+
+
+async def main(args: argparse.Namespace) -> None:
+    limits = httpx.Limits(max_connections=args.concurrency + 8)
+    async with httpx.AsyncClient(
+        base_url=args.base_url, limits=limits, timeout=30
+    ) as client:
+        print(f"Baseline: probing {args.probe_path} for {args.duration}s")
+        deadline = time.perf_counter() + args.duration
+        baseline = await probe(client, args.probe_path, deadline, args.interval)
+
+        print(f"Load: {args.concurrency} concurrent login clients for {args.duration}s")
+        payload = {"email": args.email, "password": args.password}
+        stats: dict = {"ok": [], "rejected": 0, "failed": 0}
+        deadline = time.perf_counter() + args.duration
+        logins = [
+            login_loop(client, payload, deadline, stats)
+            for _ in range(args.concurrency)
+        ]
+        under_load, *_ = await asyncio.gather(
+            probe(client, args.probe_path, deadline, args.interval), *logins
+        )
+
+    print()
+    report("probe (baseline)", baseline)
+    report("probe (under logins)", under_load)
+    report("login", stats["ok"])
+    print(
+        f"login throughput: {len(stats['ok']) / args.duration:.1f}/s "
+        f"(503 backpressure: {stats['rejected']}, errors: {stats['failed']})"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--email", required=True)
+    parser.add_argument("--password", required=True)
+    parser.add_argument("--probe-path", default="/api/v1/business/levels")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--interval", type=float, default=0.01)
+    asyncio.run(main(parser.parse_args()))